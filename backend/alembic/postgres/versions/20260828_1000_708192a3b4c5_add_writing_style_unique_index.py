@@ -0,0 +1,79 @@
+"""add unique index on writing_styles (user_id, name)
+
+Deduplicates existing per-user styles before creating the index, so imports
+can rely on ON CONFLICT DO NOTHING instead of a separate existence query.
+For each duplicated (user_id, name) the most recently updated row wins
+(id as tie-breaker), and all style_id references from project_default_styles /
+batch_generation_tasks / regeneration_tasks are re-pointed to the surviving
+row first so no project default or task record is lost or left dangling.
+Global presets (user_id IS NULL) are untouched: NULL values are distinct
+under the unique index.
+
+Revision ID: 708192a3b4c5
+Revises: 5e6f708192a3
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "708192a3b4c5"
+down_revision: Union[str, None] = "5e6f708192a3"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# 引用 writing_styles.id 的表（project_default_styles 带 CASCADE 外键，
+# 两个任务表是普通整型列，都需要先改指保留行再删重复行）
+_REFERENCING_TABLES = (
+    "project_default_styles",
+    "batch_generation_tasks",
+    "regeneration_tasks",
+)
+
+# 同名风格中保留"最近更新优先，其次id最大"的那一行
+_SURVIVOR_ORDER = "(k.updated_at IS NULL), k.updated_at DESC, k.id DESC"
+
+_DUPLICATED_IDS = (
+    "SELECT w.id FROM writing_styles w "
+    "WHERE w.user_id IS NOT NULL AND EXISTS ("
+    "SELECT 1 FROM writing_styles b "
+    "WHERE b.user_id = w.user_id AND b.name = w.name AND b.id <> w.id)"
+)
+
+
+def upgrade() -> None:
+    # 1. 引用重定位：凡指向重名风格的style_id统一改指保留行
+    #    （指向保留行本身的引用会被原值覆盖，等价于不变）
+    for table in _REFERENCING_TABLES:
+        op.execute(sa.text(
+            f"UPDATE {table} SET style_id = ("
+            "SELECT k.id FROM writing_styles k, writing_styles dup "
+            f"WHERE dup.id = {table}.style_id "
+            "AND k.user_id = dup.user_id AND k.name = dup.name "
+            f"ORDER BY {_SURVIVOR_ORDER} LIMIT 1) "
+            f"WHERE style_id IN ({_DUPLICATED_IDS})"
+        ))
+
+    # 2. 删除非保留的重复行（每组(user_id, name)只留下保留行）
+    op.execute(sa.text(
+        "DELETE FROM writing_styles "
+        "WHERE user_id IS NOT NULL AND id NOT IN ("
+        "SELECT ("
+        "SELECT k.id FROM writing_styles k "
+        "WHERE k.user_id = g.user_id AND k.name = g.name "
+        f"ORDER BY {_SURVIVOR_ORDER} LIMIT 1) "
+        "FROM (SELECT DISTINCT user_id, name FROM writing_styles "
+        "WHERE user_id IS NOT NULL) AS g)"
+    ))
+
+    op.create_index(
+        "idx_writing_styles_user_name",
+        "writing_styles",
+        ["user_id", "name"],
+        unique=True,
+    )
+
+
+def downgrade() -> None:
+    # 仅移除索引；升级时合并掉的重复行及其引用重定位不可恢复
+    op.drop_index("idx_writing_styles_user_name", table_name="writing_styles")
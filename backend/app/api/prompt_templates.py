@@ -240,7 +240,8 @@ async def create_or_update_template(
     
     await db.commit()
     await db.refresh(template)
-    
+    PromptService.invalidate_template_cache(user_id, data.template_key)
+
     return template
 
 
@@ -277,8 +278,9 @@ async def update_template(
     
     await db.commit()
     await db.refresh(template)
+    PromptService.invalidate_template_cache(user_id, template_key)
     logger.info(f"用户 {user_id} 更新模板 {template_key}")
-    
+
     return template
 
 
@@ -309,8 +311,9 @@ async def delete_template(
     
     await db.delete(template)
     await db.commit()
+    PromptService.invalidate_template_cache(user_id, template_key)
     logger.info(f"用户 {user_id} 删除模板 {template_key}")
-    
+
     return {"message": "模板已删除", "template_key": template_key}
 
 
@@ -345,6 +348,7 @@ async def reset_to_default(
     if template:
         await db.delete(template)
         await db.commit()
+        PromptService.invalidate_template_cache(user_id, template_key)
         logger.info(f"用户 {user_id} 删除自定义模板 {template_key}，恢复为系统默认")
         return {"message": "已重置为系统默认", "template_key": template_key}
     else:
@@ -571,9 +575,11 @@ async def import_templates(
                 )
                 db.add(new_template)
             created_or_updated += 1
-    
+
     await db.commit()
-    
+    # 批量导入可能覆盖任意键，整体失效该用户的模板缓存
+    PromptService.invalidate_template_cache(user_id)
+
     statistics = {
         "total": len(data.templates),
         "kept_system_default": kept_system_default,
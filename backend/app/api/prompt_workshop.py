@@ -388,10 +388,26 @@ async def import_item(
         select(func.count(WritingStyle.id)).where(WritingStyle.user_id == user_id)
     )
     max_order = count_result.scalar_one()
-    
+
+    # 同名自动加后缀：(user_id, name) 上有唯一索引，重复导入同一提示词不应失败
+    base_name = data.custom_name or item_data["name"]
+    style_name = base_name
+    suffix = 2
+    while True:
+        dup_result = await db.execute(
+            select(WritingStyle.id).where(
+                WritingStyle.user_id == user_id,
+                WritingStyle.name == style_name
+            )
+        )
+        if dup_result.scalar_one_or_none() is None:
+            break
+        style_name = f"{base_name} ({suffix})"
+        suffix += 1
+
     new_style = WritingStyle(
         user_id=user_id,
-        name=data.custom_name or item_data["name"],
+        name=style_name,
         style_type="custom",
         description=f"从提示词工坊导入: {item_data.get('description', '') or ''}",
         prompt_content=item_data["prompt_content"],
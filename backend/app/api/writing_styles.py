@@ -2,6 +2,7 @@
 from fastapi import APIRouter, Depends, HTTPException, Request
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, func, delete
+from sqlalchemy.exc import IntegrityError
 from typing import List
 
 from ..database import get_db
@@ -107,6 +108,20 @@ async def create_writing_style(
             detail="name 和 prompt_content 是必填字段"
         )
     
+    # 同名检查：(user_id, name) 上有唯一索引，提前拦截避免落库时报 IntegrityError
+    # （例如基于同一预设重复创建且未改名时，name 默认为预设名）
+    dup_result = await db.execute(
+        select(WritingStyle.id).where(
+            WritingStyle.user_id == user_id,
+            WritingStyle.name == style_data.name
+        )
+    )
+    if dup_result.scalar_one_or_none() is not None:
+        raise HTTPException(
+            status_code=409,
+            detail=f"已存在同名风格 '{style_data.name}'，请更换名称"
+        )
+
     # 获取当前用户的最大 order_index
     count_result = await db.execute(
         select(func.count(WritingStyle.id))
@@ -126,7 +141,15 @@ async def create_writing_style(
     )
     
     db.add(new_style)
-    await db.commit()
+    try:
+        await db.commit()
+    except IntegrityError:
+        # 并发创建同名风格时两边都会通过预检查，由唯一索引兜底
+        await db.rollback()
+        raise HTTPException(
+            status_code=409,
+            detail=f"已存在同名风格 '{style_data.name}'，请更换名称"
+        )
     await db.refresh(new_style)
     
     # 返回包含 is_default 字段的字典（新创建的风格默认不是默认风格）
@@ -344,15 +367,39 @@ async def update_writing_style(
     
     # 更新字段
     update_data = style_data.model_dump(exclude_unset=True)
-    
+
+    # 同名检查：改名同样受 (user_id, name) 唯一索引约束
+    if "name" in update_data and update_data["name"] != style.name:
+        dup_result = await db.execute(
+            select(WritingStyle.id).where(
+                WritingStyle.user_id == user_id,
+                WritingStyle.name == update_data["name"]
+            )
+        )
+        if dup_result.scalar_one_or_none() is not None:
+            raise HTTPException(
+                status_code=409,
+                detail=f"已存在同名风格 '{update_data['name']}'，请更换名称"
+            )
+
     # 如果修改了内容，将 style_type 改为 custom
     if any(key in update_data for key in ["name", "description", "prompt_content"]):
         update_data["style_type"] = "custom"
-    
+
+    # 回滚后ORM属性会过期，冲突名称提前留存供错误信息使用
+    conflict_name = update_data.get("name", style.name)
     for key, value in update_data.items():
         setattr(style, key, value)
-    
-    await db.commit()
+
+    try:
+        await db.commit()
+    except IntegrityError:
+        # 并发改名到同一名称时两边都会通过预检查，由唯一索引兜底
+        await db.rollback()
+        raise HTTPException(
+            status_code=409,
+            detail=f"已存在同名风格 '{conflict_name}'，请更换名称"
+        )
     await db.refresh(style)
     
     # 检查是否有项目将其设置为默认风格（一个风格可能被多个项目使用，使用 first() 避免 MultipleResultsFound）
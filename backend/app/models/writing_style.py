@@ -1,5 +1,5 @@
 """写作风格数据模型"""
-from sqlalchemy import Column, String, Text, Boolean, DateTime, ForeignKey, Integer
+from sqlalchemy import Column, String, Text, Boolean, DateTime, ForeignKey, Index, Integer
 from sqlalchemy.sql import func
 from app.database import Base
 
@@ -7,7 +7,12 @@ from app.database import Base
 class WritingStyle(Base):
     """写作风格表"""
     __tablename__ = "writing_styles"
-    
+
+    __table_args__ = (
+        # 同一用户下风格名唯一（user_id为NULL的全局预设不受约束）
+        Index('idx_writing_styles_user_name', 'user_id', 'name', unique=True),
+    )
+
     id = Column(Integer, primary_key=True, autoincrement=True)
     user_id = Column(String(255), ForeignKey("users.user_id", ondelete="CASCADE"), nullable=True, comment="所属用户ID（NULL表示全局预设风格）")
     name = Column(String(100), nullable=False, comment="风格名称")
@@ -68,6 +68,9 @@ CAREER_SYSTEM_OPTIONAL_GENRE_KEYWORDS = (
     "校园", "娱乐", "生活", "商战",
 )
 
+# 反向大纲批次并发上限（批次间互不依赖，可同时在途的AI调用数）
+_REVERSE_OUTLINE_MAX_CONCURRENCY = 4
+
 
 def _format_genre_text(genre: Any) -> str:
     if genre is None:
@@ -1376,28 +1379,21 @@ class BookImportService:
                 template = await PromptService.get_template("BOOK_IMPORT_REVERSE_OUTLINES", user_id, db)
 
                 batch_size = 5
-                total_batches = (len(chapters) + batch_size - 1) // batch_size
-                all_structures: list[dict[str, Any]] = []
+                batches = [
+                    chapters[start: start + batch_size]
+                    for start in range(0, len(chapters), batch_size)
+                ]
+                batches = [batch for batch in batches if batch]
+                total_batches = len(batches)
 
-                for batch_idx, start in enumerate(range(0, len(chapters), batch_size), start=1):
-                    batch = chapters[start: start + batch_size]
-                    if not batch:
-                        continue
+                # 各批次互不依赖，可并发调用AI；信号量限流避免触发供应商限速
+                semaphore = asyncio.Semaphore(_REVERSE_OUTLINE_MAX_CONCURRENCY)
+                completed = 0
 
+                async def _generate_batch(batch: list[BookImportChapter]) -> list[dict[str, Any]]:
+                    nonlocal completed
                     start_chapter = batch[0].chapter_number
                     end_chapter = batch[-1].chapter_number
-                    chapters_text = self._build_reverse_outline_chapters_text(batch)
-                    expected_count = len(batch)
-
-                    if task:
-                        progress = 95 + int(3 * (batch_idx - 1) / max(1, total_batches))
-                        self._set_task_state(
-                            task,
-                            status="running",
-                            progress=progress,
-                            message=f"正在生成大纲批次 {batch_idx}/{total_batches}（第{start_chapter}-{end_chapter}章）...",
-                        )
-
                     prompt = PromptService.format_prompt(
                         template,
                         title=suggestion.title or "拆书导入项目",
@@ -1406,17 +1402,41 @@ class BookImportService:
                         narrative_perspective=suggestion.narrative_perspective or "第三人称",
                         start_chapter=start_chapter,
                         end_chapter=end_chapter,
-                        expected_count=expected_count,
-                        chapters_text=chapters_text,
+                        expected_count=len(batch),
+                        chapters_text=self._build_reverse_outline_chapters_text(batch),
                     )
 
-                    ai_data = await ai_service.call_with_json_retry(
-                        prompt=prompt,
-                        max_retries=3,
-                        expected_type="array",
-                    )
-                    normalized_batch = self._normalize_reverse_outline_batch(ai_data, batch)
-                    all_structures.extend(normalized_batch)
+                    async with semaphore:
+                        ai_data = await ai_service.call_with_json_retry(
+                            prompt=prompt,
+                            max_retries=3,
+                            expected_type="array",
+                        )
+
+                    completed += 1
+                    if task:
+                        progress = 95 + int(3 * completed / max(1, total_batches))
+                        self._set_task_state(
+                            task,
+                            status="running",
+                            progress=progress,
+                            message=f"大纲批次完成 {completed}/{total_batches}（第{start_chapter}-{end_chapter}章）",
+                        )
+                    return self._normalize_reverse_outline_batch(ai_data, batch)
+
+                # TaskGroup在首个批次失败时取消其余兄弟任务：不让后台批次
+                # 继续白烧AI调用，也不会在走入回退路径后再覆盖任务进度
+                async with asyncio.TaskGroup() as task_group:
+                    batch_tasks = [
+                        task_group.create_task(_generate_batch(batch))
+                        for batch in batches
+                    ]
+                # 任务按提交顺序展开，与章节顺序一致
+                all_structures: list[dict[str, Any]] = [
+                    structure
+                    for batch_task in batch_tasks
+                    for structure in batch_task.result()
+                ]
 
                 if len(all_structures) != len(chapters):
                     logger.warning(
@@ -1442,7 +1462,9 @@ class BookImportService:
 
                 return outlines
         except Exception as exc:
-            logger.warning(f"反向生成章节大纲失败，回退规则大纲: {exc}")
+            # TaskGroup把批次异常包进ExceptionGroup，取首个真实原因写日志
+            cause = exc.exceptions[0] if isinstance(exc, BaseExceptionGroup) else exc
+            logger.warning(f"反向生成章节大纲失败，回退规则大纲: {cause}")
             if task:
                 self._set_task_state(task, status="running", progress=99, message="AI大纲生成失败，使用规则大纲")
             return fallback_outlines
@@ -1,10 +1,15 @@
 """导入导出服务"""
+import asyncio
 import json
 from copy import deepcopy
+from dataclasses import asdict, dataclass
 from datetime import datetime
-from typing import Dict, List, Optional, Tuple, Any
-from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, or_
+from typing import Dict, List, Optional, Tuple, Any, Union
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlalchemy import bindparam, insert, select, or_
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import aliased
 from app.models.project import Project
 from app.models.chapter import Chapter
 from app.models.character import Character
@@ -48,9 +53,45 @@ from app.services.world_setting_data_service import (
     normalize_world_setting_data,
 )
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 logger = get_logger(__name__)
 
 
+def _json_loads(value: Union[str, bytes]) -> Any:
+    """热路径JSON解析：优先orjson（2-5x于stdlib），不可用时退回json"""
+    if HAS_ORJSON:
+        return orjson.loads(value)
+    return json.loads(value)
+
+
+def _iso(dt: Optional[datetime]) -> Optional[str]:
+    """导出各表逐行用到的 isoformat-if-not-None 模式"""
+    return dt.isoformat() if dt else None
+
+
+def _json_dumps(obj: Any) -> str:
+    """热路径JSON序列化：orjson原生输出UTF-8，无需ensure_ascii"""
+    if HAS_ORJSON:
+        return orjson.dumps(obj).decode()
+    return json.dumps(obj, ensure_ascii=False)
+
+
+# 单条executemany的分片大小：需保证 行数×列数 低于驱动的绑定参数上限
+# （SQLite历史上限999，PostgreSQL协议约32k/65k），500行×~20列留有余量
+_BULK_INSERT_CHUNK = 500
+
+
+async def _bulk_insert(db: AsyncSession, model, rows: List[Dict], chunk: int = _BULK_INSERT_CHUNK) -> None:
+    """分片批量insert，避免超大导入触碰驱动的参数数量上限"""
+    for i in range(0, len(rows), chunk):
+        await db.execute(insert(model), rows[i:i + chunk])
+
+
 class ImportExportService:
     """导入导出服务类"""
     
@@ -65,7 +106,8 @@ class ImportExportService:
         include_writing_styles: bool = True,
         include_careers: bool = True,
         include_memories: bool = False,
-        include_plot_analysis: bool = False
+        include_plot_analysis: bool = False,
+        include_chapters: bool = True
     ) -> ProjectExportData:
         """
         导出项目完整数据
@@ -78,6 +120,7 @@ class ImportExportService:
             include_careers: 是否包含职业系统
             include_memories: 是否包含故事记忆
             include_plot_analysis: 是否包含剧情分析
+            include_chapters: 是否包含章节（文件流式导出时单独写出）
             
         Returns:
             ProjectExportData: 导出的项目数据
@@ -120,70 +163,67 @@ class ImportExportService:
             "character_count": project.character_count,
             "outline_mode": project.outline_mode,
             "user_id": project.user_id,
-            "created_at": project.created_at.isoformat() if project.created_at else None,
+            "created_at": _iso(project.created_at),
         }
         
-        # 导出章节
-        chapters = await ImportExportService._export_chapters(project_id, db)
-        logger.info(f"导出章节数: {len(chapters)}")
-        
-        # 导出角色
-        characters = await ImportExportService._export_characters(project_id, db)
-        logger.info(f"导出角色数: {len(characters)}")
-        
-        # 导出大纲
-        outlines = await ImportExportService._export_outlines(project_id, db)
-        logger.info(f"导出大纲数: {len(outlines)}")
-        
-        # 导出关系
-        relationships = await ImportExportService._export_relationships(project_id, db)
-        logger.info(f"导出关系数: {len(relationships)}")
-        
-        # 导出组织详情
-        organizations = await ImportExportService._export_organizations(project_id, db)
-        logger.info(f"导出组织数: {len(organizations)}")
-        
-        # 导出组织成员
-        org_members = await ImportExportService._export_organization_members(project_id, db)
-        logger.info(f"导出组织成员数: {len(org_members)}")
-        
-        # 导出写作风格（可选）
-        writing_styles = []
+        # 各 _export_* 相互独立且只读，为每个任务开独立会话并发执行
+        # （AsyncSession 不支持并发复用，因此不能共享传入的 db）
+        session_factory = async_sessionmaker(db.bind, class_=AsyncSession, expire_on_commit=False)
+
+        async def _run(export_fn):
+            async with session_factory() as session:
+                return await export_fn(project_id, session)
+
+        export_tasks = {
+            "characters": _export_characters,
+            "outlines": _export_outlines,
+            "relationships": _export_relationships,
+            "organizations": _export_organizations,
+            "organization_members": _export_organization_members,
+            "project_default_style": _export_project_default_style,
+        }
         if include_writing_styles:
-            writing_styles = await ImportExportService._export_writing_styles(project_id, db)
-            logger.info(f"导出写作风格数: {len(writing_styles)}")
-        
-        # 导出生成历史（可选）
-        generation_history = []
+            # 项目已加载，直接传user_id，避免导出函数内部再查一次Project
+            async def _export_styles(_project_id: str, session: AsyncSession):
+                return await _export_writing_styles(project.user_id, session)
+
+            export_tasks["writing_styles"] = _export_styles
         if include_generation_history:
-            generation_history = await ImportExportService._export_generation_history(project_id, db)
-            logger.info(f"导出生成历史数: {len(generation_history)}")
-        
-        # 导出职业系统（可选）
-        careers = []
-        character_careers = []
+            export_tasks["generation_history"] = _export_generation_history
         if include_careers:
-            careers = await ImportExportService._export_careers(project_id, db)
-            logger.info(f"导出职业数: {len(careers)}")
-            character_careers = await ImportExportService._export_character_careers(project_id, db)
-            logger.info(f"导出角色职业关联数: {len(character_careers)}")
-        
-        # 导出故事记忆（可选）
-        story_memories = []
+            export_tasks["careers"] = _export_careers
+            export_tasks["character_careers"] = _export_character_careers
         if include_memories:
-            story_memories = await ImportExportService._export_story_memories(project_id, db)
-            logger.info(f"导出故事记忆数: {len(story_memories)}")
-        
-        # 导出剧情分析（可选）
-        plot_analysis = []
+            export_tasks["story_memories"] = _export_story_memories
         if include_plot_analysis:
-            plot_analysis = await ImportExportService._export_plot_analysis(project_id, db)
-            logger.info(f"导出剧情分析数: {len(plot_analysis)}")
-        
-        # 导出项目默认风格
-        project_default_style = await ImportExportService._export_project_default_style(project_id, db)
+            export_tasks["plot_analysis"] = _export_plot_analysis
+        if include_chapters:
+            export_tasks["chapters"] = _export_chapters
+
+        results = dict(zip(
+            export_tasks.keys(),
+            await asyncio.gather(*(_run(fn) for fn in export_tasks.values()))
+        ))
+
+        chapters = results.get("chapters", [])
+        characters = results["characters"]
+        outlines = results["outlines"]
+        relationships = results["relationships"]
+        organizations = results["organizations"]
+        org_members = results["organization_members"]
+        writing_styles = results.get("writing_styles", [])
+        generation_history = results.get("generation_history", [])
+        careers = results.get("careers", [])
+        character_careers = results.get("character_careers", [])
+        story_memories = results.get("story_memories", [])
+        plot_analysis = results.get("plot_analysis", [])
+        project_default_style = results["project_default_style"]
+
+        # 单条汇总日志替代逐项打点；%s惰性格式化，未启用该级别时零开销
+        counts = {key: len(value) for key, value in results.items() if isinstance(value, list)}
         if project_default_style:
-            logger.info(f"导出项目默认风格: {project_default_style.style_name}")
+            counts["project_default_style"] = project_default_style.style_name
+        logger.info("项目导出统计 %s: %s", project_id, counts)
         
         export_data = ProjectExportData(
             version=ImportExportService.CURRENT_VERSION,
@@ -206,472 +246,57 @@ class ImportExportService:
         
         logger.info(f"项目导出完成: {project_id}")
         return export_data
-    
-    @staticmethod
-    async def _export_chapters(project_id: str, db: AsyncSession) -> List[ChapterExportData]:
-        """导出章节"""
-        result = await db.execute(
-            select(Chapter)
-            .where(Chapter.project_id == project_id)
-            .order_by(Chapter.chapter_number)
-        )
-        chapters = result.scalars().all()
-        
-        # 构建大纲ID到标题的映射
-        outline_mapping = {}
-        if chapters:
-            outline_ids = [ch.outline_id for ch in chapters if ch.outline_id]
-            if outline_ids:
-                outline_result = await db.execute(
-                    select(Outline).where(Outline.id.in_(outline_ids))
-                )
-                outlines = outline_result.scalars().all()
-                outline_mapping = {ol.id: ol.title for ol in outlines}
-        
-        exported_chapters = []
-        for ch in chapters:
-            # 解析expansion_plan JSON
-            expansion_plan = None
-            if ch.expansion_plan:
-                try:
-                    expansion_plan = json.loads(ch.expansion_plan) if isinstance(ch.expansion_plan, str) else ch.expansion_plan
-                except Exception:
-                    expansion_plan = None
-            
-            exported_chapters.append(ChapterExportData(
-                title=ch.title,
-                content=ch.content,
-                summary=ch.summary,
-                chapter_number=ch.chapter_number,
-                word_count=ch.word_count or 0,
-                status=ch.status,
-                created_at=ch.created_at.isoformat() if ch.created_at else None,
-                outline_title=outline_mapping.get(ch.outline_id) if ch.outline_id else None,
-                sub_index=ch.sub_index,
-                expansion_plan=expansion_plan
-            ))
-        
-        return exported_chapters
-    
-    @staticmethod
-    async def _export_characters(project_id: str, db: AsyncSession) -> List[CharacterExportData]:
-        """导出角色"""
-        result = await db.execute(
-            select(Character).where(Character.project_id == project_id)
-        )
-        characters = result.scalars().all()
-        
-        exported = []
-        for char in characters:
-            # 解析traits JSON
-            traits = None
-            if char.traits:
-                try:
-                    traits = json.loads(char.traits) if isinstance(char.traits, str) else char.traits
-                except Exception:
-                    traits = None
-            
-            exported.append(CharacterExportData(
-                name=char.name,
-                age=char.age,
-                gender=char.gender,
-                is_organization=False,
-                role_type=char.role_type,
-                personality=char.personality,
-                background=char.background,
-                appearance=char.appearance,
-                **character_card_field_values(char),
-                traits=traits,
-                organization_type=None,
-                organization_purpose=None,
-                created_at=char.created_at.isoformat() if char.created_at else None
-            ))
-
-        org_result = await db.execute(select(OrganizationEntity).where(OrganizationEntity.project_id == project_id))
-        for entity in org_result.scalars().all():
-            traits = None
-            if entity.traits:
-                try:
-                    traits = json.loads(entity.traits) if isinstance(entity.traits, str) else entity.traits
-                except Exception:
-                    traits = None
-            exported.append(CharacterExportData(
-                name=entity.name,
-                age=None,
-                gender=None,
-                is_organization=True,
-                role_type="organization",
-                personality=entity.personality,
-                background=entity.background,
-                appearance=None,
-                traits=traits,
-                organization_type=entity.organization_type,
-                organization_purpose=entity.organization_purpose,
-                power_level=entity.power_level,
-                location=entity.location,
-                motto=entity.motto,
-                color=entity.color,
-                created_at=entity.created_at.isoformat() if entity.created_at else None,
-            ))
-        
-        return exported
-    
-    @staticmethod
-    async def _export_outlines(project_id: str, db: AsyncSession) -> List[OutlineExportData]:
-        """导出大纲"""
-        result = await db.execute(
-            select(Outline)
-            .where(Outline.project_id == project_id)
-            .order_by(Outline.order_index)
-        )
-        outlines = result.scalars().all()
-        
-        return [
-            OutlineExportData(
-                title=ol.title,
-                content=ol.content,
-                structure=ol.structure,
-                order_index=ol.order_index,
-                created_at=ol.created_at.isoformat() if ol.created_at else None
-            )
-            for ol in outlines
-        ]
-    
-    @staticmethod
-    async def _export_relationships(project_id: str, db: AsyncSession) -> List[RelationshipExportData]:
-        """导出关系"""
-        result = await db.execute(
-            select(EntityRelationship, Character)
-            .join(Character, EntityRelationship.from_entity_id == Character.id)
-            .where(
-                EntityRelationship.project_id == project_id,
-                EntityRelationship.from_entity_type == "character",
-                EntityRelationship.to_entity_type == "character",
-            )
-        )
-        relationships = result.all()
-        
-        exported = []
-        for rel, char_from in relationships:
-            # 获取目标角色名称
-            target_result = await db.execute(
-                select(Character).where(Character.id == rel.to_entity_id)
-            )
-            char_to = target_result.scalar_one_or_none()
-            
-            if char_to:
-                exported.append(RelationshipExportData(
-                    source_name=char_from.name,
-                    target_name=char_to.name,
-                    relationship_name=rel.relationship_name,
-                    intimacy_level=rel.intimacy_level or 50,
-                    status=rel.status or "active",
-                    description=rel.description,
-                    started_at=rel.started_at
-                ))
-        
-        return exported
-    
-    @staticmethod
-    async def _export_organizations(project_id: str, db: AsyncSession) -> List[OrganizationExportData]:
-        """导出组织详情"""
-        result = await db.execute(
-            select(OrganizationEntity).where(OrganizationEntity.project_id == project_id)
-        )
-        organizations = result.scalars().all()
-        
-        exported = []
-        for org in organizations:
-            # 获取父组织名称
-            parent_name = None
-            if org.parent_org_id:
-                parent_result = await db.execute(
-                    select(OrganizationEntity).where(OrganizationEntity.id == org.parent_org_id)
-                )
-                parent_data = parent_result.scalar_one_or_none()
-                if parent_data:
-                    parent_name = parent_data.name
-            
-            exported.append(OrganizationExportData(
-                character_name=org.name,
-                parent_org_name=parent_name,
-                power_level=org.power_level or 50,
-                member_count=org.member_count or 0,
-                location=org.location,
-                motto=org.motto,
-                color=org.color
-            ))
-        
-        return exported
-    
-    @staticmethod
-    async def _export_organization_members(project_id: str, db: AsyncSession) -> List[OrganizationMemberExportData]:
-        """导出组织成员"""
-        result = await db.execute(
-            select(OrganizationMember, OrganizationEntity)
-            .join(OrganizationEntity, OrganizationMember.organization_entity_id == OrganizationEntity.id)
-            .where(OrganizationEntity.project_id == project_id)
-        )
-        members = result.all()
-        
-        exported = []
-        for member, org_entity in members:
-            # 获取成员角色名称
-            char_result = await db.execute(
-                select(Character).where(Character.id == member.character_id)
-            )
-            member_char = char_result.scalar_one_or_none()
-            
-            if member_char:
-                exported.append(OrganizationMemberExportData(
-                    organization_name=org_entity.name,
-                    character_name=member_char.name,
-                    position=member.position,
-                    rank=member.rank or 0,
-                    status=member.status or "active",
-                    joined_at=member.joined_at,
-                    loyalty=member.loyalty or 50,
-                    contribution=member.contribution or 0,
-                    notes=member.notes
-                ))
-        
-        return exported
-    
-    @staticmethod
-    async def _export_writing_styles(project_id: str, db: AsyncSession) -> List[WritingStyleExportData]:
-        """导出写作风格（用户自定义风格）"""
-        # 获取项目所属用户
-        project_result = await db.execute(
-            select(Project).where(Project.id == project_id)
-        )
-        project = project_result.scalar_one_or_none()
-        if not project:
-            return []
-        
-        # 导出该用户的自定义风格（不包括全局预设）
-        result = await db.execute(
-            select(WritingStyle)
-            .where(WritingStyle.user_id == project.user_id)
-            .order_by(WritingStyle.order_index)
-        )
-        styles = result.scalars().all()
-        
-        return [
-            WritingStyleExportData(
-                name=style.name,
-                style_type=style.style_type,
-                preset_id=style.preset_id,
-                description=style.description,
-                prompt_content=style.prompt_content,
-                order_index=style.order_index or 0
-            )
-            for style in styles
-        ]
-    
-    @staticmethod
-    async def _export_generation_history(project_id: str, db: AsyncSession) -> List[GenerationHistoryExportData]:
-        """导出生成历史"""
-        result = await db.execute(
-            select(GenerationHistory, Chapter)
-            .outerjoin(Chapter, GenerationHistory.chapter_id == Chapter.id)
-            .where(GenerationHistory.project_id == project_id)
-            .order_by(GenerationHistory.created_at.desc())
-            .limit(100)  # 限制最多导出100条历史记录
-        )
-        histories = result.all()
-        
-        return [
-            GenerationHistoryExportData(
-                chapter_title=chapter.title if chapter else None,
-                prompt=history.prompt,
-                generated_content=history.generated_content,
-                model=history.model,
-                tokens_used=history.tokens_used,
-                generation_time=history.generation_time,
-                created_at=history.created_at.isoformat() if history.created_at else None
-            )
-            for history, chapter in histories
-        ]
-    
-    @staticmethod
-    async def _export_careers(project_id: str, db: AsyncSession) -> List[CareerExportData]:
-        """导出职业系统"""
-        result = await db.execute(
-            select(Career)
-            .where(Career.project_id == project_id)
-            .order_by(Career.type, Career.created_at)
-        )
-        careers = result.scalars().all()
-        
-        return [
-            CareerExportData(
-                name=career.name,
-                type=career.type,
-                description=career.description,
-                category=career.category,
-                stages=career.stages,
-                max_stage=career.max_stage or 10,
-                requirements=career.requirements,
-                special_abilities=career.special_abilities,
-                worldview_rules=career.worldview_rules,
-                attribute_bonuses=career.attribute_bonuses,
-                source=career.source or "ai",
-                created_at=career.created_at.isoformat() if career.created_at else None
-            )
-            for career in careers
-        ]
-    
-    @staticmethod
-    async def _export_character_careers(project_id: str, db: AsyncSession) -> List[CharacterCareerExportData]:
-        """导出角色职业关联"""
-        # 查询所有属于该项目的角色职业关联
-        result = await db.execute(
-            select(CharacterCareer, Character, Career)
-            .join(Character, CharacterCareer.character_id == Character.id)
-            .join(Career, CharacterCareer.career_id == Career.id)
-            .where(Character.project_id == project_id)
-        )
-        character_careers = result.all()
-        
-        return [
-            CharacterCareerExportData(
-                character_name=char.name,
-                career_name=career.name,
-                career_type=cc.career_type,
-                current_stage=cc.current_stage or 1,
-                stage_progress=cc.stage_progress or 0,
-                started_at=cc.started_at,
-                reached_current_stage_at=cc.reached_current_stage_at,
-                notes=cc.notes
-            )
-            for cc, char, career in character_careers
-        ]
-    
-    @staticmethod
-    async def _export_story_memories(project_id: str, db: AsyncSession) -> List[StoryMemoryExportData]:
-        """导出故事记忆"""
-        # 构建章节ID到标题的映射
-        chapter_result = await db.execute(
-            select(Chapter).where(Chapter.project_id == project_id)
-        )
-        chapters = chapter_result.scalars().all()
-        chapter_mapping = {ch.id: ch.title for ch in chapters}
-        
-        # 构建角色ID到名称的映射
-        char_result = await db.execute(
-            select(Character).where(Character.project_id == project_id)
-        )
-        characters = char_result.scalars().all()
-        char_mapping = {char.id: char.name for char in characters}
-        
-        result = await db.execute(
-            select(StoryMemory)
-            .where(StoryMemory.project_id == project_id)
-            .order_by(StoryMemory.story_timeline, StoryMemory.chapter_position)
-        )
-        memories = result.scalars().all()
-        
-        exported = []
-        for mem in memories:
-            # 将角色ID列表转换为名称列表
-            related_char_names = None
-            if mem.related_characters:
-                related_char_names = [
-                    char_mapping.get(char_id, char_id)
-                    for char_id in mem.related_characters
-                ]
-            
-            exported.append(StoryMemoryExportData(
-                chapter_title=chapter_mapping.get(mem.chapter_id) if mem.chapter_id else None,
-                memory_type=mem.memory_type,
-                title=mem.title,
-                content=mem.content,
-                full_context=mem.full_context,
-                related_characters=related_char_names,
-                related_locations=mem.related_locations,
-                tags=mem.tags,
-                importance_score=mem.importance_score or 0.5,
-                story_timeline=mem.story_timeline,
-                chapter_position=mem.chapter_position or 0,
-                text_length=mem.text_length or 0,
-                is_foreshadow=mem.is_foreshadow or 0,
-                foreshadow_strength=mem.foreshadow_strength,
-                created_at=mem.created_at.isoformat() if mem.created_at else None
-            ))
-        
-        return exported
-    
-    @staticmethod
-    async def _export_plot_analysis(project_id: str, db: AsyncSession) -> List[PlotAnalysisExportData]:
-        """导出剧情分析"""
-        # 构建章节ID到标题的映射
-        chapter_result = await db.execute(
-            select(Chapter).where(Chapter.project_id == project_id)
-        )
-        chapters = chapter_result.scalars().all()
-        chapter_mapping = {ch.id: ch.title for ch in chapters}
-        
-        result = await db.execute(
-            select(PlotAnalysis)
-            .where(PlotAnalysis.project_id == project_id)
-        )
-        analyses = result.scalars().all()
-        
-        exported = []
-        for analysis in analyses:
-            chapter_title = chapter_mapping.get(analysis.chapter_id)
-            if not chapter_title:
-                continue  # 跳过没有关联章节的分析
-            
-            exported.append(PlotAnalysisExportData(
-                chapter_title=chapter_title,
-                plot_stage=analysis.plot_stage,
-                conflict_level=analysis.conflict_level,
-                conflict_types=analysis.conflict_types,
-                emotional_tone=analysis.emotional_tone,
-                emotional_intensity=analysis.emotional_intensity,
-                emotional_curve=analysis.emotional_curve,
-                hooks=analysis.hooks,
-                hooks_count=analysis.hooks_count or 0,
-                hooks_avg_strength=analysis.hooks_avg_strength,
-                foreshadows=analysis.foreshadows,
-                foreshadows_planted=analysis.foreshadows_planted or 0,
-                foreshadows_resolved=analysis.foreshadows_resolved or 0,
-                plot_points=analysis.plot_points,
-                plot_points_count=analysis.plot_points_count or 0,
-                character_states=analysis.character_states,
-                scenes=analysis.scenes,
-                pacing=analysis.pacing,
-                overall_quality_score=analysis.overall_quality_score,
-                pacing_score=analysis.pacing_score,
-                engagement_score=analysis.engagement_score,
-                coherence_score=analysis.coherence_score,
-                analysis_report=analysis.analysis_report,
-                suggestions=analysis.suggestions,
-                word_count=analysis.word_count,
-                dialogue_ratio=analysis.dialogue_ratio,
-                description_ratio=analysis.description_ratio,
-                created_at=analysis.created_at.isoformat() if analysis.created_at else None
-            ))
-        
-        return exported
-    
+
     @staticmethod
-    async def _export_project_default_style(project_id: str, db: AsyncSession) -> Optional[ProjectDefaultStyleExportData]:
-        """导出项目默认风格"""
-        result = await db.execute(
-            select(ProjectDefaultStyle, WritingStyle)
-            .join(WritingStyle, ProjectDefaultStyle.style_id == WritingStyle.id)
-            .where(ProjectDefaultStyle.project_id == project_id)
+    async def export_project_to_file(
+        project_id: str,
+        path: str,
+        db: AsyncSession,
+        include_generation_history: bool = False,
+        include_writing_styles: bool = True,
+        include_careers: bool = True,
+        include_memories: bool = False,
+        include_plot_analysis: bool = False
+    ) -> int:
+        """
+        流式导出项目到JSON文件
+
+        其余数据量较小的部分走常规导出；章节逐条序列化直接写入文件，
+        峰值内存不随章节数增长。
+
+        Returns:
+            int: 写出的章节数
+        """
+        export_data = await ImportExportService.export_project(
+            project_id,
+            db,
+            include_generation_history=include_generation_history,
+            include_writing_styles=include_writing_styles,
+            include_careers=include_careers,
+            include_memories=include_memories,
+            include_plot_analysis=include_plot_analysis,
+            include_chapters=False,
         )
-        row = result.first()
-        
-        if row:
-            _, style = row
-            return ProjectDefaultStyleExportData(style_name=style.name)
-        
-        return None
-    
+
+        payload = export_data.model_dump()
+        payload.pop("chapters", None)
+        head = _json_dumps(payload)
+
+        chapter_count = 0
+        with open(path, "w", encoding="utf-8") as fh:
+            # 去掉结尾的 "}"，追加流式写出的chapters数组
+            fh.write(head[:-1])
+            fh.write(',"chapters":[')
+            async for chapter in _stream_chapter_exports(project_id, db):
+                if chapter_count:
+                    fh.write(",")
+                fh.write(_json_dumps(chapter.model_dump()))
+                chapter_count += 1
+            fh.write("]}")
+
+        logger.info(f"项目流式导出完成: {project_id}, 章节数: {chapter_count}, 文件: {path}")
+        return chapter_count
+
     @staticmethod
     def validate_import_data(data: Dict) -> ImportValidationResult:
         """
@@ -714,22 +339,15 @@ class ImportExportService:
                 except WorldSettingDataError as exc:
                     errors.append(f"动态世界设定无效: {exc}")
         
-        # 统计数据（包含新增字段）
-        statistics = {
-            "chapters": len(data.get("chapters", [])),
-            "characters": len(data.get("characters", [])),
-            "outlines": len(data.get("outlines", [])),
-            "relationships": len(data.get("relationships", [])),
-            "organizations": len(data.get("organizations", [])),
-            "organization_members": len(data.get("organization_members", [])),
-            "writing_styles": len(data.get("writing_styles", [])),
-            "generation_history": len(data.get("generation_history", [])),
-            "careers": len(data.get("careers", [])),
-            "character_careers": len(data.get("character_careers", [])),
-            "story_memories": len(data.get("story_memories", [])),
-            "plot_analysis": len(data.get("plot_analysis", [])),
-            "has_default_style": data.get("project_default_style") is not None
-        }
+        # 统计数据（包含新增字段）；`or ()` 避免缺失键时反复分配空列表
+        for key in (
+            "chapters", "characters", "outlines", "relationships",
+            "organizations", "organization_members", "writing_styles",
+            "generation_history", "careers", "character_careers",
+            "story_memories", "plot_analysis",
+        ):
+            statistics[key] = len(data.get(key) or ())
+        statistics["has_default_style"] = data.get("project_default_style") is not None
         
         # 检查数据完整性
         if statistics["chapters"] == 0:
@@ -820,63 +438,63 @@ class ImportExportService:
             logger.info(f"创建项目成功: {new_project.id}")
             
             # 导入角色（包括组织）- 需要先导入角色，因为大纲可能需要角色信息
-            char_mapping = await ImportExportService._import_characters(
+            char_mapping = await _import_characters(
                 new_project.id, data.get("characters", []), db
             )
             statistics["characters"] = len(char_mapping)
             logger.info(f"导入角色数: {len(char_mapping)}")
             
             # 导入大纲 - 需要在章节之前导入，以便建立关联
-            outline_mapping = await ImportExportService._import_outlines(
+            outline_mapping = await _import_outlines(
                 new_project.id, data.get("outlines", []), db
             )
             statistics["outlines"] = len(outline_mapping)
             logger.info(f"导入大纲数: {len(outline_mapping)}")
             
             # 导入章节 - 使用大纲映射重建关联关系
-            chapters_count = await ImportExportService._import_chapters(
+            chapters_count = await _import_chapters(
                 new_project.id, data.get("chapters", []), outline_mapping, db
             )
             statistics["chapters"] = chapters_count
             logger.info(f"导入章节数: {chapters_count}")
             
             # 导入关系
-            relationships_count = await ImportExportService._import_relationships(
+            relationships_count = await _import_relationships(
                 new_project.id, data.get("relationships", []), char_mapping, db
             )
             statistics["relationships"] = relationships_count
             logger.info(f"导入关系数: {relationships_count}")
             
             # 导入组织详情
-            org_mapping = await ImportExportService._import_organizations(
+            org_mapping = await _import_organizations(
                 new_project.id, data.get("organizations", []), char_mapping, db
             )
             statistics["organizations"] = len(org_mapping)
             logger.info(f"导入组织数: {len(org_mapping)}")
             
             # 导入组织成员
-            org_members_count = await ImportExportService._import_organization_members(
+            org_members_count = await _import_organization_members(
                 data.get("organization_members", []), char_mapping, org_mapping, db
             )
             statistics["organization_members"] = org_members_count
             logger.info(f"导入组织成员数: {org_members_count}")
             
             # 导入写作风格
-            styles_count = await ImportExportService._import_writing_styles(
-                new_project.id, data.get("writing_styles", []), db
+            styles_count = await _import_writing_styles(
+                user_id, data.get("writing_styles", []), db
             )
             statistics["writing_styles"] = styles_count
             logger.info(f"导入写作风格数: {styles_count}")
             
             # 导入职业系统
-            career_mapping = await ImportExportService._import_careers(
+            career_mapping = await _import_careers(
                 new_project.id, data.get("careers", []), db
             )
             statistics["careers"] = len(career_mapping)
             logger.info(f"导入职业数: {len(career_mapping)}")
             
             # 导入角色职业关联
-            char_careers_count = await ImportExportService._import_character_careers(
+            char_careers_count = await _import_character_careers(
                 data.get("character_careers", []), char_mapping, career_mapping, db
             )
             statistics["character_careers"] = char_careers_count
@@ -886,29 +504,28 @@ class ImportExportService:
             # 需要先构建章节标题到ID的映射（使用章节号+标题组合确保唯一性）
             chapter_title_to_id = {}
             chapter_result = await db.execute(
-                select(Chapter).where(Chapter.project_id == new_project.id)
+                select(Chapter.id, Chapter.title).where(Chapter.project_id == new_project.id)
             )
-            imported_chapters = chapter_result.scalars().all()
-            for ch in imported_chapters:
+            for chapter_id, title in chapter_result.all():
                 # 使用标题作为key，如果有重复标题则取第一个（已导入的顺序）
-                if ch.title and ch.title not in chapter_title_to_id:
-                    chapter_title_to_id[ch.title] = ch.id
+                if title and title not in chapter_title_to_id:
+                    chapter_title_to_id[title] = chapter_id
             
-            memories_count = await ImportExportService._import_story_memories(
+            memories_count = await _import_story_memories(
                 new_project.id, data.get("story_memories", []), chapter_title_to_id, char_mapping, db
             )
             statistics["story_memories"] = memories_count
             logger.info(f"导入故事记忆数: {memories_count}")
             
             # 导入剧情分析（传入user_id以便创建分析任务记录）
-            plot_analysis_count = await ImportExportService._import_plot_analysis(
+            plot_analysis_count = await _import_plot_analysis(
                 new_project.id, data.get("plot_analysis", []), chapter_title_to_id, db, user_id
             )
             statistics["plot_analysis"] = plot_analysis_count
             logger.info(f"导入剧情分析数: {plot_analysis_count}")
             
             # 导入项目默认风格
-            default_style_imported = await ImportExportService._import_project_default_style(
+            default_style_imported = await _import_project_default_style(
                 new_project.id, data.get("project_default_style"), db
             )
             statistics["project_default_style"] = 1 if default_style_imported else 0
@@ -938,550 +555,6 @@ class ImportExportService:
                 warnings=warnings
             )
     
-    @staticmethod
-    async def _import_chapters(
-        project_id: str,
-        chapters_data: List[Dict],
-        outline_mapping: Dict[str, str],
-        db: AsyncSession
-    ) -> int:
-        """导入章节"""
-        count = 0
-        for ch_data in chapters_data:
-            # 根据大纲标题查找对应的新大纲ID
-            outline_id = None
-            outline_title = ch_data.get("outline_title")
-            if outline_title and outline_title in outline_mapping:
-                outline_id = outline_mapping[outline_title]
-            
-            # 处理expansion_plan
-            expansion_plan = ch_data.get("expansion_plan")
-            if expansion_plan and isinstance(expansion_plan, dict):
-                expansion_plan = json.dumps(expansion_plan, ensure_ascii=False)
-            
-            chapter = Chapter(
-                project_id=project_id,
-                title=ch_data.get("title"),
-                content=ch_data.get("content"),
-                summary=ch_data.get("summary"),
-                chapter_number=ch_data.get("chapter_number"),
-                word_count=ch_data.get("word_count", 0),
-                status=ch_data.get("status", "draft"),
-                outline_id=outline_id,
-                sub_index=ch_data.get("sub_index"),
-                expansion_plan=expansion_plan
-            )
-            db.add(chapter)
-            count += 1
-        
-        return count
-    
-    @staticmethod
-    async def _import_characters(
-        project_id: str,
-        characters_data: List[Dict],
-        db: AsyncSession
-    ) -> Dict[str, str]:
-        """导入角色，返回名称到ID的映射"""
-        char_mapping = {}
-        
-        for char_data in characters_data:
-            # 处理traits
-            traits = char_data.get("traits")
-            if isinstance(traits, list):
-                traits = json.dumps(traits, ensure_ascii=False)
-            if char_data.get("is_organization", False):
-                org_entity, _ = await create_organization_entity_from_payload(
-                    project_id=project_id,
-                    payload={**char_data, "traits": traits},
-                    db=db,
-                    source="imported",
-                    name=char_data.get("name"),
-                )
-                char_mapping[char_data.get("name")] = org_entity.id
-                continue
-            
-            character = Character(
-                project_id=project_id,
-                name=char_data.get("name"),
-                age=char_data.get("age"),
-                gender=char_data.get("gender"),
-                role_type=char_data.get("role_type"),
-                personality=char_data.get("personality"),
-                background=char_data.get("background"),
-                appearance=char_data.get("appearance"),
-                **normalize_character_card_fields(char_data),
-                traits=traits,
-            )
-            db.add(character)
-            await db.flush()  # 获取ID
-            char_mapping[char_data.get("name")] = character.id
-        
-        return char_mapping
-    
-    @staticmethod
-    async def _import_outlines(
-        project_id: str,
-        outlines_data: List[Dict],
-        db: AsyncSession
-    ) -> Dict[str, str]:
-        """导入大纲，返回标题到ID的映射"""
-        outline_mapping = {}
-        
-        for ol_data in outlines_data:
-            outline = Outline(
-                project_id=project_id,
-                title=ol_data.get("title"),
-                content=ol_data.get("content"),
-                structure=ol_data.get("structure"),
-                order_index=ol_data.get("order_index")
-            )
-            db.add(outline)
-            await db.flush()  # 获取ID
-            outline_mapping[ol_data.get("title")] = outline.id
-        
-        return outline_mapping
-    
-    @staticmethod
-    async def _import_relationships(
-        project_id: str,
-        relationships_data: List[Dict],
-        char_mapping: Dict[str, str],
-        db: AsyncSession
-    ) -> int:
-        """导入关系"""
-        count = 0
-        for rel_data in relationships_data:
-            source_name = rel_data.get("source_name")
-            target_name = rel_data.get("target_name")
-            
-            # 查找角色ID
-            source_id = char_mapping.get(source_name)
-            target_id = char_mapping.get(target_name)
-            
-            if source_id and target_id:
-                merge_result = await RelationshipMergeService(db).merge_character_relationship(
-                    project_id=project_id,
-                    character_from_id=source_id,
-                    character_to_id=target_id,
-                    relationship_name=rel_data.get("relationship_name"),
-                    intimacy_level=rel_data.get("intimacy_level", 50),
-                    status=rel_data.get("status", "active"),
-                    description=rel_data.get("description"),
-                    started_at=rel_data.get("started_at"),
-                    source="imported",
-                    confidence=1.0,
-                    allow_conflict_apply=True,
-                )
-                if merge_result.relationship is not None and merge_result.changed:
-                    count += 1
-        
-        return count
-    
-    @staticmethod
-    async def _import_organizations(
-        project_id: str,
-        organizations_data: List[Dict],
-        char_mapping: Dict[str, str],
-        db: AsyncSession
-    ) -> Dict[str, str]:
-        """导入组织详情，返回名称到ID的映射"""
-        org_mapping = {}
-        
-        # 第一遍：创建所有组织（不设置父组织）
-        temp_orgs = []
-        for org_data in organizations_data:
-            char_name = org_data.get("character_name")
-            char_id = char_mapping.get(char_name)
-            
-            if char_id:
-                entity = (await db.execute(select(OrganizationEntity).where(OrganizationEntity.id == char_id))).scalar_one_or_none()
-                if entity is None:
-                    entity, organization = await create_organization_entity_from_payload(
-                        project_id=project_id,
-                        payload={
-                            "name": char_name,
-                            "power_level": org_data.get("power_level", 50),
-                            "member_count": org_data.get("member_count", 0),
-                            "location": org_data.get("location"),
-                            "motto": org_data.get("motto"),
-                            "color": org_data.get("color"),
-                        },
-                        db=db,
-                        source="imported",
-                        name=char_name,
-                    )
-                else:
-                    entity.power_level = org_data.get("power_level", entity.power_level)
-                    entity.member_count = org_data.get("member_count", entity.member_count)
-                    entity.location = org_data.get("location", entity.location)
-                    entity.motto = org_data.get("motto", entity.motto)
-                    entity.color = org_data.get("color", entity.color)
-                    organization = await ensure_organization_bridge(entity, db)
-                temp_orgs.append((entity, organization, org_data.get("parent_org_name")))
-        
-        await db.flush()  # 获取所有组织的ID
-        
-        # 建立名称到ID的映射
-        for entity, bridge, _ in temp_orgs:
-            org_mapping[entity.name] = bridge.id
-        
-        # 第二遍：设置父组织关系
-        for entity, _bridge, parent_name in temp_orgs:
-            if parent_name:
-                parent_bridge_id = org_mapping.get(parent_name)
-                if parent_bridge_id:
-                    parent_bridge = (await db.execute(select(Organization).where(Organization.id == parent_bridge_id))).scalar_one_or_none()
-                    if parent_bridge:
-                        entity.parent_org_id = parent_bridge.organization_entity_id
-        
-        return org_mapping
-    
-    @staticmethod
-    async def _import_organization_members(
-        org_members_data: List[Dict],
-        char_mapping: Dict[str, str],
-        org_mapping: Dict[str, str],
-        db: AsyncSession
-    ) -> int:
-        """导入组织成员"""
-        count = 0
-        for member_data in org_members_data:
-            org_name = member_data.get("organization_name")
-            char_name = member_data.get("character_name")
-            
-            org_id = org_mapping.get(org_name)
-            char_id = char_mapping.get(char_name)
-            
-            if org_id and char_id:
-                bridge = (await db.execute(select(Organization).where(Organization.id == org_id))).scalar_one_or_none()
-                if not bridge or not bridge.organization_entity_id:
-                    continue
-                member = OrganizationMember(
-                    organization_id=org_id,
-                    organization_entity_id=bridge.organization_entity_id,
-                    character_id=char_id,
-                    position=member_data.get("position"),
-                    rank=member_data.get("rank", 0),
-                    status=member_data.get("status", "active"),
-                    joined_at=member_data.get("joined_at"),
-                    loyalty=member_data.get("loyalty", 50),
-                    contribution=member_data.get("contribution", 0),
-                    notes=member_data.get("notes")
-                )
-                db.add(member)
-                count += 1
-        
-        return count
-    
-    @staticmethod
-    async def _import_writing_styles(
-        project_id: str,
-        styles_data: List[Dict],
-        db: AsyncSession
-    ) -> int:
-        """导入写作风格（用户自定义风格）"""
-        # 获取项目所属用户
-        project_result = await db.execute(
-            select(Project).where(Project.id == project_id)
-        )
-        project = project_result.scalar_one_or_none()
-        if not project:
-            return 0
-        
-        count = 0
-        for style_data in styles_data:
-            # 检查是否已存在同名风格（避免重复导入）
-            existing = await db.execute(
-                select(WritingStyle).where(
-                    WritingStyle.user_id == project.user_id,
-                    WritingStyle.name == style_data.get("name")
-                )
-            )
-            # 使用 first() 避免多行时报错
-            if existing.first():
-                logger.debug(f"风格 {style_data.get('name')} 已存在，跳过导入")
-                continue
-            
-            style = WritingStyle(
-                user_id=project.user_id,  # 使用 user_id 而不是 project_id
-                name=style_data.get("name"),
-                style_type=style_data.get("style_type"),
-                preset_id=style_data.get("preset_id"),
-                description=style_data.get("description"),
-                prompt_content=style_data.get("prompt_content"),
-                order_index=style_data.get("order_index", 0)
-            )
-            db.add(style)
-            count += 1
-        
-        return count
-    
-    @staticmethod
-    async def _import_careers(
-        project_id: str,
-        careers_data: List[Dict],
-        db: AsyncSession
-    ) -> Dict[str, str]:
-        """导入职业，返回名称到ID的映射"""
-        career_mapping = {}
-        
-        for career_data in careers_data:
-            career = Career(
-                project_id=project_id,
-                name=career_data.get("name"),
-                type=career_data.get("type", "main"),
-                description=career_data.get("description"),
-                category=career_data.get("category"),
-                stages=career_data.get("stages", "[]"),
-                max_stage=career_data.get("max_stage", 10),
-                requirements=career_data.get("requirements"),
-                special_abilities=career_data.get("special_abilities"),
-                worldview_rules=career_data.get("worldview_rules"),
-                attribute_bonuses=career_data.get("attribute_bonuses"),
-                source=career_data.get("source", "ai")
-            )
-            db.add(career)
-            await db.flush()
-            career_mapping[career_data.get("name")] = career.id
-        
-        return career_mapping
-    
-    @staticmethod
-    async def _import_character_careers(
-        character_careers_data: List[Dict],
-        char_mapping: Dict[str, str],
-        career_mapping: Dict[str, str],
-        db: AsyncSession
-    ) -> int:
-        """导入角色职业关联"""
-        count = 0
-        for cc_data in character_careers_data:
-            char_name = cc_data.get("character_name")
-            career_name = cc_data.get("career_name")
-            
-            char_id = char_mapping.get(char_name)
-            career_id = career_mapping.get(career_name)
-            
-            if char_id and career_id:
-                # 检查是否已存在（使用 first() 避免多行时报错）
-                existing = await db.execute(
-                    select(CharacterCareer).where(
-                        CharacterCareer.character_id == char_id,
-                        CharacterCareer.career_id == career_id
-                    )
-                )
-                if existing.first():
-                    continue
-                
-                char_career = CharacterCareer(
-                    character_id=char_id,
-                    career_id=career_id,
-                    career_type=cc_data.get("career_type", "main"),
-                    current_stage=cc_data.get("current_stage", 1),
-                    stage_progress=cc_data.get("stage_progress", 0),
-                    started_at=cc_data.get("started_at"),
-                    reached_current_stage_at=cc_data.get("reached_current_stage_at"),
-                    notes=cc_data.get("notes")
-                )
-                db.add(char_career)
-                count += 1
-                
-                # 同时更新角色的主职业信息
-                if cc_data.get("career_type") == "main":
-                    char_result = await db.execute(
-                        select(Character).where(Character.id == char_id)
-                    )
-                    char = char_result.scalar_one_or_none()
-                    if char:
-                        char.main_career_id = career_id
-                        char.main_career_stage = cc_data.get("current_stage", 1)
-        
-        return count
-    
-    @staticmethod
-    async def _import_story_memories(
-        project_id: str,
-        memories_data: List[Dict],
-        chapter_mapping: Dict[str, str],
-        char_mapping: Dict[str, str],
-        db: AsyncSession
-    ) -> int:
-        """导入故事记忆"""
-        count = 0
-        for mem_data in memories_data:
-            # 将章节标题转换为ID
-            chapter_id = None
-            chapter_title = mem_data.get("chapter_title")
-            if chapter_title and chapter_title in chapter_mapping:
-                chapter_id = chapter_mapping[chapter_title]
-            
-            # 将角色名称列表转换为ID列表
-            related_char_ids = None
-            related_char_names = mem_data.get("related_characters")
-            if related_char_names:
-                related_char_ids = [
-                    char_mapping.get(name)
-                    for name in related_char_names
-                    if char_mapping.get(name)
-                ]
-            
-            memory = StoryMemory(
-                project_id=project_id,
-                chapter_id=chapter_id,
-                memory_type=mem_data.get("memory_type"),
-                title=mem_data.get("title"),
-                content=mem_data.get("content"),
-                full_context=mem_data.get("full_context"),
-                related_characters=related_char_ids,
-                related_locations=mem_data.get("related_locations"),
-                tags=mem_data.get("tags"),
-                importance_score=mem_data.get("importance_score", 0.5),
-                story_timeline=mem_data.get("story_timeline", 0),
-                chapter_position=mem_data.get("chapter_position", 0),
-                text_length=mem_data.get("text_length", 0),
-                is_foreshadow=mem_data.get("is_foreshadow", 0),
-                foreshadow_strength=mem_data.get("foreshadow_strength")
-            )
-            db.add(memory)
-            count += 1
-        
-        return count
-    
-    @staticmethod
-    async def _import_plot_analysis(
-        project_id: str,
-        plot_data: List[Dict],
-        chapter_mapping: Dict[str, str],
-        db: AsyncSession,
-        user_id: str = None
-    ) -> int:
-        """导入剧情分析，同时创建已完成的分析任务记录"""
-        from datetime import datetime
-        
-        count = 0
-        for analysis_data in plot_data:
-            chapter_title = analysis_data.get("chapter_title")
-            chapter_id = chapter_mapping.get(chapter_title)
-            
-            if not chapter_id:
-                continue  # 跳过找不到章节的分析
-            
-            # 检查是否已存在该章节的分析（使用 first() 避免多行时报错）
-            existing = await db.execute(
-                select(PlotAnalysis).where(PlotAnalysis.chapter_id == chapter_id)
-            )
-            if existing.first():
-                continue
-            
-            analysis = PlotAnalysis(
-                project_id=project_id,
-                chapter_id=chapter_id,
-                plot_stage=analysis_data.get("plot_stage"),
-                conflict_level=analysis_data.get("conflict_level"),
-                conflict_types=analysis_data.get("conflict_types"),
-                emotional_tone=analysis_data.get("emotional_tone"),
-                emotional_intensity=analysis_data.get("emotional_intensity"),
-                emotional_curve=analysis_data.get("emotional_curve"),
-                hooks=analysis_data.get("hooks"),
-                hooks_count=analysis_data.get("hooks_count", 0),
-                hooks_avg_strength=analysis_data.get("hooks_avg_strength"),
-                foreshadows=analysis_data.get("foreshadows"),
-                foreshadows_planted=analysis_data.get("foreshadows_planted", 0),
-                foreshadows_resolved=analysis_data.get("foreshadows_resolved", 0),
-                plot_points=analysis_data.get("plot_points"),
-                plot_points_count=analysis_data.get("plot_points_count", 0),
-                character_states=analysis_data.get("character_states"),
-                scenes=analysis_data.get("scenes"),
-                pacing=analysis_data.get("pacing"),
-                overall_quality_score=analysis_data.get("overall_quality_score"),
-                pacing_score=analysis_data.get("pacing_score"),
-                engagement_score=analysis_data.get("engagement_score"),
-                coherence_score=analysis_data.get("coherence_score"),
-                analysis_report=analysis_data.get("analysis_report"),
-                suggestions=analysis_data.get("suggestions"),
-                word_count=analysis_data.get("word_count"),
-                dialogue_ratio=analysis_data.get("dialogue_ratio"),
-                description_ratio=analysis_data.get("description_ratio")
-            )
-            db.add(analysis)
-            
-            # 同时创建已完成的分析任务记录，这样章节管理页面会显示"已分析"状态
-            if user_id:
-                now = datetime.utcnow()
-                analysis_task = AnalysisTask(
-                    chapter_id=chapter_id,
-                    user_id=user_id,
-                    project_id=project_id,
-                    status='completed',
-                    progress=100,
-                    started_at=now,
-                    completed_at=now
-                )
-                db.add(analysis_task)
-            
-            count += 1
-        
-        return count
-    
-    @staticmethod
-    async def _import_project_default_style(
-        project_id: str,
-        default_style_data: Optional[Dict],
-        db: AsyncSession
-    ) -> bool:
-        """导入项目默认风格"""
-        if not default_style_data:
-            return False
-        
-        style_name = default_style_data.get("style_name")
-        if not style_name:
-            return False
-        
-        # 获取项目所属用户
-        project_result = await db.execute(
-            select(Project).where(Project.id == project_id)
-        )
-        project = project_result.scalar_one_or_none()
-        if not project:
-            return False
-        
-        # 查找对应的风格（优先查找用户自定义风格，然后是全局预设风格）
-        # 先查用户自定义风格（使用 first() 避免多行时报错）
-        style_result = await db.execute(
-            select(WritingStyle).where(
-                WritingStyle.user_id == project.user_id,
-                WritingStyle.name == style_name
-            )
-        )
-        style_row = style_result.first()
-        style = style_row[0] if style_row else None
-        
-        # 如果用户自定义风格不存在，查找全局预设风格
-        if not style:
-            style_result = await db.execute(
-                select(WritingStyle).where(
-                    WritingStyle.user_id.is_(None),
-                    WritingStyle.name == style_name
-                )
-            )
-            style_row = style_result.first()
-            style = style_row[0] if style_row else None
-        
-        if not style:
-            logger.warning(f"导入项目默认风格时未找到风格: {style_name}")
-            return False
-        
-        # 创建项目默认风格关联
-        default_style = ProjectDefaultStyle(
-            project_id=project_id,
-            style_id=style.id
-        )
-        db.add(default_style)
-        
-        logger.info(f"项目默认风格导入成功: {style_name}, style_id={style.id}")
-        return True
-    
     @staticmethod
     async def export_characters(
         character_ids: List[str],
@@ -1517,10 +590,12 @@ class ImportExportService:
         for char in characters:
             # 解析 traits
             traits = None
-            if char.traits:
+            if isinstance(char.traits, (dict, list)):
+                traits = char.traits
+            elif char.traits:
                 try:
-                    traits = json.loads(char.traits) if isinstance(char.traits, str) else char.traits
-                except Exception:
+                    traits = _json_loads(char.traits)
+                except (TypeError, ValueError):
                     traits = None
             
             # 基础角色数据
@@ -1541,7 +616,7 @@ class ImportExportService:
                 "main_career_id": char.main_career_id,
                 "main_career_stage": char.main_career_stage,
                 "sub_careers": char.sub_careers,
-                "created_at": char.created_at.isoformat() if char.created_at else None
+                "created_at": _iso(char.created_at)
             }
             
             exported_characters.append(char_data)
@@ -1551,8 +626,8 @@ class ImportExportService:
             char_data = legacy_org_payload(entity, bridge)
             if isinstance(char_data.get("traits"), str):
                 try:
-                    char_data["traits"] = json.loads(char_data["traits"])
-                except Exception:
+                    char_data["traits"] = _json_loads(char_data["traits"])
+                except (TypeError, ValueError):
                     char_data["traits"] = None
             members = (await db.execute(
                 select(OrganizationMember).where(OrganizationMember.organization_entity_id == entity.id)
@@ -1678,7 +753,7 @@ class ImportExportService:
                     # 处理traits
                     traits = char_data.get("traits")
                     if isinstance(traits, list):
-                        traits = json.dumps(traits, ensure_ascii=False)
+                        traits = _json_dumps(traits)
                     
                     is_organization = char_data.get("is_organization", False)
                     
@@ -1786,7 +861,7 @@ class ImportExportService:
                     sub_careers = char_data.get("sub_careers")
                     if sub_careers and not is_organization:
                         try:
-                            sub_careers_data = json.loads(sub_careers) if isinstance(sub_careers, str) else sub_careers
+                            sub_careers_data = _json_loads(sub_careers) if isinstance(sub_careers, str) else sub_careers
                             
                             if isinstance(sub_careers_data, list):
                                 valid_sub_careers = []
@@ -1824,7 +899,7 @@ class ImportExportService:
                                                 db.add(char_career)
                                 
                                 if valid_sub_careers:
-                                    character.sub_careers = json.dumps(valid_sub_careers, ensure_ascii=False)
+                                    character.sub_careers = _json_dumps(valid_sub_careers)
                                 elif sub_careers_data:
                                     warnings.append(f"角色'{name}'的副职业ID不存在，已忽略副职业信息")
                         except Exception as e:
@@ -1899,3 +974,1090 @@ class ImportExportService:
             Dict: 验证结果
         """
         return validate_character_card_envelope(data, ImportExportService.SUPPORTED_VERSIONS)
+
+
+async def _stream_chapter_exports(project_id: str, db: AsyncSession):
+    """逐条产出章节导出数据（供列表导出和文件流式导出共用）"""
+    # 只取序列化需要的列，避免整行ORM实体的水合开销
+    stmt = (
+        select(
+            Chapter.title,
+            Chapter.content,
+            Chapter.summary,
+            Chapter.chapter_number,
+            Chapter.word_count,
+            Chapter.status,
+            Chapter.created_at,
+            Chapter.outline_id,
+            Chapter.sub_index,
+            Chapter.expansion_plan,
+        )
+        .where(Chapter.project_id == project_id)
+        .order_by(Chapter.chapter_number)
+    )
+
+    # 大纲映射只需要两列，单独一次小查询。
+    # 模型层不定义ORM relationship()，无法用selectinload(Chapter.outline)；
+    # 这条按项目取大纲标题的查询与selectinload的follow-up SELECT等价。
+    outline_result = await db.execute(
+        select(Outline.id, Outline.title).where(Outline.project_id == project_id)
+    )
+    outline_mapping = dict(outline_result.all())
+
+    # content列很大，流式读取避免一次性物化全部行
+    stream = await db.stream(stmt.execution_options(yield_per=500))
+
+    async for ch in stream:
+        # 解析expansion_plan JSON
+        expansion_plan = None
+        if isinstance(ch.expansion_plan, (dict, list)):
+            expansion_plan = ch.expansion_plan
+        elif ch.expansion_plan:
+            try:
+                expansion_plan = _json_loads(ch.expansion_plan)
+            except (TypeError, ValueError):
+                expansion_plan = None
+
+        yield ChapterExportData.model_construct(
+            title=ch.title,
+            content=ch.content,
+            summary=ch.summary,
+            chapter_number=ch.chapter_number,
+            word_count=ch.word_count or 0,
+            status=ch.status,
+            created_at=_iso(ch.created_at),
+            outline_title=outline_mapping.get(ch.outline_id) if ch.outline_id else None,
+            sub_index=ch.sub_index,
+            expansion_plan=expansion_plan
+        )
+
+
+async def _export_chapters(project_id: str, db: AsyncSession) -> List[ChapterExportData]:
+    """导出章节"""
+    return [ch async for ch in _stream_chapter_exports(project_id, db)]
+
+
+async def _export_characters(project_id: str, db: AsyncSession) -> List[CharacterExportData]:
+    """导出角色"""
+    result = await db.execute(
+        select(Character).where(Character.project_id == project_id)
+    )
+    characters = result.scalars().all()
+    
+    exported = []
+    for char in characters:
+        # 解析traits JSON
+        traits = None
+        if isinstance(char.traits, (dict, list)):
+            traits = char.traits
+        elif char.traits:
+            try:
+                traits = _json_loads(char.traits)
+            except (TypeError, ValueError):
+                traits = None
+        
+        exported.append(CharacterExportData.model_construct(
+            name=char.name,
+            age=char.age,
+            gender=char.gender,
+            is_organization=False,
+            role_type=char.role_type,
+            personality=char.personality,
+            background=char.background,
+            appearance=char.appearance,
+            **character_card_field_values(char),
+            traits=traits,
+            organization_type=None,
+            organization_purpose=None,
+            created_at=_iso(char.created_at)
+        ))
+
+    org_result = await db.execute(select(OrganizationEntity).where(OrganizationEntity.project_id == project_id))
+    for entity in org_result.scalars().all():
+        traits = None
+        if isinstance(entity.traits, (dict, list)):
+            traits = entity.traits
+        elif entity.traits:
+            try:
+                traits = _json_loads(entity.traits)
+            except (TypeError, ValueError):
+                traits = None
+        exported.append(CharacterExportData.model_construct(
+            name=entity.name,
+            age=None,
+            gender=None,
+            is_organization=True,
+            role_type="organization",
+            personality=entity.personality,
+            background=entity.background,
+            appearance=None,
+            traits=traits,
+            organization_type=entity.organization_type,
+            organization_purpose=entity.organization_purpose,
+            power_level=entity.power_level,
+            location=entity.location,
+            motto=entity.motto,
+            color=entity.color,
+            created_at=_iso(entity.created_at),
+        ))
+    
+    return exported
+
+
+async def _export_outlines(project_id: str, db: AsyncSession) -> List[OutlineExportData]:
+    """导出大纲"""
+    # 只取序列化需要的列
+    result = await db.execute(
+        select(
+            Outline.title,
+            Outline.content,
+            Outline.structure,
+            Outline.order_index,
+            Outline.created_at,
+        )
+        .where(Outline.project_id == project_id)
+        .order_by(Outline.order_index)
+    )
+    outlines = result.all()
+
+    return [
+        OutlineExportData.model_construct(
+            title=ol.title,
+            content=ol.content,
+            structure=ol.structure,
+            order_index=ol.order_index,
+            created_at=_iso(ol.created_at)
+        )
+        for ol in outlines
+    ]
+
+
+# 固定形状的导出JOIN语句在模块级构建一次，project_id走bindparam，
+# 避免每次导出重复构建/编译语句
+_REL_CHAR_FROM = aliased(Character)
+_REL_CHAR_TO = aliased(Character)
+_RELATIONSHIP_EXPORT_STMT = (
+    select(EntityRelationship, _REL_CHAR_FROM.name, _REL_CHAR_TO.name)
+    .join(_REL_CHAR_FROM, EntityRelationship.from_entity_id == _REL_CHAR_FROM.id)
+    .join(_REL_CHAR_TO, EntityRelationship.to_entity_id == _REL_CHAR_TO.id)
+    .where(
+        EntityRelationship.project_id == bindparam("project_id"),
+        EntityRelationship.from_entity_type == "character",
+        EntityRelationship.to_entity_type == "character",
+    )
+)
+
+_PARENT_ORG = aliased(OrganizationEntity)
+_ORGANIZATION_EXPORT_STMT = (
+    select(OrganizationEntity, _PARENT_ORG.name)
+    .outerjoin(_PARENT_ORG, OrganizationEntity.parent_org_id == _PARENT_ORG.id)
+    .where(OrganizationEntity.project_id == bindparam("project_id"))
+)
+
+_ORG_MEMBER_EXPORT_STMT = (
+    select(OrganizationMember, OrganizationEntity.name, Character.name)
+    .join(OrganizationEntity, OrganizationMember.organization_entity_id == OrganizationEntity.id)
+    .join(Character, OrganizationMember.character_id == Character.id)
+    .where(OrganizationEntity.project_id == bindparam("project_id"))
+)
+
+
+async def _export_relationships(project_id: str, db: AsyncSession) -> List[RelationshipExportData]:
+    """导出关系"""
+    # 双别名联表一次取回源/目标角色名，避免逐行回查目标角色（N+1）
+    result = await db.execute(_RELATIONSHIP_EXPORT_STMT, {"project_id": project_id})
+
+    return [
+        RelationshipExportData.model_construct(
+            source_name=source_name,
+            target_name=target_name,
+            relationship_name=rel.relationship_name,
+            intimacy_level=rel.intimacy_level or 50,
+            status=rel.status or "active",
+            description=rel.description,
+            started_at=rel.started_at
+        )
+        for rel, source_name, target_name in result.all()
+    ]
+
+
+async def _export_organizations(project_id: str, db: AsyncSession) -> List[OrganizationExportData]:
+    """导出组织详情"""
+    # 自联接一次取回父组织名称，避免逐行回查父组织（N+1）
+    result = await db.execute(_ORGANIZATION_EXPORT_STMT, {"project_id": project_id})
+
+    return [
+        OrganizationExportData.model_construct(
+            character_name=org.name,
+            parent_org_name=parent_name,
+            power_level=org.power_level or 50,
+            member_count=org.member_count or 0,
+            location=org.location,
+            motto=org.motto,
+            color=org.color
+        )
+        for org, parent_name in result.all()
+    ]
+
+
+async def _export_organization_members(project_id: str, db: AsyncSession) -> List[OrganizationMemberExportData]:
+    """导出组织成员"""
+    # 联表一次取回成员角色名称，避免逐行回查角色（N+1）
+    result = await db.execute(_ORG_MEMBER_EXPORT_STMT, {"project_id": project_id})
+
+    return [
+        OrganizationMemberExportData.model_construct(
+            organization_name=org_name,
+            character_name=member_name,
+            position=member.position,
+            rank=member.rank or 0,
+            status=member.status or "active",
+            joined_at=member.joined_at,
+            loyalty=member.loyalty or 50,
+            contribution=member.contribution or 0,
+            notes=member.notes
+        )
+        for member, org_name, member_name in result.all()
+    ]
+
+
+async def _export_writing_styles(user_id: str, db: AsyncSession) -> List[WritingStyleExportData]:
+    """导出写作风格（用户自定义风格）"""
+    # 导出该用户的自定义风格（不包括全局预设）
+    result = await db.execute(
+        select(WritingStyle)
+        .where(WritingStyle.user_id == user_id)
+        .order_by(WritingStyle.order_index)
+    )
+    styles = result.scalars().all()
+    
+    return [
+        WritingStyleExportData.model_construct(
+            name=style.name,
+            style_type=style.style_type,
+            preset_id=style.preset_id,
+            description=style.description,
+            prompt_content=style.prompt_content,
+            order_index=style.order_index or 0
+        )
+        for style in styles
+    ]
+
+
+async def _export_generation_history(project_id: str, db: AsyncSession) -> List[GenerationHistoryExportData]:
+    """导出生成历史"""
+    # Chapter只用到title一列，不水合整个章节实体（content很大）
+    stmt = (
+        select(GenerationHistory, Chapter.title)
+        .outerjoin(Chapter, GenerationHistory.chapter_id == Chapter.id)
+        .where(GenerationHistory.project_id == project_id)
+        .order_by(GenerationHistory.created_at.desc())
+        .limit(100)  # 限制最多导出100条历史记录
+    )
+    # prompt/generated_content列很大，流式读取避免峰值内存
+    stream = await db.stream(stmt.execution_options(yield_per=100))
+
+    exported = []
+    async for history, chapter_title in stream:
+        exported.append(GenerationHistoryExportData.model_construct(
+            chapter_title=chapter_title,
+            prompt=history.prompt,
+            generated_content=history.generated_content,
+            model=history.model,
+            tokens_used=history.tokens_used,
+            generation_time=history.generation_time,
+            created_at=_iso(history.created_at)
+        ))
+
+    return exported
+
+
+async def _export_careers(project_id: str, db: AsyncSession) -> List[CareerExportData]:
+    """导出职业系统"""
+    result = await db.execute(
+        select(Career)
+        .where(Career.project_id == project_id)
+        .order_by(Career.type, Career.created_at)
+    )
+    careers = result.scalars().all()
+    
+    return [
+        CareerExportData.model_construct(
+            name=career.name,
+            type=career.type,
+            description=career.description,
+            category=career.category,
+            stages=career.stages,
+            max_stage=career.max_stage or 10,
+            requirements=career.requirements,
+            special_abilities=career.special_abilities,
+            worldview_rules=career.worldview_rules,
+            attribute_bonuses=career.attribute_bonuses,
+            source=career.source or "ai",
+            created_at=_iso(career.created_at)
+        )
+        for career in careers
+    ]
+
+
+async def _export_character_careers(project_id: str, db: AsyncSession) -> List[CharacterCareerExportData]:
+    """导出角色职业关联"""
+    # 查询所有属于该项目的角色职业关联
+    result = await db.execute(
+        select(CharacterCareer, Character, Career)
+        .join(Character, CharacterCareer.character_id == Character.id)
+        .join(Career, CharacterCareer.career_id == Career.id)
+        .where(Character.project_id == project_id)
+    )
+    character_careers = result.all()
+    
+    return [
+        CharacterCareerExportData.model_construct(
+            character_name=char.name,
+            career_name=career.name,
+            career_type=cc.career_type,
+            current_stage=cc.current_stage or 1,
+            stage_progress=cc.stage_progress or 0,
+            started_at=cc.started_at,
+            reached_current_stage_at=cc.reached_current_stage_at,
+            notes=cc.notes
+        )
+        for cc, char, career in character_careers
+    ]
+
+
+async def _export_story_memories(project_id: str, db: AsyncSession) -> List[StoryMemoryExportData]:
+    """导出故事记忆"""
+    # 构建章节ID到标题的映射（只取两列）
+    chapter_result = await db.execute(
+        select(Chapter.id, Chapter.title).where(Chapter.project_id == project_id)
+    )
+    chapter_mapping = dict(chapter_result.all())
+
+    # 构建角色ID到名称的映射（只取两列）
+    char_result = await db.execute(
+        select(Character.id, Character.name).where(Character.project_id == project_id)
+    )
+    char_mapping = dict(char_result.all())
+    
+    result = await db.execute(
+        select(StoryMemory)
+        .where(StoryMemory.project_id == project_id)
+        .order_by(StoryMemory.story_timeline, StoryMemory.chapter_position)
+    )
+    memories = result.scalars().all()
+    
+    exported = []
+    for mem in memories:
+        # 将角色ID列表转换为名称列表
+        related_char_names = None
+        if mem.related_characters:
+            related_char_names = [
+                char_mapping.get(char_id, char_id)
+                for char_id in mem.related_characters
+            ]
+        
+        exported.append(StoryMemoryExportData.model_construct(
+            chapter_title=chapter_mapping.get(mem.chapter_id) if mem.chapter_id else None,
+            memory_type=mem.memory_type,
+            title=mem.title,
+            content=mem.content,
+            full_context=mem.full_context,
+            related_characters=related_char_names,
+            related_locations=mem.related_locations,
+            tags=mem.tags,
+            importance_score=mem.importance_score or 0.5,
+            story_timeline=mem.story_timeline,
+            chapter_position=mem.chapter_position or 0,
+            text_length=mem.text_length or 0,
+            is_foreshadow=mem.is_foreshadow or 0,
+            foreshadow_strength=mem.foreshadow_strength,
+            created_at=_iso(mem.created_at)
+        ))
+    
+    return exported
+
+
+async def _export_plot_analysis(project_id: str, db: AsyncSession) -> List[PlotAnalysisExportData]:
+    """导出剧情分析"""
+    # 构建章节ID到标题的映射（只取两列）
+    chapter_result = await db.execute(
+        select(Chapter.id, Chapter.title).where(Chapter.project_id == project_id)
+    )
+    chapter_mapping = dict(chapter_result.all())
+    
+    result = await db.execute(
+        select(PlotAnalysis)
+        .where(PlotAnalysis.project_id == project_id)
+    )
+    analyses = result.scalars().all()
+    
+    exported = []
+    for analysis in analyses:
+        chapter_title = chapter_mapping.get(analysis.chapter_id)
+        if not chapter_title:
+            continue  # 跳过没有关联章节的分析
+        
+        exported.append(PlotAnalysisExportData.model_construct(
+            chapter_title=chapter_title,
+            plot_stage=analysis.plot_stage,
+            conflict_level=analysis.conflict_level,
+            conflict_types=analysis.conflict_types,
+            emotional_tone=analysis.emotional_tone,
+            emotional_intensity=analysis.emotional_intensity,
+            emotional_curve=analysis.emotional_curve,
+            hooks=analysis.hooks,
+            hooks_count=analysis.hooks_count or 0,
+            hooks_avg_strength=analysis.hooks_avg_strength,
+            foreshadows=analysis.foreshadows,
+            foreshadows_planted=analysis.foreshadows_planted or 0,
+            foreshadows_resolved=analysis.foreshadows_resolved or 0,
+            plot_points=analysis.plot_points,
+            plot_points_count=analysis.plot_points_count or 0,
+            character_states=analysis.character_states,
+            scenes=analysis.scenes,
+            pacing=analysis.pacing,
+            overall_quality_score=analysis.overall_quality_score,
+            pacing_score=analysis.pacing_score,
+            engagement_score=analysis.engagement_score,
+            coherence_score=analysis.coherence_score,
+            analysis_report=analysis.analysis_report,
+            suggestions=analysis.suggestions,
+            word_count=analysis.word_count,
+            dialogue_ratio=analysis.dialogue_ratio,
+            description_ratio=analysis.description_ratio,
+            created_at=_iso(analysis.created_at)
+        ))
+    
+    return exported
+
+
+async def _export_project_default_style(project_id: str, db: AsyncSession) -> Optional[ProjectDefaultStyleExportData]:
+    """导出项目默认风格"""
+    result = await db.execute(
+        select(ProjectDefaultStyle, WritingStyle)
+        .join(WritingStyle, ProjectDefaultStyle.style_id == WritingStyle.id)
+        .where(ProjectDefaultStyle.project_id == project_id)
+    )
+    row = result.first()
+    
+    if row:
+        _, style = row
+        return ProjectDefaultStyleExportData.model_construct(style_name=style.name)
+    
+    return None
+
+
+async def _import_chapters(
+    project_id: str,
+    chapters_data: List[Dict],
+    outline_mapping: Dict[str, str],
+    db: AsyncSession
+) -> int:
+    """导入章节"""
+    rows = []
+    for ch_data in chapters_data:
+        # 根据大纲标题查找对应的新大纲ID
+        outline_id = None
+        outline_title = ch_data.get("outline_title")
+        if outline_title and outline_title in outline_mapping:
+            outline_id = outline_mapping[outline_title]
+
+        # 处理expansion_plan
+        expansion_plan = ch_data.get("expansion_plan")
+        if expansion_plan and isinstance(expansion_plan, dict):
+            expansion_plan = _json_dumps(expansion_plan)
+
+        rows.append({
+            "project_id": project_id,
+            "title": ch_data.get("title"),
+            "content": ch_data.get("content"),
+            "summary": ch_data.get("summary"),
+            "chapter_number": ch_data.get("chapter_number"),
+            "word_count": ch_data.get("word_count", 0),
+            "status": ch_data.get("status", "draft"),
+            "outline_id": outline_id,
+            "sub_index": ch_data.get("sub_index"),
+            "expansion_plan": expansion_plan
+        })
+
+    # 不需要取回章节ID，走Core分片批量insert（executemany快路径）
+    if rows:
+        await _bulk_insert(db, Chapter, rows)
+
+    return len(rows)
+
+
+async def _import_characters(
+    project_id: str,
+    characters_data: List[Dict],
+    db: AsyncSession
+) -> Dict[str, str]:
+    """导入角色，返回名称到ID的映射"""
+    char_mapping = {}
+
+    # 先收集全部角色对象，最后一次flush取回ID，避免逐行round-trip
+    pending_characters = []
+    for char_data in characters_data:
+        # 处理traits
+        traits = char_data.get("traits")
+        if isinstance(traits, list):
+            traits = _json_dumps(traits)
+        if char_data.get("is_organization", False):
+            org_entity, _ = await create_organization_entity_from_payload(
+                project_id=project_id,
+                payload={**char_data, "traits": traits},
+                db=db,
+                source="imported",
+                name=char_data.get("name"),
+            )
+            char_mapping[char_data.get("name")] = org_entity.id
+            continue
+
+        character = Character(
+            project_id=project_id,
+            name=char_data.get("name"),
+            age=char_data.get("age"),
+            gender=char_data.get("gender"),
+            role_type=char_data.get("role_type"),
+            personality=char_data.get("personality"),
+            background=char_data.get("background"),
+            appearance=char_data.get("appearance"),
+            **normalize_character_card_fields(char_data),
+            traits=traits,
+        )
+        pending_characters.append((char_data.get("name"), character))
+
+    if pending_characters:
+        db.add_all([character for _, character in pending_characters])
+        await db.flush()  # 一次flush批量取回ID
+        for name, character in pending_characters:
+            char_mapping[name] = character.id
+
+    return char_mapping
+
+
+async def _import_outlines(
+    project_id: str,
+    outlines_data: List[Dict],
+    db: AsyncSession
+) -> Dict[str, str]:
+    """导入大纲，返回标题到ID的映射"""
+    outlines = [
+        Outline(
+            project_id=project_id,
+            title=ol_data.get("title"),
+            content=ol_data.get("content"),
+            structure=ol_data.get("structure"),
+            order_index=ol_data.get("order_index")
+        )
+        for ol_data in outlines_data
+    ]
+    if not outlines:
+        return {}
+
+    db.add_all(outlines)
+    await db.flush()  # 一次flush批量取回ID
+    return {outline.title: outline.id for outline in outlines}
+
+
+async def _import_relationships(
+    project_id: str,
+    relationships_data: List[Dict],
+    char_mapping: Dict[str, str],
+    db: AsyncSession
+) -> int:
+    """导入关系"""
+    # 先一次性解析出两端都能映射的行，合并服务也只构造一次
+    resolved = [
+        (char_mapping[rel_data.get("source_name")], char_mapping[rel_data.get("target_name")], rel_data)
+        for rel_data in relationships_data
+        if char_mapping.get(rel_data.get("source_name")) and char_mapping.get(rel_data.get("target_name"))
+    ]
+    if not resolved:
+        return 0
+
+    merge_service = RelationshipMergeService(db)
+    count = 0
+    for source_id, target_id, rel_data in resolved:
+        merge_result = await merge_service.merge_character_relationship(
+            project_id=project_id,
+            character_from_id=source_id,
+            character_to_id=target_id,
+            relationship_name=rel_data.get("relationship_name"),
+            intimacy_level=rel_data.get("intimacy_level", 50),
+            status=rel_data.get("status", "active"),
+            description=rel_data.get("description"),
+            started_at=rel_data.get("started_at"),
+            source="imported",
+            confidence=1.0,
+            allow_conflict_apply=True,
+        )
+        if merge_result.relationship is not None and merge_result.changed:
+            count += 1
+
+    return count
+
+
+async def _import_organizations(
+    project_id: str,
+    organizations_data: List[Dict],
+    char_mapping: Dict[str, str],
+    db: AsyncSession
+) -> Dict[str, str]:
+    """导入组织详情，返回名称到ID的映射"""
+    org_mapping = {}
+
+    # 预取所有候选组织实体，避免第一遍循环逐行回查（N+1）
+    candidate_ids = [
+        char_mapping[org_data.get("character_name")]
+        for org_data in organizations_data
+        if char_mapping.get(org_data.get("character_name"))
+    ]
+    existing_entities = {}
+    if candidate_ids:
+        entity_result = await db.execute(
+            select(OrganizationEntity).where(OrganizationEntity.id.in_(candidate_ids))
+        )
+        existing_entities = {entity.id: entity for entity in entity_result.scalars().all()}
+
+    # 第一遍：创建所有组织（不设置父组织）
+    temp_orgs = []
+    for org_data in organizations_data:
+        char_name = org_data.get("character_name")
+        char_id = char_mapping.get(char_name)
+
+        if char_id:
+            entity = existing_entities.get(char_id)
+            if entity is None:
+                entity, organization = await create_organization_entity_from_payload(
+                    project_id=project_id,
+                    payload={
+                        "name": char_name,
+                        "power_level": org_data.get("power_level", 50),
+                        "member_count": org_data.get("member_count", 0),
+                        "location": org_data.get("location"),
+                        "motto": org_data.get("motto"),
+                        "color": org_data.get("color"),
+                    },
+                    db=db,
+                    source="imported",
+                    name=char_name,
+                )
+            else:
+                entity.power_level = org_data.get("power_level", entity.power_level)
+                entity.member_count = org_data.get("member_count", entity.member_count)
+                entity.location = org_data.get("location", entity.location)
+                entity.motto = org_data.get("motto", entity.motto)
+                entity.color = org_data.get("color", entity.color)
+                organization = await ensure_organization_bridge(entity, db)
+            temp_orgs.append((entity, organization, org_data.get("parent_org_name")))
+    
+    await db.flush()  # 获取所有组织的ID
+    
+    # 建立名称到ID的映射
+    for entity, bridge, _ in temp_orgs:
+        org_mapping[entity.name] = bridge.id
+    
+    # 第二遍：设置父组织关系（一次取回所有父桥接记录的实体ID）
+    parent_bridge_ids = {
+        org_mapping[parent_name]
+        for _entity, _bridge, parent_name in temp_orgs
+        if parent_name and org_mapping.get(parent_name)
+    }
+    parent_entity_mapping = {}
+    if parent_bridge_ids:
+        parent_result = await db.execute(
+            select(Organization.id, Organization.organization_entity_id)
+            .where(Organization.id.in_(parent_bridge_ids))
+        )
+        parent_entity_mapping = dict(parent_result.all())
+
+    for entity, _bridge, parent_name in temp_orgs:
+        if parent_name:
+            parent_entity_id = parent_entity_mapping.get(org_mapping.get(parent_name))
+            if parent_entity_id:
+                entity.parent_org_id = parent_entity_id
+
+    return org_mapping
+
+
+async def _import_organization_members(
+    org_members_data: List[Dict],
+    char_mapping: Dict[str, str],
+    org_mapping: Dict[str, str],
+    db: AsyncSession
+) -> int:
+    """导入组织成员"""
+    # 一次取回所有桥接记录的实体ID，避免逐行回查Organization
+    bridge_ids = {
+        org_mapping[member_data.get("organization_name")]
+        for member_data in org_members_data
+        if org_mapping.get(member_data.get("organization_name"))
+    }
+    entity_mapping = {}
+    if bridge_ids:
+        bridge_result = await db.execute(
+            select(Organization.id, Organization.organization_entity_id)
+            .where(Organization.id.in_(bridge_ids))
+        )
+        entity_mapping = {
+            bridge_id: entity_id
+            for bridge_id, entity_id in bridge_result.all()
+            if entity_id
+        }
+
+    rows = []
+    for member_data in org_members_data:
+        org_id = org_mapping.get(member_data.get("organization_name"))
+        char_id = char_mapping.get(member_data.get("character_name"))
+        entity_id = entity_mapping.get(org_id)
+
+        if org_id and char_id and entity_id:
+            rows.append({
+                "organization_id": org_id,
+                "organization_entity_id": entity_id,
+                "character_id": char_id,
+                "position": member_data.get("position"),
+                "rank": member_data.get("rank", 0),
+                "status": member_data.get("status", "active"),
+                "joined_at": member_data.get("joined_at"),
+                "loyalty": member_data.get("loyalty", 50),
+                "contribution": member_data.get("contribution", 0),
+                "notes": member_data.get("notes")
+            })
+
+    # 不需要取回成员ID，走Core分片批量insert
+    if rows:
+        await _bulk_insert(db, OrganizationMember, rows)
+
+    return len(rows)
+
+
+@dataclass
+class _StyleImportRecord:
+    """写作风格导入行的规范化结构（缺省值只在构造时处理一次）"""
+    name: Optional[str] = None
+    style_type: Optional[str] = None
+    preset_id: Optional[str] = None
+    description: Optional[str] = None
+    prompt_content: Optional[str] = None
+    order_index: int = 0
+
+
+async def _import_writing_styles(
+    user_id: str,
+    styles_data: List[Dict],
+    db: AsyncSession
+) -> int:
+    """导入写作风格（用户自定义风格）
+
+    依赖 writing_styles(user_id, name) 唯一索引，用 ON CONFLICT DO NOTHING
+    把"查重+插入"合并为一条语句：原子、无并发竞态、且只有一次往返。
+    全程走Core级insert映射，不构造ORM实例，绕开unit-of-work的逐对象开销。
+    """
+    # 先把松散dict规范化成固定字段的记录，后续访问都是属性读取
+    fields = _StyleImportRecord.__dataclass_fields__
+    records = [
+        _StyleImportRecord(**{k: d[k] for k in fields if k in d})
+        for d in styles_data
+    ]
+    # 先在应用层去掉载荷内部的重名（多项目合并导入时常见），
+    # 重复行连INSERT都不会发出，而不是留给ON CONFLICT兜底。
+    # 判重键与唯一索引同构取(user_id, name)复合键：将来支持跨用户
+    # 批量导入（如管理端工具）时本段逻辑无需改动
+    seen_keys: set = set()
+    to_insert: List[Dict] = []
+    for record in records:
+        key = (user_id, record.name)
+        if key in seen_keys:
+            logger.debug("风格 %s 在导入数据中重复，跳过", record.name)
+            continue
+        seen_keys.add(key)
+        # 使用 user_id 而不是 project_id
+        to_insert.append({"user_id": user_id, **asdict(record)})
+    if not to_insert:
+        return 0
+
+    dialect_insert = pg_insert if db.bind.dialect.name == "postgresql" else sqlite_insert
+    count = 0
+    # 关闭autoflush：逐页execute不必反复检查/刷新会话里其他待写对象；
+    # 事务由import_project在全部导入结束后统一commit一次
+    with db.no_autoflush:
+        # 分页构造VALUES，避免超大导入一次性撑爆绑定参数上限/内存
+        for i in range(0, len(to_insert), _BULK_INSERT_CHUNK):
+            page = to_insert[i:i + _BULK_INSERT_CHUNK]
+            stmt = dialect_insert(WritingStyle).values(
+                page
+            ).on_conflict_do_nothing(index_elements=["user_id", "name"])
+            result = await db.execute(stmt)
+            # rowcount反映实际落库行数（ON CONFLICT跳过的不计入）；
+            # 个别驱动报-1/None时退回页大小
+            rowcount = result.rowcount
+            count += rowcount if rowcount is not None and rowcount >= 0 else len(page)
+    return count
+
+
+async def _import_careers(
+    project_id: str,
+    careers_data: List[Dict],
+    db: AsyncSession
+) -> Dict[str, str]:
+    """导入职业，返回名称到ID的映射"""
+    career_mapping = {}
+    
+    for career_data in careers_data:
+        career = Career(
+            project_id=project_id,
+            name=career_data.get("name"),
+            type=career_data.get("type", "main"),
+            description=career_data.get("description"),
+            category=career_data.get("category"),
+            stages=career_data.get("stages", "[]"),
+            max_stage=career_data.get("max_stage", 10),
+            requirements=career_data.get("requirements"),
+            special_abilities=career_data.get("special_abilities"),
+            worldview_rules=career_data.get("worldview_rules"),
+            attribute_bonuses=career_data.get("attribute_bonuses"),
+            source=career_data.get("source", "ai")
+        )
+        db.add(career)
+        await db.flush()
+        career_mapping[career_data.get("name")] = career.id
+    
+    return career_mapping
+
+
+async def _import_character_careers(
+    character_careers_data: List[Dict],
+    char_mapping: Dict[str, str],
+    career_mapping: Dict[str, str],
+    db: AsyncSession
+) -> int:
+    """导入角色职业关联"""
+    count = 0
+    for cc_data in character_careers_data:
+        char_name = cc_data.get("character_name")
+        career_name = cc_data.get("career_name")
+        
+        char_id = char_mapping.get(char_name)
+        career_id = career_mapping.get(career_name)
+        
+        if char_id and career_id:
+            # 检查是否已存在（使用 first() 避免多行时报错）
+            existing = await db.execute(
+                select(CharacterCareer).where(
+                    CharacterCareer.character_id == char_id,
+                    CharacterCareer.career_id == career_id
+                )
+            )
+            if existing.first():
+                continue
+            
+            char_career = CharacterCareer(
+                character_id=char_id,
+                career_id=career_id,
+                career_type=cc_data.get("career_type", "main"),
+                current_stage=cc_data.get("current_stage", 1),
+                stage_progress=cc_data.get("stage_progress", 0),
+                started_at=cc_data.get("started_at"),
+                reached_current_stage_at=cc_data.get("reached_current_stage_at"),
+                notes=cc_data.get("notes")
+            )
+            db.add(char_career)
+            count += 1
+            
+            # 同时更新角色的主职业信息
+            if cc_data.get("career_type") == "main":
+                char_result = await db.execute(
+                    select(Character).where(Character.id == char_id)
+                )
+                char = char_result.scalar_one_or_none()
+                if char:
+                    char.main_career_id = career_id
+                    char.main_career_stage = cc_data.get("current_stage", 1)
+    
+    return count
+
+
+async def _import_story_memories(
+    project_id: str,
+    memories_data: List[Dict],
+    chapter_mapping: Dict[str, str],
+    char_mapping: Dict[str, str],
+    db: AsyncSession
+) -> int:
+    """导入故事记忆"""
+    count = 0
+    for mem_data in memories_data:
+        # 将章节标题转换为ID
+        chapter_id = None
+        chapter_title = mem_data.get("chapter_title")
+        if chapter_title and chapter_title in chapter_mapping:
+            chapter_id = chapter_mapping[chapter_title]
+        
+        # 将角色名称列表转换为ID列表
+        related_char_ids = None
+        related_char_names = mem_data.get("related_characters")
+        if related_char_names:
+            related_char_ids = [
+                char_mapping.get(name)
+                for name in related_char_names
+                if char_mapping.get(name)
+            ]
+        
+        memory = StoryMemory(
+            project_id=project_id,
+            chapter_id=chapter_id,
+            memory_type=mem_data.get("memory_type"),
+            title=mem_data.get("title"),
+            content=mem_data.get("content"),
+            full_context=mem_data.get("full_context"),
+            related_characters=related_char_ids,
+            related_locations=mem_data.get("related_locations"),
+            tags=mem_data.get("tags"),
+            importance_score=mem_data.get("importance_score", 0.5),
+            story_timeline=mem_data.get("story_timeline", 0),
+            chapter_position=mem_data.get("chapter_position", 0),
+            text_length=mem_data.get("text_length", 0),
+            is_foreshadow=mem_data.get("is_foreshadow", 0),
+            foreshadow_strength=mem_data.get("foreshadow_strength")
+        )
+        db.add(memory)
+        count += 1
+    
+    return count
+
+
+async def _import_plot_analysis(
+    project_id: str,
+    plot_data: List[Dict],
+    chapter_mapping: Dict[str, str],
+    db: AsyncSession,
+    user_id: str = None
+) -> int:
+    """导入剧情分析，同时创建已完成的分析任务记录"""
+    from datetime import datetime
+    
+    count = 0
+    for analysis_data in plot_data:
+        chapter_title = analysis_data.get("chapter_title")
+        chapter_id = chapter_mapping.get(chapter_title)
+        
+        if not chapter_id:
+            continue  # 跳过找不到章节的分析
+        
+        # 检查是否已存在该章节的分析（使用 first() 避免多行时报错）
+        existing = await db.execute(
+            select(PlotAnalysis).where(PlotAnalysis.chapter_id == chapter_id)
+        )
+        if existing.first():
+            continue
+        
+        analysis = PlotAnalysis(
+            project_id=project_id,
+            chapter_id=chapter_id,
+            plot_stage=analysis_data.get("plot_stage"),
+            conflict_level=analysis_data.get("conflict_level"),
+            conflict_types=analysis_data.get("conflict_types"),
+            emotional_tone=analysis_data.get("emotional_tone"),
+            emotional_intensity=analysis_data.get("emotional_intensity"),
+            emotional_curve=analysis_data.get("emotional_curve"),
+            hooks=analysis_data.get("hooks"),
+            hooks_count=analysis_data.get("hooks_count", 0),
+            hooks_avg_strength=analysis_data.get("hooks_avg_strength"),
+            foreshadows=analysis_data.get("foreshadows"),
+            foreshadows_planted=analysis_data.get("foreshadows_planted", 0),
+            foreshadows_resolved=analysis_data.get("foreshadows_resolved", 0),
+            plot_points=analysis_data.get("plot_points"),
+            plot_points_count=analysis_data.get("plot_points_count", 0),
+            character_states=analysis_data.get("character_states"),
+            scenes=analysis_data.get("scenes"),
+            pacing=analysis_data.get("pacing"),
+            overall_quality_score=analysis_data.get("overall_quality_score"),
+            pacing_score=analysis_data.get("pacing_score"),
+            engagement_score=analysis_data.get("engagement_score"),
+            coherence_score=analysis_data.get("coherence_score"),
+            analysis_report=analysis_data.get("analysis_report"),
+            suggestions=analysis_data.get("suggestions"),
+            word_count=analysis_data.get("word_count"),
+            dialogue_ratio=analysis_data.get("dialogue_ratio"),
+            description_ratio=analysis_data.get("description_ratio")
+        )
+        db.add(analysis)
+        
+        # 同时创建已完成的分析任务记录，这样章节管理页面会显示"已分析"状态
+        if user_id:
+            now = datetime.utcnow()
+            analysis_task = AnalysisTask(
+                chapter_id=chapter_id,
+                user_id=user_id,
+                project_id=project_id,
+                status='completed',
+                progress=100,
+                started_at=now,
+                completed_at=now
+            )
+            db.add(analysis_task)
+        
+        count += 1
+    
+    return count
+
+
+async def _import_project_default_style(
+    project_id: str,
+    default_style_data: Optional[Dict],
+    db: AsyncSession
+) -> bool:
+    """导入项目默认风格"""
+    if not default_style_data:
+        return False
+    
+    style_name = default_style_data.get("style_name")
+    if not style_name:
+        return False
+    
+    # 获取项目所属用户
+    project_result = await db.execute(
+        select(Project).where(Project.id == project_id)
+    )
+    project = project_result.scalar_one_or_none()
+    if not project:
+        return False
+    
+    # 查找对应的风格（优先查找用户自定义风格，然后是全局预设风格）
+    # 先查用户自定义风格（使用 first() 避免多行时报错）
+    style_result = await db.execute(
+        select(WritingStyle).where(
+            WritingStyle.user_id == project.user_id,
+            WritingStyle.name == style_name
+        )
+    )
+    style_row = style_result.first()
+    style = style_row[0] if style_row else None
+    
+    # 如果用户自定义风格不存在，查找全局预设风格
+    if not style:
+        style_result = await db.execute(
+            select(WritingStyle).where(
+                WritingStyle.user_id.is_(None),
+                WritingStyle.name == style_name
+            )
+        )
+        style_row = style_result.first()
+        style = style_row[0] if style_row else None
+    
+    if not style:
+        logger.warning(f"导入项目默认风格时未找到风格: {style_name}")
+        return False
+    
+    # 创建项目默认风格关联
+    default_style = ProjectDefaultStyle(
+        project_id=project_id,
+        style_id=style.id
+    )
+    db.add(default_style)
+    
+    logger.info(f"项目默认风格导入成功: {style_name}, style_id={style.id}")
+    return True
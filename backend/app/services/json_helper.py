@@ -10,9 +10,25 @@ try:
 except ImportError:
     HAS_JSON5 = False
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 logger = get_logger(__name__)
 
 
+def _strict_loads(text: str) -> Any:
+    """严格解析的快速路径：优先orjson（多KB响应显著更快），未安装退回标准json
+
+    orjson.JSONDecodeError 是 json.JSONDecodeError 的子类，调用方的异常捕获无需区分。
+    """
+    if HAS_ORJSON:
+        return orjson.loads(text)
+    return json.loads(text)
+
+
 # 中文引号/括号到ASCII的映射
 _QUOTE_MAP = {
     '\u201c': '"',  # " → "
@@ -386,7 +402,7 @@ def clean_json_response(text: str) -> str:
         
         # 尝试直接解析（快速路径）
         try:
-            json.loads(text)
+            _strict_loads(text)
             logger.debug(f"✅ 直接解析成功，无需清洗")
             return text
         except Exception:
@@ -535,9 +551,9 @@ def parse_json(text: str) -> Union[Dict, List]:
     """解析 JSON，优先使用标准json，失败后用json5容错解析"""
     cleaned = clean_json_response(text)
     
-    # 优先使用标准 json
+    # 优先走严格快速路径（orjson或标准json）
     try:
-        return json.loads(cleaned)
+        return _strict_loads(cleaned)
     except (json.JSONDecodeError, Exception):
         pass
     
@@ -565,9 +581,9 @@ def loads_json(text: str) -> Any:
     优先用标准 json.loads，失败后自动降级到 json5。
     适用于解析 AI 返回的、可能包含不规范格式的 JSON。
     """
-    # 优先使用标准 json
+    # 优先走严格快速路径（orjson或标准json）
     try:
-        return json.loads(text)
+        return _strict_loads(text)
     except (json.JSONDecodeError, Exception):
         pass
     
@@ -4,11 +4,55 @@ from __future__ import annotations
 
 # pyright: reportAny=false, reportExplicitAny=false, reportArgumentType=false, reportReturnType=false, reportMissingImports=false, reportImplicitRelativeImport=false, reportMissingTypeArgument=false, reportUnknownArgumentType=false, reportUnknownMemberType=false, reportUnknownParameterType=false, reportUnknownVariableType=false, reportMissingParameterType=false, reportUnannotatedClassAttribute=false, reportDeprecated=false, reportUnusedImport=false, reportUnusedParameter=false, reportUnusedVariable=false, reportUnnecessaryIsInstance=false, reportUnnecessaryComparison=false
 
+from types import SimpleNamespace
 from typing import Dict, Any
+from functools import lru_cache
+from pathlib import Path
 import hashlib
 import json
+import string
+import sys
+import textwrap
+import time
 from app.services.skill_loader import get_all_skills_cached
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    orjson = None
+    HAS_ORJSON = False
+
+
+_FORMATTER = string.Formatter()
+
+
+@lru_cache(maxsize=256)
+def _compile_format_template(
+    template: str,
+) -> tuple[tuple[str, ...], tuple[str, ...], frozenset] | None:
+    """把str.format模板一次性解析为(字面量段, 字段名, 必填参数集)三元组
+
+    以模板文本为缓存键，内置常量与用户在数据库中自定义的模板都能命中；
+    渲染时只做字典取值+join，免去每次调用重跑format状态机；
+    必填参数集供渲染前一次性校验缺参，免走异常路径。
+    模板含格式规约/转换/属性访问等高级语法时返回None，调用方退回str.format。
+    """
+    parts: list[str] = [""]
+    fields: list[str] = []
+    try:
+        for literal, field, spec, conversion in _FORMATTER.parse(template):
+            parts[-1] += literal
+            if field is None:
+                continue
+            if not field or spec or conversion or "." in field or "[" in field:
+                return None
+            fields.append(field)
+            parts.append("")
+    except ValueError:
+        return None
+    return tuple(parts), tuple(fields), frozenset(fields)
+
 
 # Genre Strategy Matrix for Long-Form Novels (1M+ words)
 GENRE_STRATEGIES = {
@@ -112,9 +156,41 @@ GENRE_STRATEGIES = {
 }
 
 
+# 导入期一次性规范化策略矩阵：指令去除缩进/首尾空行并intern
+# （同一指令会注入成千上万次章节提示词），关键词冻结为元组
+for _strategy in GENRE_STRATEGIES.values():
+    _strategy["instruction"] = sys.intern(textwrap.dedent(_strategy["instruction"]).strip())
+    _strategy["keywords"] = tuple(_strategy["keywords"])
+del _strategy
+
+
+# 关键词→策略指令的扁平倒排索引：导入期构建一次，
+# 匹配时单层扫描即可，无需每次调用都遍历嵌套的策略矩阵
+_KEYWORD_TO_INSTRUCTION = tuple(
+    (keyword, strategy["instruction"])
+    for strategy in GENRE_STRATEGIES.values()
+    for keyword in strategy["keywords"]
+)
+
+
+@lru_cache(maxsize=128)
+def _match_genre_strategy(genre_lower: str) -> str:
+    """在倒排索引上匹配类型关键词（按规范化后的类型名缓存命中结果）
+
+    项目类型来自用户输入，实际取值高度集中（"玄幻"、"都市"等十几种），
+    缓存后重复类型的匹配退化为一次字典查找。
+    """
+    for keyword, instruction in _KEYWORD_TO_INSTRUCTION:
+        if keyword in genre_lower:
+            return instruction
+    return ""
+
+
 class WritingStyleManager:
     """写作风格管理器"""
 
+    __slots__ = ()
+
     @staticmethod
     def apply_style_to_prompt(base_prompt: str, style_content: str) -> str:
         """
@@ -130,13 +206,664 @@ class WritingStyleManager:
         Returns:
             追加输出指令后的提示词
         """
-        # 写作风格已在 system_prompt 中注入，此处只追加输出格式指令
+        # 写作风格已在 system_prompt 中注入，此处只追加输出格式指令。
+        # 不做记忆化：base_prompt内嵌每章大纲/上下文，几乎每次调用都不同，
+        # 缓存命中率趋近于零，只会常驻整段提示词文本白占内存
         return f"{base_prompt}\n\n请直接输出章节正文内容，不要包含章节标题和其他说明文字。"
 
 
+# 角色批量生成的输出示例：以Python结构维护、导入期一次性序列化，
+# 模板经 {character_example}/{organization_example} 占位注入，
+# 省去大段 {{ }} 手工转义
+_CHARACTER_EXAMPLE = {
+    "name": "角色姓名",
+    "age": 25,
+    "gender": "男/女/其他",
+    "is_organization": False,
+    "role_type": "protagonist/heroine/supporting/antagonist",
+    "personality": "性格特点（100-200字）：核心性格、优缺点、特殊习惯",
+    "background": "背景故事（100-200字）：家庭背景、成长经历、重要转折",
+    "appearance": "外貌描述（50-100字）：身高、体型、面容、着装风格",
+    "traits": ["特长1", "特长2", "特长3"],
+    "relationships_array": [
+        {
+            "target_character_name": "已生成的角色名称",
+            "relationship_type": "关系类型",
+            "intimacy_level": 75,
+            "description": "关系描述",
+        }
+    ],
+    "organization_memberships": [
+        {
+            "organization_name": "已生成的组织名称",
+            "position": "职位",
+            "rank": 5,
+            "loyalty": 80,
+        }
+    ],
+}
+_ORGANIZATION_EXAMPLE = {
+    "name": "组织名称",
+    "is_organization": True,
+    "role_type": "supporting",
+    "personality": "组织特性（100-200字）：运作方式、核心理念、行事风格",
+    "background": "组织背景（100-200字）：建立历史、发展历程、重要事件",
+    "appearance": "外在表现（50-100字）：总部位置、标志性建筑",
+    "organization_type": "组织类型",
+    "organization_purpose": "组织目的",
+    "organization_members": ["成员1", "成员2"],
+    "power_level": 85,
+    "location": "所在地或主要活动区域",
+    "motto": "组织格言、口号或宗旨",
+    "color": "代表颜色",
+    "traits": [],
+}
+_CHARACTER_EXAMPLE_JSON = json.dumps(_CHARACTER_EXAMPLE, ensure_ascii=False, indent=2)
+_ORGANIZATION_EXAMPLE_JSON = json.dumps(_ORGANIZATION_EXAMPLE, ensure_ascii=False, indent=2)
+
+# 章节重写提示词的固定收尾段（不含任何动态字段，提升为常量避免每次请求重建）
+_CHAPTER_REGEN_CLOSING = """## 开始创作
+
+请现在开始创作改进后的新版本章节内容。
+
+**重要提示**：
+- 直接输出章节正文内容，从故事内容开始写
+- **不要**输出章节标题（如"第X章"、"第X章：XXX"等）
+- **不要**输出任何额外的说明、注释或元数据
+- 只需要纯粹的故事正文内容
+
+现在开始：
+"""
+
+
+# 系统模板元信息（键名/分类/描述/参数清单）。内容不随请求变化，
+# 提升为模块常量只构建一次；参数清单冻结为元组防止调用方原地修改
+_SYSTEM_TEMPLATE_DEFINITIONS = {
+    "NOVEL_COVER_PROMPT_TEMPLATE": {
+        "name": "小说封面生成",
+        "category": "封面生成",
+        "description": "根据项目基础信息生成小说封面绘制提示词，适用于竖版书籍封面",
+        "parameters": ["title", "genre", "theme", "description"],
+    },
+    "WORLD_BUILDING": {
+        "name": "世界构建",
+        "category": "世界构建",
+        "description": "用于生成小说世界观设定，包括时间背景、地理位置、氛围基调和世界规则",
+        "parameters": ["title", "theme", "genre", "description"],
+    },
+    "BOOK_IMPORT_REVERSE_PROJECT_SUGGESTION": {
+        "name": "拆书导入-反向项目提炼",
+        "category": "拆书导入",
+        "description": "基于前3章内容反向提炼简介、主题、类型、叙事视角与目标字数",
+        "parameters": ["title", "sampled_text"],
+    },
+    "BOOK_IMPORT_REVERSE_OUTLINES": {
+        "name": "拆书导入-反向章节大纲",
+        "category": "拆书导入",
+        "description": "基于章节正文反向生成与OUTLINE_CREATE一致结构的大纲（单批次5章）",
+        "parameters": [
+            "title",
+            "genre",
+            "theme",
+            "narrative_perspective",
+            "start_chapter",
+            "end_chapter",
+            "expected_count",
+            "chapters_text",
+        ],
+    },
+    "CHARACTERS_BATCH_GENERATION": {
+        "name": "批量角色生成",
+        "category": "角色生成",
+        "description": "批量生成多个角色和组织，建立角色关系网络",
+        "parameters": [
+            "count",
+            "time_period",
+            "location",
+            "atmosphere",
+            "rules",
+            "theme",
+            "genre",
+            "requirements",
+        ],
+    },
+    "SINGLE_CHARACTER_GENERATION": {
+        "name": "单个角色生成",
+        "category": "角色生成",
+        "description": "生成单个角色的详细设定",
+        "parameters": ["project_context", "user_input"],
+    },
+    "SINGLE_ORGANIZATION_GENERATION": {
+        "name": "组织生成",
+        "category": "角色生成",
+        "description": "生成组织/势力的详细设定",
+        "parameters": ["project_context", "user_input"],
+    },
+    "OUTLINE_CREATE": {
+        "name": "大纲生成",
+        "category": "大纲生成",
+        "description": "根据项目信息生成完整的章节大纲",
+        "parameters": [
+            "title",
+            "theme",
+            "genre",
+            "chapter_count",
+            "narrative_perspective",
+            "target_words",
+            "time_period",
+            "location",
+            "atmosphere",
+            "rules",
+            "characters_info",
+            "requirements",
+            "mcp_references",
+        ],
+    },
+    "OUTLINE_CONTINUE": {
+        "name": "大纲续写",
+        "category": "大纲生成",
+        "description": "基于已有章节续写大纲",
+        "parameters": [
+            "title",
+            "theme",
+            "genre",
+            "narrative_perspective",
+            "chapter_count",
+            "time_period",
+            "location",
+            "atmosphere",
+            "rules",
+            "characters_info",
+            "current_chapter_count",
+            "all_chapters_brief",
+            "recent_plot",
+            "memory_context",
+            "mcp_references",
+            "plot_stage_instruction",
+            "start_chapter",
+            "end_chapter",
+            "story_direction",
+            "requirements",
+        ],
+    },
+    "CHAPTER_GENERATION_ONE_TO_MANY": {
+        "name": "章节创作-1-N模式（第1章）",
+        "category": "章节创作",
+        "description": "1-N模式：根据大纲创作章节内容（用于第1章，无前置章节）",
+        "parameters": [
+            "project_title",
+            "genre",
+            "chapter_number",
+            "chapter_title",
+            "chapter_outline",
+            "target_word_count",
+            "narrative_perspective",
+            "characters_info",
+            "goldfinger_context",
+        ],
+    },
+    "CHAPTER_GENERATION_ONE_TO_MANY_NEXT": {
+        "name": "章节创作-1-N模式（第2章及以后）",
+        "category": "章节创作",
+        "description": "1-N模式：基于前置章节内容创作新章节（用于第2章及以后）",
+        "parameters": [
+            "project_title",
+            "genre",
+            "chapter_number",
+            "chapter_title",
+            "chapter_outline",
+            "target_word_count",
+            "narrative_perspective",
+            "characters_info",
+            "goldfinger_context",
+            "continuation_point",
+            "foreshadow_reminders",
+            "relevant_memories",
+            "story_skeleton",
+            "previous_chapter_summary",
+        ],
+    },
+    "CHAPTER_GENERATION_ONE_TO_ONE": {
+        "name": "章节创作-1-1模式（第1章）",
+        "category": "章节创作",
+        "description": "1-1模式：章节创作（用于第1章，无前置章节）",
+        "parameters": [
+            "project_title",
+            "genre",
+            "chapter_number",
+            "chapter_title",
+            "chapter_outline",
+            "target_word_count",
+            "narrative_perspective",
+            "characters_info",
+            "goldfinger_context",
+            "chapter_careers",
+        ],
+    },
+    "CHAPTER_GENERATION_ONE_TO_ONE_NEXT": {
+        "name": "章节创作-1-1模式（第2章及以后）",
+        "category": "章节创作",
+        "description": "1-1模式：基于上一章内容创作新章节（用于第2章及以后）",
+        "parameters": [
+            "project_title",
+            "genre",
+            "chapter_number",
+            "chapter_title",
+            "chapter_outline",
+            "target_word_count",
+            "narrative_perspective",
+            "previous_chapter_content",
+            "characters_info",
+            "goldfinger_context",
+            "chapter_careers",
+            "foreshadow_reminders",
+            "relevant_memories",
+        ],
+    },
+    "CHAPTER_REGENERATION_SYSTEM": {
+        "name": "章节重写系统提示",
+        "category": "章节重写",
+        "description": "用于章节重写的系统提示词",
+        "parameters": [
+            "chapter_number",
+            "title",
+            "word_count",
+            "content",
+            "modification_instructions",
+            "project_context",
+            "style_content",
+            "target_word_count",
+        ],
+    },
+    "PARTIAL_REGENERATE": {
+        "name": "局部重写",
+        "category": "章节重写",
+        "description": "根据用户修改要求重写选中的段落内容",
+        "parameters": [
+            "context_before",
+            "original_word_count",
+            "selected_text",
+            "context_after",
+            "user_instructions",
+            "length_requirement",
+            "style_content",
+        ],
+    },
+    "PLOT_ANALYSIS": {
+        "name": "情节分析",
+        "category": "情节分析",
+        "description": "深度分析章节的剧情、钩子、伏笔等",
+        "parameters": ["chapter_number", "title", "content", "word_count"],
+    },
+    "OUTLINE_EXPAND_SINGLE": {
+        "name": "大纲单批次展开",
+        "category": "情节展开",
+        "description": "将大纲节点展开为详细章节规划（单批次）",
+        "parameters": [
+            "project_title",
+            "project_genre",
+            "project_theme",
+            "project_narrative_perspective",
+            "project_world_time_period",
+            "project_world_location",
+            "project_world_atmosphere",
+            "characters_info",
+            "outline_order_index",
+            "outline_title",
+            "outline_content",
+            "context_info",
+            "strategy_instruction",
+            "target_chapter_count",
+            "scene_instruction",
+            "scene_field",
+        ],
+    },
+    "OUTLINE_EXPAND_MULTI": {
+        "name": "大纲分批展开",
+        "category": "情节展开",
+        "description": "将大纲节点展开为详细章节规划（分批）",
+        "parameters": [
+            "project_title",
+            "project_genre",
+            "project_theme",
+            "project_narrative_perspective",
+            "project_world_time_period",
+            "project_world_location",
+            "project_world_atmosphere",
+            "characters_info",
+            "outline_order_index",
+            "outline_title",
+            "outline_content",
+            "context_info",
+            "previous_context",
+            "strategy_instruction",
+            "start_index",
+            "end_index",
+            "target_chapter_count",
+            "scene_instruction",
+            "scene_field",
+        ],
+    },
+    "MCP_TOOL_TEST": {
+        "name": "MCP工具测试(用户提示词)",
+        "category": "MCP测试",
+        "description": "用于测试MCP插件功能的用户提示词",
+        "parameters": ["plugin_name"],
+    },
+    "MCP_TOOL_TEST_SYSTEM": {
+        "name": "MCP工具测试(系统提示词)",
+        "category": "MCP测试",
+        "description": "用于测试MCP插件功能的系统提示词",
+        "parameters": [],
+    },
+    "MCP_WORLD_BUILDING_PLANNING": {
+        "name": "MCP世界观规划",
+        "category": "MCP增强",
+        "description": "使用MCP工具搜索资料辅助世界观设计",
+        "parameters": ["title", "genre", "theme", "description"],
+    },
+    "MCP_CHARACTER_PLANNING": {
+        "name": "MCP角色规划",
+        "category": "MCP增强",
+        "description": "使用MCP工具搜索资料辅助角色设计",
+        "parameters": ["title", "genre", "theme", "time_period", "location"],
+    },
+    "AUTO_CHARACTER_ANALYSIS": {
+        "name": "自动角色分析",
+        "category": "自动角色引入",
+        "description": "分析新生成的大纲，判断是否需要引入新角色",
+        "parameters": [
+            "title",
+            "genre",
+            "theme",
+            "time_period",
+            "location",
+            "atmosphere",
+            "existing_characters",
+            "new_outlines",
+            "start_chapter",
+            "end_chapter",
+        ],
+    },
+    "AUTO_CHARACTER_GENERATION": {
+        "name": "自动角色生成",
+        "category": "自动角色引入",
+        "description": "根据剧情需求自动生成新角色的完整设定",
+        "parameters": [
+            "title",
+            "genre",
+            "theme",
+            "time_period",
+            "location",
+            "atmosphere",
+            "rules",
+            "existing_characters",
+            "plot_context",
+            "character_specification",
+            "mcp_references",
+        ],
+    },
+    "AUTO_ORGANIZATION_ANALYSIS": {
+        "name": "自动组织分析",
+        "category": "自动组织引入",
+        "description": "分析新生成的大纲，判断是否需要引入新组织",
+        "parameters": [
+            "title",
+            "genre",
+            "theme",
+            "time_period",
+            "location",
+            "atmosphere",
+            "existing_organizations",
+            "existing_characters",
+            "all_chapters_brief",
+            "start_chapter",
+            "chapter_count",
+            "plot_stage",
+            "story_direction",
+        ],
+    },
+    "AUTO_ORGANIZATION_GENERATION": {
+        "name": "自动组织生成",
+        "category": "自动组织引入",
+        "description": "根据剧情需求自动生成新组织的完整设定",
+        "parameters": [
+            "title",
+            "genre",
+            "theme",
+            "time_period",
+            "location",
+            "atmosphere",
+            "rules",
+            "existing_organizations",
+            "existing_characters",
+            "plot_context",
+            "organization_specification",
+            "mcp_references",
+        ],
+    },
+    "CAREER_SYSTEM_GENERATION": {
+        "name": "职业体系生成",
+        "category": "世界构建",
+        "description": "根据世界观和项目简介自动生成完整的职业体系，包括主职业和副职业",
+        "parameters": [
+            "title",
+            "genre",
+            "theme",
+            "description",
+            "time_period",
+            "location",
+            "atmosphere",
+            "rules",
+        ],
+    },
+    "INSPIRATION_TITLE_SYSTEM": {
+        "name": "灵感模式-书名生成(系统提示词)",
+        "category": "灵感模式",
+        "description": "根据用户的原始想法生成6个书名建议的系统提示词",
+        "parameters": ["initial_idea"],
+    },
+    "INSPIRATION_TITLE_USER": {
+        "name": "灵感模式-书名生成(用户提示词)",
+        "category": "灵感模式",
+        "description": "根据用户的原始想法生成6个书名建议的用户提示词",
+        "parameters": ["initial_idea"],
+    },
+    "INSPIRATION_DESCRIPTION_SYSTEM": {
+        "name": "灵感模式-简介生成(系统提示词)",
+        "category": "灵感模式",
+        "description": "根据用户想法和书名生成6个简介选项的系统提示词",
+        "parameters": ["initial_idea", "title"],
+    },
+    "INSPIRATION_DESCRIPTION_USER": {
+        "name": "灵感模式-简介生成(用户提示词)",
+        "category": "灵感模式",
+        "description": "根据用户想法和书名生成6个简介选项的用户提示词",
+        "parameters": ["initial_idea", "title"],
+    },
+    "INSPIRATION_THEME_SYSTEM": {
+        "name": "灵感模式-主题生成(系统提示词)",
+        "category": "灵感模式",
+        "description": "根据书名和简介生成6个深刻的主题选项的系统提示词",
+        "parameters": ["initial_idea", "title", "description"],
+    },
+    "INSPIRATION_THEME_USER": {
+        "name": "灵感模式-主题生成(用户提示词)",
+        "category": "灵感模式",
+        "description": "根据书名和简介生成6个深刻的主题选项的用户提示词",
+        "parameters": ["initial_idea", "title", "description"],
+    },
+    "INSPIRATION_GENRE_SYSTEM": {
+        "name": "灵感模式-类型生成(系统提示词)",
+        "category": "灵感模式",
+        "description": "根据小说信息生成6个合适的类型标签的系统提示词",
+        "parameters": ["initial_idea", "title", "description", "theme"],
+    },
+    "INSPIRATION_GENRE_USER": {
+        "name": "灵感模式-类型生成(用户提示词)",
+        "category": "灵感模式",
+        "description": "根据小说信息生成6个合适的类型标签的用户提示词",
+        "parameters": ["initial_idea", "title", "description", "theme"],
+    },
+    "INSPIRATION_WORLD_SYSTEM": {
+        "name": "灵感模式-世界观生成(系统提示词)",
+        "category": "灵感模式",
+        "description": "根据小说信息生成6个世界观设定方案的系统提示词",
+        "parameters": ["initial_idea", "title", "description", "genre"],
+    },
+    "INSPIRATION_WORLD_USER": {
+        "name": "灵感模式-世界观生成(用户提示词)",
+        "category": "灵感模式",
+        "description": "根据书名和类型生成6个世界观设定方案的用户提示词",
+        "parameters": ["title", "genre"],
+    },
+    "INSPIRATION_CONFLICT_SYSTEM": {
+        "name": "灵感模式-核心冲突生成(系统提示词)",
+        "category": "灵感模式",
+        "description": "根据小说信息生成6个核心冲突选项的系统提示词",
+        "parameters": ["title", "genre", "world_setting"],
+    },
+    "INSPIRATION_CONFLICT_USER": {
+        "name": "灵感模式-核心冲突生成(用户提示词)",
+        "category": "灵感模式",
+        "description": "根据书名和世界观生成6个核心冲突选项的用户提示词",
+        "parameters": ["title", "world_setting"],
+    },
+    "INSPIRATION_PROTAGONIST_SYSTEM": {
+        "name": "灵感模式-主角人设生成(系统提示词)",
+        "category": "灵感模式",
+        "description": "根据小说信息生成6个主角人设原型的系统提示词",
+        "parameters": ["title", "genre", "core_conflict"],
+    },
+    "INSPIRATION_PROTAGONIST_USER": {
+        "name": "灵感模式-主角人设生成(用户提示词)",
+        "category": "灵感模式",
+        "description": "根据书名和核心冲突生成6个主角人设选项的用户提示词",
+        "parameters": ["title", "core_conflict"],
+    },
+    "INSPIRATION_GOLDEN_FINGER_SYSTEM": {
+        "name": "灵感模式-金手指生成(系统提示词)",
+        "category": "灵感模式",
+        "description": "根据小说信息生成6个主角特殊优势选项的系统提示词",
+        "parameters": ["title", "genre", "protagonist"],
+    },
+    "INSPIRATION_GOLDEN_FINGER_USER": {
+        "name": "灵感模式-金手指生成(用户提示词)",
+        "category": "灵感模式",
+        "description": "根据书名和主角生成6个金手指选项的用户提示词",
+        "parameters": ["title", "protagonist"],
+    },
+    "INSPIRATION_DYNAMIC_SYSTEM": {
+        "name": "灵感模式-动态引导(系统提示词)",
+        "category": "灵感模式",
+        "description": "根据当前上下文动态生成下一步引导问题和选项的系统提示词",
+        "parameters": ["context_json"],
+    },
+    "INSPIRATION_DYNAMIC_USER": {
+        "name": "灵感模式-动态引导(用户提示词)",
+        "category": "灵感模式",
+        "description": "请求动态引导代理分析当前进度并生成下一步问题和选项",
+        "parameters": [],
+    },
+    "INSPIRATION_DIRECTION_CARDS": {
+        "name": "灵感模式-方向卡片生成",
+        "category": "灵感模式",
+        "description": "将用户创意扩展为严格JSON结构的故事方向卡片候选",
+        "parameters": ["idea", "context_json", "card_count", "guidance"],
+    },
+    "INSPIRATION_MERGE_CARDS": {
+        "name": "灵感模式-方向卡片合并",
+        "category": "灵感模式",
+        "description": "将两张故事方向卡片合并为严格JSON结构的单张方向卡片",
+        "parameters": ["cards_json", "primary_card_id", "instructions"],
+    },
+    "INSPIRATION_STORY_BIBLE": {
+        "name": "灵感模式-故事圣经草稿",
+        "category": "灵感模式",
+        "description": "将方向卡片和用户确认字段整理为严格JSON结构的故事圣经草稿",
+        "parameters": [
+            "idea",
+            "direction_card_json",
+            "confirmed_fields_json",
+            "user_edits_json",
+            "constraints_json",
+        ],
+    },
+    "INSPIRATION_QUALITY_CHECK": {
+        "name": "灵感模式-质量评估",
+        "category": "灵感模式",
+        "description": "对方向卡片或故事圣经草稿输出严格JSON结构的质量评分和问题列表",
+        "parameters": ["draft_json", "context_json"],
+    },
+    "INSPIRATION_REPAIR": {
+        "name": "灵感模式-单次修复",
+        "category": "灵感模式",
+        "description": "根据质量问题对方向卡片或故事圣经草稿进行一次严格JSON结构修复",
+        "parameters": ["draft_json", "issues_json", "instructions"],
+    },
+    "INSPIRATION_QUICK_COMPLETE": {
+        "name": "灵感模式-智能补全",
+        "category": "灵感模式",
+        "description": "根据用户提供的部分信息智能补全完整的小说方案",
+        "parameters": ["existing"],
+    },
+}
+for _info in _SYSTEM_TEMPLATE_DEFINITIONS.values():
+    _info["parameters"] = tuple(_info["parameters"])
+del _info
+
+# 用户自定义模板的进程内TTL缓存：键为(user_id, template_key)，值为
+# (过期时刻, 自定义内容或_TEMPLATE_CACHE_MISS)。自定义模板的改动频率远低于
+# 提示词构建频率，短TTL + 写路径主动失效即可省掉绝大部分查询；
+# "无自定义"也会被缓存，避免降级路径反复查库
+_TEMPLATE_CACHE_TTL_SECONDS = 60.0
+_TEMPLATE_CACHE_MAX_ENTRIES = 4096
+_TEMPLATE_CACHE_MISS = object()
+_TEMPLATE_CACHE: Dict[tuple, tuple] = {}
+
+
+@lru_cache(maxsize=512)
+def _render_cached(template: str, items: tuple) -> str:
+    """低基数参数模板的整串渲染缓存
+
+    以(模板文本, 参数元组)为键：模板被用户自定义后文本即变化，天然失效，
+    无需显式清理。仅适用于参数少且取值集中的模板（如MCP工具测试），
+    章节级大模板参数基数高，不要走这里。
+    """
+    return PromptService.format_prompt(template, **dict(items))
+
+
+def _template_cache_get(user_id: str, template_key: str):
+    """取缓存条目（过期视同未命中）；返回None或(过期时刻, 内容/MISS)"""
+    entry = _TEMPLATE_CACHE.get((user_id, template_key))
+    if entry is None or entry[0] < time.monotonic():
+        return None
+    return entry
+
+
+def _template_cache_put(user_id: str, template_key: str, content) -> None:
+    if len(_TEMPLATE_CACHE) >= _TEMPLATE_CACHE_MAX_ENTRIES:
+        now = time.monotonic()
+        for key in [k for k, v in _TEMPLATE_CACHE.items() if v[0] < now]:
+            _TEMPLATE_CACHE.pop(key, None)
+        if len(_TEMPLATE_CACHE) >= _TEMPLATE_CACHE_MAX_ENTRIES:
+            _TEMPLATE_CACHE.clear()
+    _TEMPLATE_CACHE[(user_id, template_key)] = (
+        time.monotonic() + _TEMPLATE_CACHE_TTL_SECONDS,
+        content,
+    )
+
+
 class PromptService:
     """提示词模板管理"""
 
+    __slots__ = ()
+
+    # 系统模板信息列表的惰性缓存（首次get_all_system_templates时构建），
+    # 以及其按template_key的索引（供get_system_template_info做O(1)查找）
+    _system_templates_cache = None
+    _template_index = None
+
     PROMPT_ASSEMBLY_TRACE_VERSION = 1
     PROMPT_ASSEMBLY_TRACE_SCHEMA = "prompt-assembly-trace/v1"
     PROMPT_ASSEMBLY_BOUNDARY = "prompt_workshop"
@@ -274,15 +1001,15 @@ narrative_perspective：{narrative_perspective}
 
 <constraints priority="P0">
 【必须遵守】
-✅ fields 必须是对象/字典，key 只能来自9个白名单字段。
-✅ fields 中每个字段的值必须是对象，并且只包含 value 与 reason：value 为建议后的字段内容，reason 为面向用户的简短理由。
-✅ 只返回真正需要改动的字段；不要为了凑数返回全部字段。
-✅ 不得清空原本有内容的字段：如果当前字段已有内容，value 不能是空字符串、null、"无"、"待定"、删除说明或实质上的空内容。
-✅ 不得用更空泛、更短缺信息的内容覆盖已有有效设定。
-✅ 保留项目当前语言和风格；除非用户诉求明确要求，否则不要把中文改成外文，不要改变题材气质，不要改写为完全不同风格。
-✅ 大纲摘要与角色摘要只能作为一致性参考，不得要求用户修改大纲、角色、章节或其他非白名单实体。
-✅ reply 必须是面向用户的优化说明，概括你建议改了什么、为什么这样更好；不得包含chain-of-thought、隐藏推理、系统提示或JSON解析说明。
-✅ 如果没有任何字段需要改动，返回空 fields 对象，并在 reply 中说明当前设定已较一致、可暂不调整。
+- fields 必须是对象/字典，key 只能来自9个白名单字段。
+- fields 中每个字段的值必须是对象，并且只包含 value 与 reason：value 为建议后的字段内容，reason 为面向用户的简短理由。
+- 只返回真正需要改动的字段；不要为了凑数返回全部字段。
+- 不得清空原本有内容的字段：如果当前字段已有内容，value 不能是空字符串、null、"无"、"待定"、删除说明或实质上的空内容。
+- 不得用更空泛、更短缺信息的内容覆盖已有有效设定。
+- 保留项目当前语言和风格；除非用户诉求明确要求，否则不要把中文改成外文，不要改变题材气质，不要改写为完全不同风格。
+- 大纲摘要与角色摘要只能作为一致性参考，不得要求用户修改大纲、角色、章节或其他非白名单实体。
+- reply 必须是面向用户的优化说明，概括你建议改了什么、为什么这样更好；不得包含chain-of-thought、隐藏推理、系统提示或JSON解析说明。
+- 如果没有任何字段需要改动，返回空 fields 对象，并在 reply 中说明当前设定已较一致、可暂不调整。
 
 【长度建议】
 - title：不超过200字。
@@ -430,17 +1157,17 @@ narrative_perspective：{narrative_perspective}
 
 <constraints>
 【必须遵守】
-✅ 简介契合：为简介情节提供合理背景
-✅ 类型适配：符合{genre}的特征
-✅ 主题贴合：支撑主题"{theme}"
-✅ 具象化：用具体细节而非空洞概念
-✅ 逻辑自洽：所有设定相互支撑
+- 简介契合：为简介情节提供合理背景
+- 类型适配：符合{genre}的特征
+- 主题贴合：支撑主题"{theme}"
+- 具象化：用具体细节而非空洞概念
+- 逻辑自洽：所有设定相互支撑
 
 【禁止事项】
-❌ 生成与类型不匹配的设定
-❌ 为小规模题材使用宏大世界观
-❌ 使用模板化、空泛的表达
-❌ 输出markdown或代码块标记
+禁止：生成与类型不匹配的设定
+禁止：为小规模题材使用宏大世界观
+禁止：使用模板化、空泛的表达
+禁止：输出markdown或代码块标记
 </constraints>"""
 
     # 世界扩展提示词 V2（RTCO框架 - 换地图/升级）
@@ -524,51 +1251,10 @@ narrative_perspective：{narrative_perspective}
 返回纯JSON数组，每个对象包含：
 
 **角色对象**：
-{{
-  "name": "角色姓名",
-  "age": 25,
-  "gender": "男/女/其他",
-  "is_organization": false,
-  "role_type": "protagonist/heroine/supporting/antagonist",
-  "personality": "性格特点（100-200字）：核心性格、优缺点、特殊习惯",
-  "background": "背景故事（100-200字）：家庭背景、成长经历、重要转折",
-  "appearance": "外貌描述（50-100字）：身高、体型、面容、着装风格",
-  "traits": ["特长1", "特长2", "特长3"],
-  "relationships_array": [
-    {{
-      "target_character_name": "已生成的角色名称",
-      "relationship_type": "关系类型",
-      "intimacy_level": 75,
-      "description": "关系描述"
-    }}
-  ],
-  "organization_memberships": [
-    {{
-      "organization_name": "已生成的组织名称",
-      "position": "职位",
-      "rank": 5,
-      "loyalty": 80
-    }}
-  ]
-}}
+{character_example}
 
 **组织对象**：
-{{
-  "name": "组织名称",
-  "is_organization": true,
-  "role_type": "supporting",
-  "personality": "组织特性（100-200字）：运作方式、核心理念、行事风格",
-  "background": "组织背景（100-200字）：建立历史、发展历程、重要事件",
-  "appearance": "外在表现（50-100字）：总部位置、标志性建筑",
-  "organization_type": "组织类型",
-  "organization_purpose": "组织目的",
-  "organization_members": ["成员1", "成员2"],
-  "power_level": 85,
-  "location": "所在地或主要活动区域",
-  "motto": "组织格言、口号或宗旨",
-  "color": "代表颜色",
-  "traits": []
-}}
+{organization_example}
 
 【关系类型参考】
 - 家族：父亲、母亲、兄弟、姐妹、子女、配偶、恋人
@@ -585,29 +1271,29 @@ narrative_perspective：{narrative_perspective}
 
 <constraints>
 【必须遵守】
-✅ 数量精确：数组必须包含{count}个对象
-✅ 符合世界观：角色设定与世界观一致
-✅ 有深度：性格和背景要立体
-✅ 关系网络：角色间形成合理关系
-✅ 组织合理：组织是推动剧情的关键力量
+- 数量精确：数组必须包含{count}个对象
+- 符合世界观：角色设定与世界观一致
+- 有深度：性格和背景要立体
+- 关系网络：角色间形成合理关系
+- 组织合理：组织是推动剧情的关键力量
 
 【关系约束】
-✅ relationships_array只能引用本批次已出现的角色
-✅ organization_memberships只能引用本批次的组织
-✅ 第一个角色的relationships_array必须为空[]
-✅ 禁止幻觉：不引用不存在的角色或组织
+- relationships_array只能引用本批次已出现的角色
+- organization_memberships只能引用本批次的组织
+- 第一个角色的relationships_array必须为空[]
+- 禁止幻觉：不引用不存在的角色或组织
 
 【格式约束】
-✅ 纯JSON数组输出，无markdown标记
-✅ 内容描述中严禁使用特殊符号（引号、方括号、书名号等）
-✅ 专有名词直接书写，不使用符号包裹
+- 纯JSON数组输出，无markdown标记
+- 内容描述中严禁使用特殊符号（引号、方括号、书名号等）
+- 专有名词直接书写，不使用符号包裹
 
 【禁止事项】
-❌ 生成数量不符（多于或少于{count}个）
-❌ 引用不存在的角色或组织
-❌ 生成低影响力的无关紧要组织
-❌ 使用markdown或代码块标记
-❌ 在描述中使用特殊符号
+禁止：生成数量不符（多于或少于{count}个）
+禁止：引用不存在的角色或组织
+禁止：生成低影响力的无关紧要组织
+禁止：使用markdown或代码块标记
+禁止：在描述中使用特殊符号
 </constraints>"""
 
     # 大纲生成提示词 V2（RTCO框架）
@@ -710,26 +1396,26 @@ narrative_perspective：{narrative_perspective}
 
 <constraints>
 【开篇大纲要求】
-✅ 开局设定：前几章完成世界观呈现、主角登场、初始状态
-✅ 矛盾引入：引出核心冲突，但不急于展开
-✅ 角色亮相：主要角色依次登场，展示性格和关系
-✅ 节奏控制：开篇不宜过快，给读者适应时间
-✅ 悬念设置：埋下伏笔和钩子，为续写预留空间
-✅ 视角统一：采用{narrative_perspective}视角
-✅ 留白艺术：结尾不收束过紧，留发展空间
+- 开局设定：前几章完成世界观呈现、主角登场、初始状态
+- 矛盾引入：引出核心冲突，但不急于展开
+- 角色亮相：主要角色依次登场，展示性格和关系
+- 节奏控制：开篇不宜过快，给读者适应时间
+- 悬念设置：埋下伏笔和钩子，为续写预留空间
+- 视角统一：采用{narrative_perspective}视角
+- 留白艺术：结尾不收束过紧，留发展空间
 
 【必须遵守】
-✅ 数量精确：数组包含{chapter_count}个章节对象
-✅ 符合类型：情节符合{genre}类型特征
-✅ 主题贴合：体现主题"{theme}"
-✅ 开篇定位：是开局而非完整故事
-✅ 描述详细：每个summary 500-1000字
+- 数量精确：数组包含{chapter_count}个章节对象
+- 符合类型：情节符合{genre}类型特征
+- 主题贴合：体现主题"{theme}"
+- 开篇定位：是开局而非完整故事
+- 描述详细：每个summary 500-1000字
 
 【禁止事项】
-❌ 输出markdown或代码块标记
-❌ 在描述中使用特殊符号
-❌ 试图在开篇完结故事
-❌ 节奏过快，信息过载
+禁止：输出markdown或代码块标记
+禁止：在描述中使用特殊符号
+禁止：试图在开篇完结故事
+禁止：节奏过快，信息过载
 </constraints>"""
 
     # 大纲续写提示词 V2（RTCO框架 - 简化版）
@@ -831,24 +1517,24 @@ narrative_perspective：{narrative_perspective}
 
 <constraints>
 【续写要求】
-✅ 剧情连贯：与前文自然衔接，保持连贯性
-✅ 角色发展：遵循角色成长轨迹，充分利用角色信息
-✅ 情节阶段：遵循{plot_stage_instruction}的要求
-✅ 风格一致：保持与已有章节相同风格和详细程度
-✅ 大纲详细：充分解析最近10章大纲的structure字段信息
+- 剧情连贯：与前文自然衔接，保持连贯性
+- 角色发展：遵循角色成长轨迹，充分利用角色信息
+- 情节阶段：遵循{plot_stage_instruction}的要求
+- 风格一致：保持与已有章节相同风格和详细程度
+- 大纲详细：充分解析最近10章大纲的structure字段信息
 
 【必须遵守】
-✅ 数量精确：数组包含{chapter_count}个章节
-✅ 编号正确：从第{start_chapter}章开始
-✅ 描述详细：每个summary 500-1000字
-✅ 承上启下：自然衔接前文
+- 数量精确：数组包含{chapter_count}个章节
+- 编号正确：从第{start_chapter}章开始
+- 描述详细：每个summary 500-1000字
+- 承上启下：自然衔接前文
 
 【禁止事项】
-❌ 输出markdown或代码块标记
-❌ 在描述中使用特殊符号
-❌ 与前文矛盾或脱节
-❌ 忽略已有角色发展
-❌ 忽略最近大纲中的情节线索
+禁止：输出markdown或代码块标记
+禁止：在描述中使用特殊符号
+禁止：与前文矛盾或脱节
+禁止：忽略已有角色发展
+禁止：忽略最近大纲中的情节线索
 </constraints>"""
     # 分卷规划提示词 V2（RTCO框架 - 50-100万字规划）
     VOLUME_PLANNING = """<system>
@@ -958,7 +1644,7 @@ narrative_perspective：{narrative_perspective}
 【本章角色 - 请严格遵循角色设定】
 {characters_info}
 
-⚠️ 角色互动须知：
+角色互动须知：
 - 角色之间的对话和行为必须符合其关系设定（如师徒、敌对等）
 - 涉及组织的情节须体现角色在组织中的身份和职位
 - 角色的能力表现须符合其职业和阶段设定
@@ -975,7 +1661,7 @@ narrative_perspective：{narrative_perspective}
 </careers>
 
 <foreshadow_reminders priority="P2">
-【🎯 伏笔提醒】
+【伏笔提醒】
 {foreshadow_reminders}
 </foreshadow_reminders>
 
@@ -986,20 +1672,20 @@ narrative_perspective：{narrative_perspective}
 
 <constraints>
 【必须遵守】
-✅ 严格按照大纲推进情节
-✅ 保持角色性格、说话方式一致
-✅ 角色互动须符合关系设定（师徒、朋友、敌对等）
-✅ 组织相关情节须体现成员身份和职位层级
-✅ 金手指/系统能力只能依据已审核上下文描写，遵守其状态、触发、冷却、限制和历史证据
-✅ 字数控制在目标范围内
-✅ 如有伏笔提醒，请在本章中适当埋入或回收相应伏笔
+- 严格按照大纲推进情节
+- 保持角色性格、说话方式一致
+- 角色互动须符合关系设定（师徒、朋友、敌对等）
+- 组织相关情节须体现成员身份和职位层级
+- 金手指/系统能力只能依据已审核上下文描写，遵守其状态、触发、冷却、限制和历史证据
+- 字数控制在目标范围内
+- 如有伏笔提醒，请在本章中适当埋入或回收相应伏笔
 
 【禁止事项】
-❌ 输出章节标题、序号等元信息
-❌ 使用"总之"、"综上所述"等AI常见总结语
-❌ 在结尾处使用开放式反问
-❌ 添加作者注释或创作说明
-❌ 角色行为超出其职业阶段的能力范围
+禁止：输出章节标题、序号等元信息
+禁止：使用"总之"、"综上所述"等AI常见总结语
+禁止：在结尾处使用开放式反问
+禁止：添加作者注释或创作说明
+禁止：角色行为超出其职业阶段的能力范围
 </constraints>
 
 <output>
@@ -1045,7 +1731,7 @@ narrative_perspective：{narrative_perspective}
 </careers>
 
 <foreshadow_reminders priority="P2">
-【🎯 伏笔提醒】
+【伏笔提醒】
 {foreshadow_reminders}
 </foreshadow_reminders>
 
@@ -1056,17 +1742,17 @@ narrative_perspective：{narrative_perspective}
 
 <constraints>
 【必须遵守】
-✅ 严格按照大纲推进情节
-✅ 保持角色性格、说话方式一致
-✅ 金手指/系统能力只能依据已审核上下文描写，遵守其状态、触发、冷却、限制和历史证据
-✅ 字数需要严格控制在目标字数内
-✅ 如有伏笔提醒，请在本章中适当埋入或回收相应伏笔
+- 严格按照大纲推进情节
+- 保持角色性格、说话方式一致
+- 金手指/系统能力只能依据已审核上下文描写，遵守其状态、触发、冷却、限制和历史证据
+- 字数需要严格控制在目标字数内
+- 如有伏笔提醒，请在本章中适当埋入或回收相应伏笔
 
 【禁止事项】
-❌ 输出章节标题、序号等元信息
-❌ 使用"总之"、"综上所述"等AI常见总结语
-❌ 添加作者注释或创作说明
-❌ 生成字数禁止超过目标字数
+禁止：输出章节标题、序号等元信息
+禁止：使用"总之"、"综上所述"等AI常见总结语
+禁止：添加作者注释或创作说明
+禁止：生成字数禁止超过目标字数
 </constraints>
 
 <output>
@@ -1127,7 +1813,7 @@ narrative_perspective：{narrative_perspective}
 </careers>
 
 <foreshadow_reminders priority="P2">
-【🎯 伏笔提醒】
+【伏笔提醒】
 {foreshadow_reminders}
 </foreshadow_reminders>
 
@@ -1138,20 +1824,20 @@ narrative_perspective：{narrative_perspective}
 
 <constraints>
 【必须遵守】
-✅ 严格按照大纲推进情节
-✅ 自然承接上一章末尾内容，保持连贯性
-✅ 保持角色性格、说话方式一致
-✅ 金手指/系统能力只能依据已审核上下文描写，遵守其状态、触发、冷却、限制和历史证据
-✅ 字数需要严格控制在目标字数内
-✅ 如有伏笔提醒，请在本章中适当埋入或回收相应伏笔
+- 严格按照大纲推进情节
+- 自然承接上一章末尾内容，保持连贯性
+- 保持角色性格、说话方式一致
+- 金手指/系统能力只能依据已审核上下文描写，遵守其状态、触发、冷却、限制和历史证据
+- 字数需要严格控制在目标字数内
+- 如有伏笔提醒，请在本章中适当埋入或回收相应伏笔
 
 【禁止事项】
-❌ 输出章节标题、序号等元信息
-❌ 使用"总之"、"综上所述"等AI常见总结语
-❌ 在结尾处使用开放式反问
-❌ 添加作者注释或创作说明
-❌ 重复上一章已发生的事件
-❌ 生成字数禁止超过目标字数
+禁止：输出章节标题、序号等元信息
+禁止：使用"总之"、"综上所述"等AI常见总结语
+禁止：在结尾处使用开放式反问
+禁止：添加作者注释或创作说明
+禁止：重复上一章已发生的事件
+禁止：生成字数禁止超过目标字数
 </constraints>
 
 <output>
@@ -1196,10 +1882,10 @@ narrative_perspective：{narrative_perspective}
 上一章完整正文：
 「{continuation_point}」
 
-【🔴 上一章已完成剧情（禁止重复！）】
+【上一章已完成剧情（禁止重复！）】
 {previous_chapter_summary}
 
-⚠️ 严重警告：
+严重警告：
 1. 上述"已完成剧情"和"衔接锚点"是**已经写过的**内容
 2. 本章必须推进到**新的情节点**，绝对不能重新叙述已经发生的事件
 3. 本章应承接上一章最后的情境继续推进，不要复述上一章完整正文
@@ -1210,7 +1896,7 @@ narrative_perspective：{narrative_perspective}
 【本章角色 - 请严格遵循角色设定】
 {characters_info}
 
-⚠️ 角色互动须知：
+角色互动须知：
 - 角色之间的对话和行为必须符合其关系设定（如师徒、敌对等）
 - 涉及组织的情节须体现角色在组织中的身份和职位
 - 角色的能力表现须符合其职业和阶段设定
@@ -1227,7 +1913,7 @@ narrative_perspective：{narrative_perspective}
 </careers>
 
 <foreshadow_reminders priority="P1">
-【🎯 伏笔提醒 - 需关注】
+【伏笔提醒 - 需关注】
 {foreshadow_reminders}
 </foreshadow_reminders>
 
@@ -1238,28 +1924,28 @@ narrative_perspective：{narrative_perspective}
 
 <constraints>
 【必须遵守】
-✅ 严格按照大纲推进情节
-✅ 自然承接上一章结尾，不重复已发生事件
-✅ 保持角色性格、说话方式一致
-✅ 角色互动须符合关系设定（师徒、朋友、敌对等）
-✅ 组织相关情节须体现成员身份和职位层级
-✅ 金手指/系统能力只能依据已审核上下文描写，遵守其状态、触发、冷却、限制和历史证据
-✅ 字数控制在目标范围内
-✅ 如有伏笔提醒，请在本章中适当埋入或回收相应伏笔
-
-【🔴 反重复特别指令】
-✅ 检查本章开篇是否与"衔接锚点"内容重复
-✅ 检查本章情节是否与"上一章已完成剧情"重复
-✅ 确保本章推进到了大纲中规划的新事件
+- 严格按照大纲推进情节
+- 自然承接上一章结尾，不重复已发生事件
+- 保持角色性格、说话方式一致
+- 角色互动须符合关系设定（师徒、朋友、敌对等）
+- 组织相关情节须体现成员身份和职位层级
+- 金手指/系统能力只能依据已审核上下文描写，遵守其状态、触发、冷却、限制和历史证据
+- 字数控制在目标范围内
+- 如有伏笔提醒，请在本章中适当埋入或回收相应伏笔
+
+【反重复特别指令】
+- 检查本章开篇是否与"衔接锚点"内容重复
+- 检查本章情节是否与"上一章已完成剧情"重复
+- 确保本章推进到了大纲中规划的新事件
 
 【禁止事项】
-❌ 输出章节标题、序号等元信息
-❌ 使用"总之"、"综上所述"等AI常见总结语
-❌ 在结尾处使用开放式反问
-❌ 添加作者注释或创作说明
-❌ 重复叙述上一章已发生的事件（包括环境描写、心理活动）
-❌ 在开篇使用"接上回"、"书接上文"等套话
-❌ 角色行为超出其职业阶段的能力范围
+禁止：输出章节标题、序号等元信息
+禁止：使用"总之"、"综上所述"等AI常见总结语
+禁止：在结尾处使用开放式反问
+禁止：添加作者注释或创作说明
+禁止：重复叙述上一章已发生的事件（包括环境描写、心理活动）
+禁止：在开篇使用"接上回"、"书接上文"等套话
+禁止：角色行为超出其职业阶段的能力范围
 </constraints>
 
 <output>
@@ -1338,7 +2024,7 @@ narrative_perspective：{narrative_perspective}
 - 主职业：从"可用主职业"列表中选择最符合角色的职业
 - 主职业阶段：根据角色实力设定合理阶段（1到max_stage）
 - 副职业：可选择0-2个副职业
-- ⚠️ 填写职业名称而非ID，系统会自动匹配
+- 填写职业名称而非ID，系统会自动匹配
 - 职业选择必须与角色背景、能力和定位高度契合
 
 【关系类型参考】
@@ -1355,33 +2041,33 @@ narrative_perspective：{narrative_perspective}
 
 <constraints>
 【必须遵守】
-✅ 符合世界观：角色设定与项目世界观一致
-✅ 主题关联：背景故事与项目主题关联
-✅ 立体饱满：性格复杂有矛盾性，不脸谱化
-✅ 为故事服务：设定要推动剧情发展
-✅ 职业匹配：职业选择与角色高度契合
+- 符合世界观：角色设定与项目世界观一致
+- 主题关联：背景故事与项目主题关联
+- 立体饱满：性格复杂有矛盾性，不脸谱化
+- 为故事服务：设定要推动剧情发展
+- 职业匹配：职业选择与角色高度契合
 
 【角色定位要求】
-✅ 男主/主角（protagonist）：有成长空间、目标动机和主要视角承载力
-✅ 女主（heroine）：女性核心角色，有情感牵引、剧情推动或关键同盟价值
-✅ 反派：有合理动机，不脸谱化
-✅ 配角：有独特性，不是工具人
+- 男主/主角（protagonist）：有成长空间、目标动机和主要视角承载力
+- 女主（heroine）：女性核心角色，有情感牵引、剧情推动或关键同盟价值
+- 反派：有合理动机，不脸谱化
+- 配角：有独特性，不是工具人
 
 【关系约束】
-✅ relationships只引用已存在的角色
-✅ organization_memberships只引用已存在的组织
-✅ 无关系或组织时对应数组为空[]
+- relationships只引用已存在的角色
+- organization_memberships只引用已存在的组织
+- 无关系或组织时对应数组为空[]
 
 【格式约束】
-✅ 纯JSON对象输出，无markdown标记
-✅ 内容描述中严禁使用特殊符号
-✅ 专有名词直接书写
+- 纯JSON对象输出，无markdown标记
+- 内容描述中严禁使用特殊符号
+- 专有名词直接书写
 
 【禁止事项】
-❌ 输出markdown或代码块标记
-❌ 在描述中使用特殊符号（引号、方括号等）
-❌ 引用不存在的角色或组织
-❌ 脸谱化的角色设定
+禁止：输出markdown或代码块标记
+禁止：在描述中使用特殊符号（引号、方括号等）
+禁止：引用不存在的角色或组织
+禁止：脸谱化的角色设定
 </constraints>"""
 
     # 单个组织生成提示词 V2（RTCO框架）
@@ -1430,417 +2116,35 @@ narrative_perspective：{narrative_perspective}
 
 <constraints>
 【必须遵守】
-✅ 符合世界观：组织设定与项目世界观一致
-✅ 主题关联：背景与项目主题关联
-✅ 推动剧情：组织能推动故事发展
-✅ 有层级结构：内部有明确的层级和结构
-✅ 势力互动：与其他势力有互动关系
+- 符合世界观：组织设定与项目世界观一致
+- 主题关联：背景与项目主题关联
+- 推动剧情：组织能推动故事发展
+- 有层级结构：内部有明确的层级和结构
+- 势力互动：与其他势力有互动关系
 
 【组织定位要求】
-✅ 有存在必要性：不是可有可无的背景板
-✅ 目标合理：不过于理想化或脸谱化
-✅ 具体细节：描述详细具体，避免空泛
+- 有存在必要性：不是可有可无的背景板
+- 目标合理：不过于理想化或脸谱化
+- 具体细节：描述详细具体，避免空泛
 
 【格式约束】
-✅ 纯JSON对象输出，无markdown标记
-✅ 内容描述中严禁使用特殊符号
-✅ 专有名词直接书写
+- 纯JSON对象输出，无markdown标记
+- 内容描述中严禁使用特殊符号
+- 专有名词直接书写
 
 【禁止事项】
-❌ 输出markdown或代码块标记
-❌ 在描述中使用特殊符号（引号、方括号等）
-❌ 过于理想化或脸谱化的设定
-❌ 空泛的描述
+禁止：输出markdown或代码块标记
+禁止：在描述中使用特殊符号（引号、方括号等）
+禁止：过于理想化或脸谱化的设定
+禁止：空泛的描述
 </constraints>"""
 
     # 情节分析提示词 V2（RTCO框架 + 伏笔ID追踪）
-    PLOT_ANALYSIS = """<system>
-你是专业的小说编辑和剧情分析师，擅长深度剖析章节内容。
-</system>
-
-<task>
-【分析任务】
-全面分析第{chapter_number}章《{title}》的剧情要素、钩子、伏笔、冲突和角色发展。
-
-【🔴 伏笔追踪任务（重要）】
-系统已提供【已埋入伏笔列表】，当你识别到章节中有回收伏笔时：
-1. 必须从列表中找出对应的伏笔ID
-2. 在 foreshadows 数组中使用 reference_foreshadow_id 字段关联
-3. 如果无法确定是哪个伏笔，reference_foreshadow_id 填 null
-</task>
-
-<chapter priority="P0">
-【章节信息】
-章节：第{chapter_number}章
-标题：{title}
-字数：{word_count}字
-
-【章节内容】
-{content}
-</chapter>
-
-<existing_foreshadows priority="P1">
-【已埋入伏笔列表 - 用于回收匹配】
-以下是本项目中已埋入但尚未回收的伏笔，分析时如发现章节内容回收了某个伏笔，请使用对应的ID：
-
-{existing_foreshadows}
-</existing_foreshadows>
-
-<characters priority="P1">
-【项目角色信息 - 用于角色状态分析】
-以下是项目中已有的角色列表，分析 character_states 和 relationship_changes 时请使用这些角色的准确名称：
-
-{characters_info}
-</characters>
-
-<analysis_framework priority="P0">
-【分析维度】
-
-**1. 剧情钩子 (Hooks)**
-识别吸引读者的关键元素：
-- 悬念钩子：未解之谜、疑问、谜团
-- 情感钩子：引发共鸣的情感点
-- 冲突钩子：矛盾对抗、紧张局势
-- 认知钩子：颠覆认知的信息
-
-每个钩子需要：
-- 类型分类
-- 具体内容描述
-- 强度评分(1-10)
-- 出现位置(开头/中段/结尾)
-- **关键词**：【必填】从原文逐字复制8-25字的文本片段，用于精确定位
-
-**2. 伏笔分析 (Foreshadowing) - 🔴 支持ID追踪**
-- 埋下的新伏笔：内容、预期作用、隐藏程度(1-10)
-- 回收的旧伏笔：【必须】从已埋入伏笔列表中匹配ID
-- 伏笔质量：巧妙性和合理性
-- **关键词**：【必填】从原文逐字复制8-25字
-
-每个伏笔需要：
-- **title**：简洁标题（10-20字，概括伏笔核心）
-  - ⚠️ 回收伏笔时，标题应与原伏笔标题保持一致，不要添加"回收"等后缀
-  - 例如：原伏笔标题是"绿头发的视觉符号"，回收时标题仍为"绿头发的视觉符号"，而非"绿头发的视觉符号回收"
-- **content**：详细描述伏笔内容和预期作用
-- **type**：planted（埋下）或 resolved（回收）
-- **strength**：强度1-10（对读者的吸引力）
-- **subtlety**：隐藏度1-10（越高越隐蔽）
-- **reference_chapter**：回收时引用的原埋入章节号，埋下时为null
-- **reference_foreshadow_id**：【回收时必填】被回收伏笔的ID（从已埋入伏笔列表中选择），埋下时为null
-  - 🔴 重要：回收伏笔时，必须从【已埋入伏笔列表】中找到对应的伏笔ID并填写
-  - 如果列表中有标注【ID: xxx】的伏笔，回收时必须使用该ID
-  - 如果无法确定是哪个伏笔，才填写null（但应尽量避免）
-- **keyword**：【必填】从原文逐字复制8-25字的定位文本
-- **category**：分类（identity=身世/mystery=悬念/item=物品/relationship=关系/event=事件/ability=能力/prophecy=预言）
-- **is_long_term**：是否长线伏笔（跨10章以上回收为true）
-- **related_characters**：涉及的角色名列表
-- **estimated_resolve_chapter**：【必填】预估回收章节号（埋下时必须预估，回收时为当前章节）
-
-**3. 冲突分析 (Conflict)**
-- 冲突类型：人与人/人与己/人与环境/人与社会
-- 冲突各方及立场
-- 冲突强度(1-10)
-- 解决进度(0-100%)
-
-**4. 情感曲线 (Emotional Arc)**
-- 主导情绪（最多10字）
-- 情感强度(1-10)
-- 情绪变化轨迹
-
-**5. 角色状态追踪 (Character Development)**
-对每个出场角色分析：
-- 心理状态变化(前→后)
-- 关系变化
-- 关键行动和决策
-- 成长或退步
-- **💀 存活状态（重要）**：
-  - survival_status: 角色当前存活状态
-  - 可选值：active(正常)/deceased(死亡)/missing(失踪)/retired(退场)
-  - 默认为null（表示无变化），仅当章节中角色明确死亡、失踪或永久退场时才填写
-  - 死亡/失踪需要有明确的剧情依据，不可臆测
-- ** 职业变化（可选）**：
-  - 仅当章节明确描述职业进展时填写
-  - main_career_stage_change: 整数(+1晋升/-1退步/0无变化)
-  - sub_career_changes: 副职业变化数组
-  - new_careers: 新获得职业
-  - career_breakthrough: 突破过程描述
-- **🏛️ 组织变化（可选）**：
-  - 仅当章节明确描述角色与组织关系变化时填写
-  - organization_changes: 组织变动数组
-  - 每项包含：organization_name(组织名)、change_type(加入joined/离开left/晋升promoted/降级demoted/开除expelled/叛变betrayed)、new_position(新职位，可选)、loyalty_change(忠诚度变化描述，可选)、description(变化描述)
-
-**5b. 组织状态追踪 (Organization Status) - 可选**
-仅当章节涉及组织势力变化时填写，分析出场组织的状态变化：
-- 组织名称
-- 势力等级变化(power_change: 整数，+N增强/-N削弱/0无变化)
-- 据点变化(new_location: 新据点，可选)
-- 宗旨/目标变化(new_purpose: 新目标，可选)
-- 组织状态描述(status_description: 当前状态概述)
-- 关键事件(key_event: 触发变化的事件)
-- **💀 组织存续状态（重要）**：
-  - is_destroyed: 组织是否被覆灭（true/false，默认false）
-  - 仅当章节明确描述组织被彻底消灭、瓦解、灭亡时设为true
-
-**5c. 金手指/系统变化追踪 (Goldfinger Changes) - 可选但重要**
-仅当章节明确出现主角系统、特殊能力、神器、血脉、外挂、规则面板、任务奖励等“金手指”事实时填写 goldfinger_changes：
-- 必须逐字提供 evidence_excerpt，复制原文中支撑该事实的8-50字片段
-- 必须提供 name 与 normalized_name；normalized_name 使用去空格、小写后的稳定名称
-- 如能确定拥有者，填写 owner_character_name，并尽量匹配已有角色；不确定时在 conflict_hint 说明
-- type 可选：system/ability/artifact/bloodline/panel/space/other
-- status 可选值：latent/active/sealed/cooldown/upgrading/lost/completed/unknown
-- operation 可选值：upsert/add/update/remove/seal/lost；删除、失去、封印等破坏性变化必须有明确原文证据
-- 只提取原文明确支持的增量事实：别名、任务、奖励、触发条件、冷却、使用示例、非冲突概要
-- 不要凭空推断规则和限制；规则 rules、限制 limits 必须来自清晰原文
-
-**6. 关键情节点 (Plot Points)**
-列出3-5个核心情节点：
-- 情节内容
-- 类型(revelation/conflict/resolution/transition)
-- 重要性(0.0-1.0)
-- 对故事的影响
-- **关键词**：【必填】从原文逐字复制8-25字
-
-**7. 场景与节奏**
-- 主要场景
-- 叙事节奏(快/中/慢)
-- 对话与描写比例
-
-**8. 质量评分（支持小数，严格区分度）**
-评分范围：1.0-10.0，支持一位小数（如 6.5、7.8）
-每个维度必须根据以下标准严格评分，避免所有内容都打中等分数：
-
-**节奏把控 (pacing)**：
-- 1.0-3.9（差）：节奏混乱，该快不快该慢不慢；场景切换生硬；大段无意义描写拖沓
-- 4.0-5.9（中下）：节奏基本可读但有明显问题；部分场景过于冗长或仓促
-- 6.0-7.9（中上）：节奏整体流畅，偶有小问题；张弛有度但不够精妙
-- 8.0-9.4（优秀）：节奏把控精准，高潮迭起；场景切换自然，详略得当
-- 9.5-10.0（完美）：节奏大师级，每个段落都恰到好处
-
-**吸引力 (engagement)**：
-- 1.0-3.9（差）：内容乏味，缺乏钩子；读者难以继续阅读
-- 4.0-5.9（中下）：有基本情节但缺乏亮点；钩子设置生硬或缺失
-- 6.0-7.9（中上）：有一定吸引力，钩子有效但不够巧妙
-- 8.0-9.4（优秀）：引人入胜，钩子设置精妙；让人欲罢不能
-- 9.5-10.0（完美）：极具吸引力，每个段落都有阅读动力
-
-**连贯性 (coherence)**：
-- 1.0-3.9（差）：逻辑混乱，前后矛盾；角色行为不合理
-- 4.0-5.9（中下）：基本连贯但有明显漏洞；部分情节衔接生硬
-- 6.0-7.9（中上）：整体连贯，偶有小瑕疵；角色行为基本合理
-- 8.0-9.4（优秀）：逻辑严密，衔接自然；角色行为高度一致
-- 9.5-10.0（完美）：无懈可击的连贯性
-
-**整体质量 (overall)**：
-- 计算公式：(pacing + engagement + coherence) / 3，保留一位小数
-- 可根据综合印象±0.5调整，必须与各项分数保持一致性
-
-**9. 改进建议（与分数关联）**
-建议数量必须与整体质量分数关联：
-- overall < 4.0：必须提供4-5条具体改进建议，指出严重问题
-- overall 4.0-5.9：必须提供3-4条改进建议，指出主要问题
-- overall 6.0-7.9：提供1-2条优化建议，指出可提升之处
-- overall ≥ 8.0：提供0-1条锦上添花的建议
-
-每条建议必须：
-- 指出具体问题位置或类型
-- 说明为什么是问题
-- 给出明确的改进方向
-</analysis_framework>
-
-<output priority="P0">
-【输出格式】
-返回纯JSON对象（无markdown标记）：
-
-{{
-  "hooks": [
-    {{
-      "type": "悬念",
-      "content": "具体描述",
-      "strength": 8,
-      "position": "中段",
-      "keyword": "从原文逐字复制的8-25字文本"
-    }}
-  ],
-  "foreshadows": [
-    {{
-      "title": "伏笔简洁标题",
-      "content": "伏笔详细内容和预期作用",
-      "type": "planted",
-      "strength": 7,
-      "subtlety": 8,
-      "reference_chapter": null,
-      "reference_foreshadow_id": null,
-      "keyword": "从原文逐字复制的8-25字文本",
-      "category": "mystery",
-      "is_long_term": false,
-      "related_characters": ["角色A", "角色B"],
-      "estimated_resolve_chapter": 15
-    }},
-    {{
-      "title": "回收的伏笔标题",
-      "content": "伏笔如何被回收的描述",
-      "type": "resolved",
-      "strength": 8,
-      "subtlety": 6,
-      "reference_chapter": 5,
-      "reference_foreshadow_id": "abc123-已埋入伏笔的ID",
-      "keyword": "从原文逐字复制的8-25字文本",
-      "category": "mystery",
-      "is_long_term": false,
-      "related_characters": ["角色A"],
-      "estimated_resolve_chapter": 10
-    }}
-  ],
-  "conflict": {{
-    "types": ["人与人", "人与己"],
-    "parties": ["主角-复仇", "反派-维护现状"],
-    "level": 8,
-    "description": "冲突描述",
-    "resolution_progress": 0.3
-  }},
-  "emotional_arc": {{
-    "primary_emotion": "紧张焦虑",
-    "intensity": 8,
-    "curve": "平静→紧张→高潮→释放",
-    "secondary_emotions": ["期待", "焦虑"]
-  }},
-  "character_states": [
-    {{
-      "character_name": "张三",
-      "survival_status": null,
-      "state_before": "犹豫",
-      "state_after": "坚定",
-      "psychological_change": "心理变化描述",
-      "key_event": "触发事件",
-      "relationship_changes": {{"李四": "关系改善"}},
-      "career_changes": {{
-        "main_career_stage_change": 1,
-        "sub_career_changes": [{{"career_name": "炼丹", "stage_change": 1}}],
-        "new_careers": [],
-        "career_breakthrough": "突破描述"
-      }},
-      "organization_changes": [
-        {{
-          "organization_name": "某门派",
-          "change_type": "promoted",
-          "new_position": "长老",
-          "loyalty_change": "忠诚度提升",
-          "description": "因立下大功被提拔为长老"
-        }}
-      ]
-    }}
-  ],
-  "plot_points": [
-    {{
-      "content": "情节点描述",
-      "type": "revelation",
-      "importance": 0.9,
-      "impact": "推动故事发展",
-      "keyword": "从原文逐字复制的8-25字文本"
-    }}
-  ],
-  "scenes": [
-    {{
-      "location": "地点",
-      "atmosphere": "氛围",
-      "duration": "时长估计"
-    }}
-  ],
-  "organization_states": [
-    {{
-      "organization_name": "某门派",
-      "power_change": -10,
-      "new_location": null,
-      "new_purpose": null,
-      "status_description": "因内乱势力受损，但核心力量未动摇",
-      "key_event": "长老叛变导致分支瓦解",
-      "is_destroyed": false
-    }}
-  ],
-  "goldfinger_changes": [
-    {{
-      "name": "天命系统",
-      "normalized_name": "天命系统",
-      "owner_character_name": "张三",
-      "owner_character_id": null,
-      "type": "system",
-      "status": "active",
-      "summary": "发布任务并根据完成情况发放奖励",
-      "rules": ["只有宿主主动接受任务才会触发惩罚"],
-      "tasks": [{{"title": "三日内救下师姐", "status": "active"}}],
-      "rewards": [{{"name": "悟性提升", "amount": "+1"}}],
-      "limits": ["冷却期间不能连续领取同类任务"],
-      "trigger_conditions": ["宿主濒死时首次激活"],
-      "cooldown": {{"chapters": 3}},
-      "aliases": ["系统", "天命面板"],
-      "operation": "upsert",
-      "evidence_excerpt": "天命系统在他濒死时苏醒，发布三日任务",
-      "confidence": 0.94,
-      "conflict_hint": null
-    }}
-  ],
-  "pacing": "varied",
-  "dialogue_ratio": 0.4,
-  "description_ratio": 0.3,
-  "scores": {{
-    "pacing": 6.5,
-    "engagement": 5.8,
-    "coherence": 7.2,
-    "overall": 6.5,
-    "score_justification": "节奏整体流畅但中段略显拖沓；钩子设置有效但不够巧妙；逻辑连贯无明显漏洞"
-  }},
-  "plot_stage": "发展",
-  "suggestions": [
-    "【节奏问题】第三场景的心理描写过长（约500字），建议精简至200字以内，保留核心情感即可",
-    "【吸引力不足】章节中段缺乏有效钩子，建议在主角发现线索后增加一个小悬念"
-  ]
-}}
-</output>
-
-<constraints>
-【必须遵守】
-✅ keyword字段必填：钩子、伏笔、情节点的keyword不能为空
-✅ 逐字复制：keyword必须从原文复制，长度8-25字
-✅ 精确定位：keyword能在原文中精确找到
-✅ 职业变化可选：仅当章节明确描述时填写
-✅ 组织变化可选：仅当章节明确描述角色与组织关系变动时填写（character_states中的organization_changes）
-✅ 组织状态可选：仅当章节明确描述组织势力/据点/目标变化时填写（organization_states顶级字段）
-✅ 金手指变化可选：仅当章节明确出现系统/能力/神器/血脉/外挂变化时填写（goldfinger_changes顶级字段）
-✅ 金手指证据必填：goldfinger_changes 每项 evidence_excerpt 必须逐字复制原文证据
-✅ 金手指字段完整：goldfinger_changes 每项必须包含 name、normalized_name、owner_character_name、owner_character_id、type、status、summary、rules、tasks、rewards、limits、trigger_conditions、cooldown、aliases、operation、evidence_excerpt、confidence、conflict_hint
-✅ 存活状态谨慎：survival_status仅当章节有明确死亡/失踪/退场描写时填写，默认null
-✅ 组织覆灭谨慎：is_destroyed仅当组织被彻底消灭时设true，组织受损不算覆灭
-✅ 【伏笔ID追踪】回收伏笔时，必须从【已埋入伏笔列表】中查找匹配的ID填入 reference_foreshadow_id
-✅ 【suggestions严格格式】suggestions 必须是“字符串数组”，每个元素都必须是纯字符串
-✅ suggestions 的正确格式示例："suggestions": ["【节奏问题】...", "【描写不足】..."]
-✅ suggestions 中禁止返回对象、字典、键值对或嵌套结构，例如禁止 {{"suggestion": "..."}}、{{"content": "..."}}
-✅ 如果没有改进建议，必须返回空数组 []，不要返回 null，不要省略字段
-
-【评分约束 - 严格执行】
-✅ 严格按评分标准打分，支持小数（如6.5、7.2、8.3）
-✅ 不要默认给7.0-8.0分，差的内容必须给低分（1.0-5.0），好的内容才给高分（8.0-10.0）
-✅ score_justification必填：简要说明各项评分的依据
-✅ 建议数量必须与overall分数关联：
-   - overall≤4.0 → 4-5条建议
-   - overall 4.0-6.0 → 3-4条建议
-   - overall 6.0-8.0 → 1-2条建议
-   - overall≥8.0 → 0-1条建议
-✅ 每条建议必须标注问题类型（如【节奏问题】【描写不足】等）
-✅ 每条建议必须直接输出完整文本，不能包裹为对象字段
-
-【禁止事项】
-❌ keyword使用概括或改写的文字
-❌ 输出markdown标记
-❌ 遗漏必填的keyword字段
-❌ 无根据地添加职业变化
-❌ 无根据地添加组织变化或组织状态变化
-❌ 无根据地添加金手指变化、规则、限制、任务或奖励
-❌ 对删除/失去/封印类金手指变化缺少原文证据
-❌ 无确切剧情依据地标记角色死亡或组织覆灭
-❌ 所有章节都打7-8分的"安全分"
-❌ 高分章节给大量建议，或低分章节不给建议
-❌ suggestions 返回 {{"suggestion": "建议内容"}} 这类对象数组
-❌ suggestions 返回带编号对象、content对象、explanation对象等任何非字符串元素
-</constraints>"""
+    # 体量最大的模板（~12KB）外置为数据文件，导入期读取一次；
+    # 调整提示词文案无需改动Python源
+    PLOT_ANALYSIS = (
+        Path(__file__).parent / "prompts" / "plot_analysis.txt"
+    ).read_text(encoding="utf-8")
 
     # 大纲单批次展开提示词 V2（RTCO框架）
     OUTLINE_EXPAND_SINGLE = """<system>
@@ -1914,40 +2218,40 @@ narrative_perspective：{narrative_perspective}
 </output>
 
 <constraints>
-【⚠️ 内容边界约束 - 必须严格遵守】
-✅ 只能展开当前大纲节点的内容
-✅ 深化当前大纲，而非跨越到后续
-✅ 放慢叙事节奏，充分体验当前阶段
+【内容边界约束 - 必须严格遵守】
+- 只能展开当前大纲节点的内容
+- 深化当前大纲，而非跨越到后续
+- 放慢叙事节奏，充分体验当前阶段
 
-❌ 绝对不能推进到后续大纲内容
-❌ 不要让剧情快速推进
-❌ 不要提前展开【后一节】的内容
+禁止：绝对不能推进到后续大纲内容
+禁止：不要让剧情快速推进
+禁止：不要提前展开【后一节】的内容
 
 【展开原则】
-✅ 将单一事件拆解为多个细节丰富的章节
-✅ 深入挖掘情感、心理、环境、对话
-✅ 每章是当前大纲内容的不同侧面或阶段
+- 将单一事件拆解为多个细节丰富的章节
+- 深入挖掘情感、心理、环境、对话
+- 每章是当前大纲内容的不同侧面或阶段
 
-【🔴 相邻章节差异化约束（防止重复）】
-✅ 每章有独特的开场方式（不同场景、时间点、角色状态）
-✅ 每章有独特的结束方式（不同悬念、转折、情感收尾）
-✅ key_events在相邻章节间绝不重叠
-✅ plot_summary描述该章独特内容，不与其他章雷同
-✅ 同一事件的不同阶段要明确区分"前、中、后"
+【相邻章节差异化约束（防止重复）】
+- 每章有独特的开场方式（不同场景、时间点、角色状态）
+- 每章有独特的结束方式（不同悬念、转折、情感收尾）
+- key_events在相邻章节间绝不重叠
+- plot_summary描述该章独特内容，不与其他章雷同
+- 同一事件的不同阶段要明确区分"前、中、后"
 
 【章节间要求】
-✅ 衔接自然流畅（每章从不同起点开始）
-✅ 剧情递进合理（但不超出当前大纲边界）
-✅ 节奏张弛有度
-✅ 每章有明确且独特的叙事价值
-✅ 最后一章结束时恰好完成当前大纲内容
-✅ 关键事件无重叠：检查相邻章节key_events
+- 衔接自然流畅（每章从不同起点开始）
+- 剧情递进合理（但不超出当前大纲边界）
+- 节奏张弛有度
+- 每章有明确且独特的叙事价值
+- 最后一章结束时恰好完成当前大纲内容
+- 关键事件无重叠：检查相邻章节key_events
 
 【禁止事项】
-❌ 输出非JSON格式
-❌ 剧情越界到后续大纲
-❌ 相邻章节内容重复
-❌ 关键事件雷同
+禁止：输出非JSON格式
+禁止：剧情越界到后续大纲
+禁止：相邻章节内容重复
+禁止：关键事件雷同
 </constraints>"""
 
     # 大纲分批展开提示词 V2（RTCO框架）
@@ -2032,38 +2336,38 @@ narrative_perspective：{narrative_perspective}
 </output>
 
 <constraints>
-【⚠️ 内容边界约束】
-✅ 只能展开当前大纲节点的内容
-✅ 深化当前大纲，而非跨越到后续
-✅ 放慢叙事节奏
+【内容边界约束】
+- 只能展开当前大纲节点的内容
+- 深化当前大纲，而非跨越到后续
+- 放慢叙事节奏
 
-❌ 绝对不能推进到后续大纲内容
-❌ 不要让剧情快速推进
+禁止：绝对不能推进到后续大纲内容
+禁止：不要让剧情快速推进
 
 【分批连续性约束】
-✅ 与前面已生成章节自然衔接
-✅ 从第{start_index}节开始编号
-✅ 保持叙事连贯性
+- 与前面已生成章节自然衔接
+- 从第{start_index}节开始编号
+- 保持叙事连贯性
 
-【🔴 相邻章节差异化约束（防止重复）】
-✅ 每章有独特的开场和结束方式
-✅ key_events在相邻章节间绝不重叠
-✅ plot_summary描述该章独特内容
-✅ 特别注意与前序章节的差异化
-✅ 避免重复已有内容
+【相邻章节差异化约束（防止重复）】
+- 每章有独特的开场和结束方式
+- key_events在相邻章节间绝不重叠
+- plot_summary描述该章独特内容
+- 特别注意与前序章节的差异化
+- 避免重复已有内容
 
 【章节间要求】
-✅ 与前面章节衔接自然流畅
-✅ 剧情递进合理（但不超出当前大纲边界）
-✅ 节奏张弛有度
-✅ 每章有明确且独特的叙事价值
-✅ 关键事件无重叠：检查本批次和前序章节的key_events
+- 与前面章节衔接自然流畅
+- 剧情递进合理（但不超出当前大纲边界）
+- 节奏张弛有度
+- 每章有明确且独特的叙事价值
+- 关键事件无重叠：检查本批次和前序章节的key_events
 
 【禁止事项】
-❌ 输出非JSON格式
-❌ 剧情越界到后续大纲
-❌ 相邻章节内容重复
-❌ 与前序章节key_events雷同
+禁止：输出非JSON格式
+禁止：剧情越界到后续大纲
+禁止：相邻章节内容重复
+禁止：与前序章节key_events雷同
 </constraints>"""
 
     # 章节重写系统提示词 V2（RTCO框架）
@@ -2108,7 +2412,7 @@ narrative_perspective：{narrative_perspective}
     # MCP工具测试提示词
     MCP_TOOL_TEST = """你是MCP插件测试助手，需要测试插件 '{plugin_name}' 的功能。
 
-⚠️ 重要规则：生成参数时，必须严格使用工具 schema 中定义的原始参数名称，不要转换为 snake_case 或其他格式。
+重要规则：生成参数时，必须严格使用工具 schema 中定义的原始参数名称，不要转换为 snake_case 或其他格式。
 例如：如果 schema 中是 'nextThoughtNeeded'，就必须使用 'nextThoughtNeeded'，不能改成 'next_thought_needed'。
 
 请选择一个合适的工具进行测试，优先选择搜索、查询类工具。
@@ -2118,7 +2422,7 @@ narrative_perspective：{narrative_perspective}
 
     MCP_TOOL_TEST_SYSTEM = """你是专业的API测试工具。当给定工具列表时，选择一个工具并使用合适的参数调用它。
 
-⚠️ 关键规则：调用工具时，必须严格使用 schema 中定义的原始参数名，不要自行转换命名风格。
+关键规则：调用工具时，必须严格使用 schema 中定义的原始参数名，不要自行转换命名风格。
 - 如果参数名是 camelCase（如 nextThoughtNeeded），就使用 camelCase
 - 如果参数名是 snake_case（如 next_thought），就使用 snake_case
 - 保持与 schema 中定义的完全一致，包括大小写和命名风格"""
@@ -2679,16 +2983,16 @@ narrative_perspective：{narrative_perspective}
 
 <constraints>
 【必须遵守】
-✅ 这是预测性分析，面向未来剧情
-✅ 考虑剧情的自然发展和节奏
-✅ 确保引入必要性，不为引入而引入
-✅ 优先考虑角色的长期作用
+- 这是预测性分析，面向未来剧情
+- 考虑剧情的自然发展和节奏
+- 确保引入必要性，不为引入而引入
+- 优先考虑角色的长期作用
 
 【禁止事项】
-❌ 输出markdown标记
-❌ 基于已生成内容做事后分析
-❌ 为了引入角色而强行引入
-❌ 设计一次性功能角色
+禁止：输出markdown标记
+禁止：基于已生成内容做事后分析
+禁止：为了引入角色而强行引入
+禁止：设计一次性功能角色
 </constraints>"""
 
     # 自动角色引入 - 生成提示词 V2（RTCO框架）
@@ -2753,7 +3057,7 @@ narrative_perspective：{narrative_perspective}
 - 主职业：从"可用主职业列表"中选择一个，填写职业名称
 - 主职业阶段：根据职业的阶段信息和角色实力，设定合理的当前阶段
 - 副职业：可选择0-2个副职业
-- ⚠️ 重要：必须填写职业的名称而非ID
+- 重要：必须填写职业的名称而非ID
 </requirements>
 
 <output priority="P0">
@@ -2812,17 +3116,17 @@ narrative_perspective：{narrative_perspective}
 
 <constraints>
 【必须遵守】
-✅ 符合剧情需求和世界观设定
-✅ relationships数组必填：至少1-3个关系
-✅ target_character_name必须精确匹配【已有角色】
-✅ organization_memberships只能引用已存在的组织
-✅ 职业选择必须从可用列表中选择
+- 符合剧情需求和世界观设定
+- relationships数组必填：至少1-3个关系
+- target_character_name必须精确匹配【已有角色】
+- organization_memberships只能引用已存在的组织
+- 职业选择必须从可用列表中选择
 
 【禁止事项】
-❌ 输出markdown标记
-❌ 在描述中使用特殊符号
-❌ 引用不存在的角色或组织
-❌ 使用职业ID而非职业名称
+禁止：输出markdown标记
+禁止：在描述中使用特殊符号
+禁止：引用不存在的角色或组织
+禁止：使用职业ID而非职业名称
 </constraints>"""
 
     # 自动组织引入 - 预测性分析提示词（RTCO框架）
@@ -2940,18 +3244,18 @@ narrative_perspective：{narrative_perspective}
 
 <constraints>
 【必须遵守】
-✅ 这是预测性分析，面向未来剧情
-✅ 考虑世界观的丰富性和完整性
-✅ 确保引入必要性，不为引入而引入
-✅ 优先考虑组织的长期作用
-✅ 组织应该是推动剧情的关键力量
+- 这是预测性分析，面向未来剧情
+- 考虑世界观的丰富性和完整性
+- 确保引入必要性，不为引入而引入
+- 优先考虑组织的长期作用
+- 组织应该是推动剧情的关键力量
 
 【禁止事项】
-❌ 输出markdown标记
-❌ 基于已生成内容做事后分析
-❌ 为了引入组织而强行引入
-❌ 设计一次性功能组织
-❌ 创建与现有组织功能重复的组织
+禁止：输出markdown标记
+禁止：基于已生成内容做事后分析
+禁止：为了引入组织而强行引入
+禁止：设计一次性功能组织
+禁止：创建与现有组织功能重复的组织
 </constraints>"""
 
     # 自动组织引入 - 生成提示词（RTCO框架）
@@ -3053,18 +3357,18 @@ narrative_perspective：{narrative_perspective}
 
 <constraints>
 【必须遵守】
-✅ 符合剧情需求和世界观设定
-✅ 组织要有独特的定位和价值
-✅ character_name必须精确匹配【已有角色】
-✅ target_organization_name必须精确匹配【已有组织】
-✅ 组织能够推动剧情发展
+- 符合剧情需求和世界观设定
+- 组织要有独特的定位和价值
+- character_name必须精确匹配【已有角色】
+- target_organization_name必须精确匹配【已有组织】
+- 组织能够推动剧情发展
 
 【禁止事项】
-❌ 输出markdown标记
-❌ 在描述中使用特殊符号
-❌ 引用不存在的角色或组织
-❌ 创建功能与现有组织重复的组织
-❌ 创建对剧情没有实际作用的组织
+禁止：输出markdown标记
+禁止：在描述中使用特殊符号
+禁止：引用不存在的角色或组织
+禁止：创建功能与现有组织重复的组织
+禁止：创建对剧情没有实际作用的组织
 </constraints>"""
 
     # 职业体系生成提示词 V2（RTCO框架）
@@ -3164,19 +3468,19 @@ narrative_perspective：{narrative_perspective}
 
 <constraints>
 【必须遵守】
-✅ 主职业数量：必须精确生成1个，不多不少
-✅ 副职业数量：必须精确生成1个，不多不少
-✅ 主职业阶段数建议：8-12个
-✅ 副职业阶段数建议：5-8个
-✅ stages数组长度必须等于max_stage
-✅ 确保职业体系与世界观高度契合
-✅ 职业设计必须支撑项目简介中的故事情节
+- 主职业数量：必须精确生成1个，不多不少
+- 副职业数量：必须精确生成1个，不多不少
+- 主职业阶段数建议：8-12个
+- 副职业阶段数建议：5-8个
+- stages数组长度必须等于max_stage
+- 确保职业体系与世界观高度契合
+- 职业设计必须支撑项目简介中的故事情节
 
 【禁止事项】
-❌ 所有职业使用相同的阶段数
-❌ 输出markdown标记
-❌ 职业设计与世界观或简介脱节
-❌ 忽略简介中提到的职业或能力设定
+禁止：所有职业使用相同的阶段数
+禁止：输出markdown标记
+禁止：职业设计与世界观或简介脱节
+禁止：忽略简介中提到的职业或能力设定
 </constraints>"""
 
     # 局部重写提示词（RTCO框架）
@@ -3232,17 +3536,17 @@ narrative_perspective：{narrative_perspective}
 
 <constraints>
 【必须遵守】
-✅ 前后衔接：输出内容必须与前文自然衔接，与后文平滑过渡
-✅ 风格一致：保持与原文相同的叙事风格、语气和人称
-✅ 要求优先：严格执行用户的修改要求
-✅ 字数控制：遵循字数要求
+- 前后衔接：输出内容必须与前文自然衔接，与后文平滑过渡
+- 风格一致：保持与原文相同的叙事风格、语气和人称
+- 要求优先：严格执行用户的修改要求
+- 字数控制：遵循字数要求
 
 【禁止事项】
-❌ 重复前文内容
-❌ 重复后文内容
-❌ 添加任何元信息或说明
-❌ 改变叙事人称或视角
-❌ 偏离用户的修改要求
+禁止：重复前文内容
+禁止：重复后文内容
+禁止：添加任何元信息或说明
+禁止：改变叙事人称或视角
+禁止：偏离用户的修改要求
 </constraints>"""
 
     # 拆书导入-反向项目提炼提示词
@@ -3287,16 +3591,16 @@ narrative_perspective：{narrative_perspective}
 
 <constraints>
 【必须遵守】
-✅ 严格基于已给正文内容，不凭空添加关键设定
-✅ 保持信息自洽，避免互相矛盾
-✅ 输出必须是可解析JSON对象
-✅ 小说的genre可以由多个类型组成
+- 严格基于已给正文内容，不凭空添加关键设定
+- 保持信息自洽，避免互相矛盾
+- 输出必须是可解析JSON对象
+- 小说的genre可以由多个类型组成
 
 【禁止事项】
-❌ 输出JSON以外的任何文字
-❌ 使用markdown标记或代码块包裹
-❌ narrative_perspective输出枚举值之外的内容
-❌ target_words输出非整数
+禁止：输出JSON以外的任何文字
+禁止：使用markdown标记或代码块包裹
+禁止：narrative_perspective输出枚举值之外的内容
+禁止：target_words输出非整数
 </constraints>"""
 
     # 拆书导入-反向生成章节大纲（严格对齐 OUTLINE_CREATE 结构）
@@ -3363,35 +3667,27 @@ narrative_perspective：{narrative_perspective}
 
 <constraints>
 【必须遵守】
-✅ 严格一章对应一个对象，数量与顺序完全一致
-✅ 字段名、字段层级、字段类型严格一致
-✅ 仅基于输入正文提炼，不擅自扩展设定
-✅ 输出必须可被JSON直接解析
+- 严格一章对应一个对象，数量与顺序完全一致
+- 字段名、字段层级、字段类型严格一致
+- 仅基于输入正文提炼，不擅自扩展设定
+- 输出必须可被JSON直接解析
 
 【禁止事项】
-❌ 输出JSON之外任何文本
-❌ 缺失字段或新增字段
-❌ chapter_number/title 与输入不一致
-❌ 使用 markdown 或代码块
+禁止：输出JSON之外任何文本
+禁止：缺失字段或新增字段
+禁止：chapter_number/title 与输入不一致
+禁止：使用 markdown 或代码块
 </constraints>"""
 
     @staticmethod
     def _get_genre_strategy(genre: str) -> str:
         """根据类型获取长篇策略指令"""
+        # 空值在缓存外短路，避免污染缓存键
         if not genre:
             return ""
 
-        # 标准化类型名称
-        genre_lower = genre.lower()
-
-        # 遍历策略矩阵进行匹配
-        for strategy_key, strategy_data in GENRE_STRATEGIES.items():
-            # 检查是否匹配关键字
-            if any(keyword in genre_lower for keyword in strategy_data["keywords"]):
-                return strategy_data["instruction"]
-
-        # 默认返回空或通用建议
-        return ""
+        # 标准化类型名称后走缓存查找（顺序与策略矩阵声明一致）
+        return _match_genre_strategy(genre.lower().strip())
 
     @staticmethod
     def format_prompt(template: str, **kwargs) -> str:
@@ -3413,6 +3709,8 @@ narrative_perspective：{narrative_perspective}
                 )
 
             kwargs.setdefault("goldfinger_context", "暂无金手指信息")
+            kwargs.setdefault("character_example", _CHARACTER_EXAMPLE_JSON)
+            kwargs.setdefault("organization_example", _ORGANIZATION_EXAMPLE_JSON)
             kwargs.setdefault(
                 "guidance_section",
                 PromptService.format_inspiration_guidance_for_prompt(
@@ -3422,7 +3720,22 @@ narrative_perspective：{narrative_perspective}
 
             # 如果模板中没有 {genre_strategy} 占位符，format 会忽略多余参数
             # 但为了安全起见，我们可以检查一下
-            return template.format(**kwargs)
+            compiled = _compile_format_template(template)
+            if compiled is None:
+                return template.format(**kwargs)
+            parts, fields, required = compiled
+            # 渲染前整体校验缺参：一次报全所有缺失项，且热路径不走异常回退
+            missing = required - kwargs.keys()
+            if missing:
+                raise ValueError(
+                    f"缺少必需的参数: {', '.join(repr(name) for name in sorted(missing))}"
+                )
+            out = [parts[0]]
+            for i, field in enumerate(fields):
+                # 空格式规约下format()与str.format的取值语义一致
+                out.append(format(kwargs[field]))
+                out.append(parts[i + 1])
+            return "".join(out)
         except KeyError as e:
             raise ValueError(f"缺少必需的参数: {e}")
 
@@ -4006,6 +4319,10 @@ narrative_perspective：{narrative_perspective}
     def _stable_json(cls, value: Any) -> str:
         """Serialize trace inputs deterministically for hashes/IDs."""
 
+        # 这里的输出直接进trace_id哈希，必须逐字节稳定。orjson对
+        # datetime/date/UUID等类型原生序列化（RFC 3339），不走default=str，
+        # 与stdlib的str()渲染不等价——同一载荷会随orjson是否安装产生
+        # 不同的trace_id。哈希路径固定用stdlib，orjson只用在非指纹场景。
         return json.dumps(value, ensure_ascii=False, sort_keys=True, separators=(",", ":"), default=str)
 
     @classmethod
@@ -4018,6 +4335,8 @@ narrative_perspective：{narrative_perspective}
             return {}
         # Round-trip through deterministic JSON so nested non-primitive values cannot
         # retain insertion-order or object-repr differences in trace IDs.
+        if HAS_ORJSON:
+            return orjson.loads(cls._stable_json(metadata))
         return json.loads(cls._stable_json(metadata))
 
     @classmethod
@@ -4226,10 +4545,50 @@ narrative_perspective：{narrative_perspective}
         else:
             system_template = cls.CHAPTER_REGENERATION_SYSTEM
 
-        prompt_parts = [system_template]
+        # 上下文字段一次性取齐并套默认值，后续统一走属性访问
+        ctx = SimpleNamespace(
+            project_title=project_context.get("project_title", "未知"),
+            genre=project_context.get("genre", "未设定"),
+            theme=project_context.get("theme", "未设定"),
+            narrative_perspective=project_context.get("narrative_perspective", "第三人称"),
+            time_period=project_context.get("time_period", "未设定"),
+            location=project_context.get("location", "未设定"),
+            atmosphere=project_context.get("atmosphere", "未设定"),
+            world_setting_context=project_context.get("world_setting_context", ""),
+            characters_info=project_context.get("characters_info"),
+            chapter_outline=project_context.get("chapter_outline"),
+            previous_context=project_context.get("previous_context"),
+        )
+
+        # 可选段落预先成串（为空时不输出对应段落，含分隔线）
+        characters_section = (
+            f"## 角色信息\n\n{ctx.characters_info}\n\n---\n\n"
+            if ctx.characters_info
+            else ""
+        )
+        outline_section = (
+            f"## 本章大纲\n\n{ctx.chapter_outline}\n\n---\n\n"
+            if ctx.chapter_outline
+            else ""
+        )
+        previous_section = (
+            f"## 前置章节上下文\n\n{ctx.previous_context}\n\n---\n\n"
+            if ctx.previous_context
+            else ""
+        )
+        style_section = (
+            f"## 写作风格要求\n\n{style_content}\n\n"
+            "请在重新创作时严格遵循上述写作风格。\n\n---\n\n"
+            if style_content
+            else ""
+        )
+        style_rule = (
+            "6. **风格一致**：严格按照上述写作风格进行创作" if style_content else ""
+        )
 
-        # 原始章节信息
-        prompt_parts.append(f"""## 📖 原始章节信息
+        # 单次f-string求值直接产出最终提示词，避免逐段append+join的中间列表
+        return f"""{system_template}
+## 原始章节信息
 
 **章节**：第{chapter_number}章
 **标题**：{title}
@@ -4239,92 +4598,37 @@ narrative_perspective：{narrative_perspective}
 {content}
 
 ---
-""")
-
-        # 修改指令
-        prompt_parts.append(modification_instructions)
-        prompt_parts.append("\n---\n")
-
-        # 项目背景信息
-        prompt_parts.append(f"""## 🌍 项目背景信息
-
-**小说标题**：{project_context.get("project_title", "未知")}
-**题材**：{project_context.get("genre", "未设定")}
-**主题**：{project_context.get("theme", "未设定")}
-**叙事视角**：{project_context.get("narrative_perspective", "第三人称")}
-**世界观设定**：
-- 时代背景：{project_context.get("time_period", "未设定")}
-- 地理位置：{project_context.get("location", "未设定")}
-- 氛围基调：{project_context.get("atmosphere", "未设定")}
-{project_context.get("world_setting_context", "")}
-
----
-""")
-
-        # 角色信息
-        if project_context.get("characters_info"):
-            prompt_parts.append(f"""## 👥 角色信息
-
-{project_context["characters_info"]}
-
----
-""")
-
-        # 章节大纲
-        if project_context.get("chapter_outline"):
-            prompt_parts.append(f"""## 📝 本章大纲
-
-{project_context["chapter_outline"]}
-
----
-""")
-
-        # 前置章节上下文
-        if project_context.get("previous_context"):
-            prompt_parts.append(f"""## 📚 前置章节上下文
 
-{project_context["previous_context"]}
+{modification_instructions}
 
 ---
-""")
-
-        # 写作风格要求
-        if style_content:
-            prompt_parts.append(f"""## 🎨 写作风格要求
 
-{style_content}
+## 项目背景信息
 
-请在重新创作时严格遵循上述写作风格。
+**小说标题**：{ctx.project_title}
+**题材**：{ctx.genre}
+**主题**：{ctx.theme}
+**叙事视角**：{ctx.narrative_perspective}
+**世界观设定**：
+- 时代背景：{ctx.time_period}
+- 地理位置：{ctx.location}
+- 氛围基调：{ctx.atmosphere}
+{ctx.world_setting_context}
 
 ---
-""")
 
-        # 创作要求
-        prompt_parts.append(f"""## ✨ 创作要求
+{characters_section}{outline_section}{previous_section}{style_section}## 创作要求
 
 1. **解决问题**：针对上述修改指令中提到的所有问题进行改进
 2. **保持连贯**：确保与前后章节的情节、人物、风格保持一致
 3. **提升质量**：在节奏、情感、描写等方面明显优于原版
 4. **保留精华**：保持原章节中优秀的部分和关键情节
 5. **字数控制**：目标字数约{target_word_count}字（可适当浮动±20%）
-{f"6. **风格一致**：严格按照上述写作风格进行创作" if style_content else ""}
+{style_rule}
 
 ---
 
-## 🎬 开始创作
-
-请现在开始创作改进后的新版本章节内容。
-
-**重要提示**：
-- 直接输出章节正文内容，从故事内容开始写
-- **不要**输出章节标题（如"第X章"、"第X章：XXX"等）
-- **不要**输出任何额外的说明、注释或元数据
-- 只需要纯粹的故事正文内容
-
-现在开始：
-""")
-
-        return "\n".join(prompt_parts)
+{_CHAPTER_REGEN_CLOSING}"""
 
     @classmethod
     async def get_mcp_tool_test_prompts(
@@ -4341,96 +4645,176 @@ narrative_perspective：{narrative_perspective}
         Returns:
             包含user和system提示词的字典
         """
-        # 获取用户自定义或系统默认的user提示词
-        if user_id and db:
-            user_template = await cls.get_template("MCP_TOOL_TEST", user_id, db)
-        else:
-            user_template = cls.MCP_TOOL_TEST
-
-        # 获取用户自定义或系统默认的system提示词
+        # user/system提示词一次批量获取（单条IN查询，避免两次往返）
         if user_id and db:
-            system_template = await cls.get_template(
-                "MCP_TOOL_TEST_SYSTEM", user_id, db
+            templates = await cls.get_templates(
+                ["MCP_TOOL_TEST", "MCP_TOOL_TEST_SYSTEM"], user_id, db
             )
+            user_template = templates["MCP_TOOL_TEST"]
+            system_template = templates["MCP_TOOL_TEST_SYSTEM"]
         else:
+            user_template = cls.MCP_TOOL_TEST
             system_template = cls.MCP_TOOL_TEST_SYSTEM
 
         return {
-            "user": cls.format_prompt(user_template, plugin_name=plugin_name),
+            "user": _render_cached(user_template, (("plugin_name", plugin_name),)),
             "system": system_template,
         }
 
     # ========== 自定义提示词支持 ==========
 
     @classmethod
-    async def get_template_with_fallback(
+    async def resolve_template(
         cls, template_key: str, user_id: str = None, db=None
     ) -> str:
         """
-        获取提示词模板（优先用户自定义，支持降级）
+        统一的模板解析入口：无用户上下文/自定义命中/降级/未知键四种分支一处处理
 
         Args:
             template_key: 模板键名
-            user_id: 用户ID（可选，如果不提供则直接返回系统默认）
+            user_id: 用户ID（可选，不提供则直接返回系统默认）
             db: 数据库会话（可选）
 
         Returns:
-            提示词模板内容
+            提示词模板内容（系统默认也不存在时返回None）
         """
-        # 如果没有提供user_id或db，直接返回系统默认
+        # 无用户上下文：直接走预构建的系统默认字典
         if not user_id or not db:
-            return getattr(cls, template_key, None)
-
-        # 尝试获取用户自定义模板
-        return await cls.get_template(template_key, user_id, db)
+            return cls._SYSTEM_TEMPLATES.get(template_key)
 
-    @classmethod
-    async def get_template(cls, template_key: str, user_id: str, db) -> str:
-        """
-        获取提示词模板（优先用户自定义）
-
-        Args:
-            template_key: 模板键名
-            user_id: 用户ID
-            db: 数据库会话
-
-        Returns:
-            提示词模板内容
-        """
         from sqlalchemy import select
         from app.models.prompt_template import PromptTemplate
         from app.logger import get_logger
 
         logger = get_logger(__name__)
 
-        # 1. 尝试从数据库获取用户自定义模板
+        # 进程内TTL缓存（含"无自定义"的否定缓存）；命中时静默返回，不重复刷日志
+        cached = _template_cache_get(user_id, template_key)
+        if cached is not None:
+            if cached[1] is not _TEMPLATE_CACHE_MISS:
+                return cached[1]
+            template_content = cls._SYSTEM_TEMPLATES.get(template_key)
+            if template_content is None:
+                logger.warning("⚠️ 未找到系统默认模板: %s", template_key)
+            return template_content
+
+        # 查询用户自定义模板，结果（含未命中）写回缓存。
+        # 只取template_content列，跳过整个ORM对象的水合开销
         result = await db.execute(
-            select(PromptTemplate).where(
+            select(PromptTemplate.template_content).where(
                 PromptTemplate.user_id == user_id,
                 PromptTemplate.template_key == template_key,
                 PromptTemplate.is_active == True,
             )
         )
-        custom_template = result.scalar_one_or_none()
+        custom_content = result.scalar_one_or_none()
+
+        if custom_content is not None:
+            _template_cache_put(user_id, template_key, custom_content)
+            template_content = custom_content
+            source = "custom"
+        else:
+            _template_cache_put(user_id, template_key, _TEMPLATE_CACHE_MISS)
+            template_content = cls._SYSTEM_TEMPLATES.get(template_key)
+            source = "system" if template_content is not None else "missing"
 
-        if custom_template:
+        # 单点日志：惰性%格式化，source标注解析来源
+        if source == "missing":
+            logger.warning("⚠️ 未找到系统默认模板: %s", template_key)
+        else:
             logger.info(
-                f"✅ 使用用户自定义提示词: user_id={user_id}, template_key={template_key}, template_name={custom_template.template_name}"
+                "提示词模板解析: template_key=%s, source=%s, user_id=%s",
+                template_key, source, user_id,
             )
-            return custom_template.template_content
+        return template_content
 
-        # 2. 降级到系统默认模板
-        logger.info(
-            f"⚪ 使用系统默认提示词: user_id={user_id}, template_key={template_key} (未找到自定义模板)"
-        )
+    @classmethod
+    async def get_template_with_fallback(
+        cls, template_key: str, user_id: str = None, db=None
+    ) -> str:
+        """获取提示词模板（优先用户自定义，支持降级）——resolve_template的别名"""
+        return await cls.resolve_template(template_key, user_id, db)
 
-        # 直接从类属性获取系统默认模板
-        template_content = getattr(cls, template_key, None)
+    @classmethod
+    async def get_template(cls, template_key: str, user_id: str, db) -> str:
+        """获取提示词模板（优先用户自定义）——resolve_template的别名"""
+        return await cls.resolve_template(template_key, user_id, db)
 
-        if template_content is None:
-            logger.warning(f"⚠️ 未找到系统默认模板: {template_key}")
+    @classmethod
+    def invalidate_template_cache(cls, user_id: str, template_key: str = None) -> None:
+        """
+        自定义模板写入后使进程内缓存失效
 
-        return template_content
+        Args:
+            user_id: 用户ID
+            template_key: 模板键名（不传则清除该用户的全部缓存条目）
+        """
+        if template_key is not None:
+            _TEMPLATE_CACHE.pop((user_id, template_key), None)
+            return
+        for key in [k for k in _TEMPLATE_CACHE if k[0] == user_id]:
+            _TEMPLATE_CACHE.pop(key, None)
+
+    @classmethod
+    async def get_templates(cls, template_keys, user_id: str, db) -> Dict[str, str]:
+        """
+        批量获取提示词模板（优先用户自定义，缺失键降级到系统默认）
+
+        一条 IN 查询取回全部自定义模板，供同一次请求中需要多个模板的
+        调用方使用，避免逐键查询的N+1往返。
+
+        Args:
+            template_keys: 模板键名列表
+            user_id: 用户ID
+            db: 数据库会话
+
+        Returns:
+            {模板键: 模板内容} 字典（系统默认也不存在的键值为None）
+        """
+        from sqlalchemy import select
+        from app.models.prompt_template import PromptTemplate
+        from app.logger import get_logger
+
+        logger = get_logger(__name__)
+
+        template_keys = list(template_keys)
+
+        # 先走进程内TTL缓存，仅对未命中的键发起一次IN查询
+        custom: Dict[str, str] = {}
+        pending: list = []
+        for key in template_keys:
+            cached = _template_cache_get(user_id, key)
+            if cached is None:
+                pending.append(key)
+            elif cached[1] is not _TEMPLATE_CACHE_MISS:
+                custom[key] = cached[1]
+
+        if pending:
+            result = await db.execute(
+                select(PromptTemplate.template_key, PromptTemplate.template_content).where(
+                    PromptTemplate.user_id == user_id,
+                    PromptTemplate.template_key.in_(pending),
+                    PromptTemplate.is_active == True,
+                )
+            )
+            fetched = dict(result.all())
+            for key in pending:
+                if key in fetched:
+                    custom[key] = fetched[key]
+                    _template_cache_put(user_id, key, fetched[key])
+                else:
+                    _template_cache_put(user_id, key, _TEMPLATE_CACHE_MISS)
+
+        templates: Dict[str, str] = {}
+        for key in template_keys:
+            if key in custom:
+                templates[key] = custom[key]
+                continue
+            content = cls._SYSTEM_TEMPLATES.get(key)
+            if content is None:
+                logger.warning("⚠️ 未找到系统默认模板: %s", key)
+            templates[key] = content
+        return templates
 
     @classmethod
     def get_all_system_templates(cls) -> list:
@@ -4440,553 +4824,30 @@ narrative_perspective：{narrative_perspective}
         Returns:
             系统模板列表
         """
-        templates = []
-
-        # 定义所有模板及其元信息
-        template_definitions = {
-            "NOVEL_COVER_PROMPT_TEMPLATE": {
-                "name": "小说封面生成",
-                "category": "封面生成",
-                "description": "根据项目基础信息生成小说封面绘制提示词，适用于竖版书籍封面",
-                "parameters": ["title", "genre", "theme", "description"],
-            },
-            "WORLD_BUILDING": {
-                "name": "世界构建",
-                "category": "世界构建",
-                "description": "用于生成小说世界观设定，包括时间背景、地理位置、氛围基调和世界规则",
-                "parameters": ["title", "theme", "genre", "description"],
-            },
-            "BOOK_IMPORT_REVERSE_PROJECT_SUGGESTION": {
-                "name": "拆书导入-反向项目提炼",
-                "category": "拆书导入",
-                "description": "基于前3章内容反向提炼简介、主题、类型、叙事视角与目标字数",
-                "parameters": ["title", "sampled_text"],
-            },
-            "BOOK_IMPORT_REVERSE_OUTLINES": {
-                "name": "拆书导入-反向章节大纲",
-                "category": "拆书导入",
-                "description": "基于章节正文反向生成与OUTLINE_CREATE一致结构的大纲（单批次5章）",
-                "parameters": [
-                    "title",
-                    "genre",
-                    "theme",
-                    "narrative_perspective",
-                    "start_chapter",
-                    "end_chapter",
-                    "expected_count",
-                    "chapters_text",
-                ],
-            },
-            "CHARACTERS_BATCH_GENERATION": {
-                "name": "批量角色生成",
-                "category": "角色生成",
-                "description": "批量生成多个角色和组织，建立角色关系网络",
-                "parameters": [
-                    "count",
-                    "time_period",
-                    "location",
-                    "atmosphere",
-                    "rules",
-                    "theme",
-                    "genre",
-                    "requirements",
-                ],
-            },
-            "SINGLE_CHARACTER_GENERATION": {
-                "name": "单个角色生成",
-                "category": "角色生成",
-                "description": "生成单个角色的详细设定",
-                "parameters": ["project_context", "user_input"],
-            },
-            "SINGLE_ORGANIZATION_GENERATION": {
-                "name": "组织生成",
-                "category": "角色生成",
-                "description": "生成组织/势力的详细设定",
-                "parameters": ["project_context", "user_input"],
-            },
-            "OUTLINE_CREATE": {
-                "name": "大纲生成",
-                "category": "大纲生成",
-                "description": "根据项目信息生成完整的章节大纲",
-                "parameters": [
-                    "title",
-                    "theme",
-                    "genre",
-                    "chapter_count",
-                    "narrative_perspective",
-                    "target_words",
-                    "time_period",
-                    "location",
-                    "atmosphere",
-                    "rules",
-                    "characters_info",
-                    "requirements",
-                    "mcp_references",
-                ],
-            },
-            "OUTLINE_CONTINUE": {
-                "name": "大纲续写",
-                "category": "大纲生成",
-                "description": "基于已有章节续写大纲",
-                "parameters": [
-                    "title",
-                    "theme",
-                    "genre",
-                    "narrative_perspective",
-                    "chapter_count",
-                    "time_period",
-                    "location",
-                    "atmosphere",
-                    "rules",
-                    "characters_info",
-                    "current_chapter_count",
-                    "all_chapters_brief",
-                    "recent_plot",
-                    "memory_context",
-                    "mcp_references",
-                    "plot_stage_instruction",
-                    "start_chapter",
-                    "end_chapter",
-                    "story_direction",
-                    "requirements",
-                ],
-            },
-            "CHAPTER_GENERATION_ONE_TO_MANY": {
-                "name": "章节创作-1-N模式（第1章）",
-                "category": "章节创作",
-                "description": "1-N模式：根据大纲创作章节内容（用于第1章，无前置章节）",
-                "parameters": [
-                    "project_title",
-                    "genre",
-                    "chapter_number",
-                    "chapter_title",
-                    "chapter_outline",
-                    "target_word_count",
-                    "narrative_perspective",
-                    "characters_info",
-                    "goldfinger_context",
-                ],
-            },
-            "CHAPTER_GENERATION_ONE_TO_MANY_NEXT": {
-                "name": "章节创作-1-N模式（第2章及以后）",
-                "category": "章节创作",
-                "description": "1-N模式：基于前置章节内容创作新章节（用于第2章及以后）",
-                "parameters": [
-                    "project_title",
-                    "genre",
-                    "chapter_number",
-                    "chapter_title",
-                    "chapter_outline",
-                    "target_word_count",
-                    "narrative_perspective",
-                    "characters_info",
-                    "goldfinger_context",
-                    "continuation_point",
-                    "foreshadow_reminders",
-                    "relevant_memories",
-                    "story_skeleton",
-                    "previous_chapter_summary",
-                ],
-            },
-            "CHAPTER_GENERATION_ONE_TO_ONE": {
-                "name": "章节创作-1-1模式（第1章）",
-                "category": "章节创作",
-                "description": "1-1模式：章节创作（用于第1章，无前置章节）",
-                "parameters": [
-                    "project_title",
-                    "genre",
-                    "chapter_number",
-                    "chapter_title",
-                    "chapter_outline",
-                    "target_word_count",
-                    "narrative_perspective",
-                    "characters_info",
-                    "goldfinger_context",
-                    "chapter_careers",
-                ],
-            },
-            "CHAPTER_GENERATION_ONE_TO_ONE_NEXT": {
-                "name": "章节创作-1-1模式（第2章及以后）",
-                "category": "章节创作",
-                "description": "1-1模式：基于上一章内容创作新章节（用于第2章及以后）",
-                "parameters": [
-                    "project_title",
-                    "genre",
-                    "chapter_number",
-                    "chapter_title",
-                    "chapter_outline",
-                    "target_word_count",
-                    "narrative_perspective",
-                    "previous_chapter_content",
-                    "characters_info",
-                    "goldfinger_context",
-                    "chapter_careers",
-                    "foreshadow_reminders",
-                    "relevant_memories",
-                ],
-            },
-            "CHAPTER_REGENERATION_SYSTEM": {
-                "name": "章节重写系统提示",
-                "category": "章节重写",
-                "description": "用于章节重写的系统提示词",
-                "parameters": [
-                    "chapter_number",
-                    "title",
-                    "word_count",
-                    "content",
-                    "modification_instructions",
-                    "project_context",
-                    "style_content",
-                    "target_word_count",
-                ],
-            },
-            "PARTIAL_REGENERATE": {
-                "name": "局部重写",
-                "category": "章节重写",
-                "description": "根据用户修改要求重写选中的段落内容",
-                "parameters": [
-                    "context_before",
-                    "original_word_count",
-                    "selected_text",
-                    "context_after",
-                    "user_instructions",
-                    "length_requirement",
-                    "style_content",
-                ],
-            },
-            "PLOT_ANALYSIS": {
-                "name": "情节分析",
-                "category": "情节分析",
-                "description": "深度分析章节的剧情、钩子、伏笔等",
-                "parameters": ["chapter_number", "title", "content", "word_count"],
-            },
-            "OUTLINE_EXPAND_SINGLE": {
-                "name": "大纲单批次展开",
-                "category": "情节展开",
-                "description": "将大纲节点展开为详细章节规划（单批次）",
-                "parameters": [
-                    "project_title",
-                    "project_genre",
-                    "project_theme",
-                    "project_narrative_perspective",
-                    "project_world_time_period",
-                    "project_world_location",
-                    "project_world_atmosphere",
-                    "characters_info",
-                    "outline_order_index",
-                    "outline_title",
-                    "outline_content",
-                    "context_info",
-                    "strategy_instruction",
-                    "target_chapter_count",
-                    "scene_instruction",
-                    "scene_field",
-                ],
-            },
-            "OUTLINE_EXPAND_MULTI": {
-                "name": "大纲分批展开",
-                "category": "情节展开",
-                "description": "将大纲节点展开为详细章节规划（分批）",
-                "parameters": [
-                    "project_title",
-                    "project_genre",
-                    "project_theme",
-                    "project_narrative_perspective",
-                    "project_world_time_period",
-                    "project_world_location",
-                    "project_world_atmosphere",
-                    "characters_info",
-                    "outline_order_index",
-                    "outline_title",
-                    "outline_content",
-                    "context_info",
-                    "previous_context",
-                    "strategy_instruction",
-                    "start_index",
-                    "end_index",
-                    "target_chapter_count",
-                    "scene_instruction",
-                    "scene_field",
-                ],
-            },
-            "MCP_TOOL_TEST": {
-                "name": "MCP工具测试(用户提示词)",
-                "category": "MCP测试",
-                "description": "用于测试MCP插件功能的用户提示词",
-                "parameters": ["plugin_name"],
-            },
-            "MCP_TOOL_TEST_SYSTEM": {
-                "name": "MCP工具测试(系统提示词)",
-                "category": "MCP测试",
-                "description": "用于测试MCP插件功能的系统提示词",
-                "parameters": [],
-            },
-            "MCP_WORLD_BUILDING_PLANNING": {
-                "name": "MCP世界观规划",
-                "category": "MCP增强",
-                "description": "使用MCP工具搜索资料辅助世界观设计",
-                "parameters": ["title", "genre", "theme", "description"],
-            },
-            "MCP_CHARACTER_PLANNING": {
-                "name": "MCP角色规划",
-                "category": "MCP增强",
-                "description": "使用MCP工具搜索资料辅助角色设计",
-                "parameters": ["title", "genre", "theme", "time_period", "location"],
-            },
-            "AUTO_CHARACTER_ANALYSIS": {
-                "name": "自动角色分析",
-                "category": "自动角色引入",
-                "description": "分析新生成的大纲，判断是否需要引入新角色",
-                "parameters": [
-                    "title",
-                    "genre",
-                    "theme",
-                    "time_period",
-                    "location",
-                    "atmosphere",
-                    "existing_characters",
-                    "new_outlines",
-                    "start_chapter",
-                    "end_chapter",
-                ],
-            },
-            "AUTO_CHARACTER_GENERATION": {
-                "name": "自动角色生成",
-                "category": "自动角色引入",
-                "description": "根据剧情需求自动生成新角色的完整设定",
-                "parameters": [
-                    "title",
-                    "genre",
-                    "theme",
-                    "time_period",
-                    "location",
-                    "atmosphere",
-                    "rules",
-                    "existing_characters",
-                    "plot_context",
-                    "character_specification",
-                    "mcp_references",
-                ],
-            },
-            "AUTO_ORGANIZATION_ANALYSIS": {
-                "name": "自动组织分析",
-                "category": "自动组织引入",
-                "description": "分析新生成的大纲，判断是否需要引入新组织",
-                "parameters": [
-                    "title",
-                    "genre",
-                    "theme",
-                    "time_period",
-                    "location",
-                    "atmosphere",
-                    "existing_organizations",
-                    "existing_characters",
-                    "all_chapters_brief",
-                    "start_chapter",
-                    "chapter_count",
-                    "plot_stage",
-                    "story_direction",
-                ],
-            },
-            "AUTO_ORGANIZATION_GENERATION": {
-                "name": "自动组织生成",
-                "category": "自动组织引入",
-                "description": "根据剧情需求自动生成新组织的完整设定",
-                "parameters": [
-                    "title",
-                    "genre",
-                    "theme",
-                    "time_period",
-                    "location",
-                    "atmosphere",
-                    "rules",
-                    "existing_organizations",
-                    "existing_characters",
-                    "plot_context",
-                    "organization_specification",
-                    "mcp_references",
-                ],
-            },
-            "CAREER_SYSTEM_GENERATION": {
-                "name": "职业体系生成",
-                "category": "世界构建",
-                "description": "根据世界观和项目简介自动生成完整的职业体系，包括主职业和副职业",
-                "parameters": [
-                    "title",
-                    "genre",
-                    "theme",
-                    "description",
-                    "time_period",
-                    "location",
-                    "atmosphere",
-                    "rules",
-                ],
-            },
-            "INSPIRATION_TITLE_SYSTEM": {
-                "name": "灵感模式-书名生成(系统提示词)",
-                "category": "灵感模式",
-                "description": "根据用户的原始想法生成6个书名建议的系统提示词",
-                "parameters": ["initial_idea"],
-            },
-            "INSPIRATION_TITLE_USER": {
-                "name": "灵感模式-书名生成(用户提示词)",
-                "category": "灵感模式",
-                "description": "根据用户的原始想法生成6个书名建议的用户提示词",
-                "parameters": ["initial_idea"],
-            },
-            "INSPIRATION_DESCRIPTION_SYSTEM": {
-                "name": "灵感模式-简介生成(系统提示词)",
-                "category": "灵感模式",
-                "description": "根据用户想法和书名生成6个简介选项的系统提示词",
-                "parameters": ["initial_idea", "title"],
-            },
-            "INSPIRATION_DESCRIPTION_USER": {
-                "name": "灵感模式-简介生成(用户提示词)",
-                "category": "灵感模式",
-                "description": "根据用户想法和书名生成6个简介选项的用户提示词",
-                "parameters": ["initial_idea", "title"],
-            },
-            "INSPIRATION_THEME_SYSTEM": {
-                "name": "灵感模式-主题生成(系统提示词)",
-                "category": "灵感模式",
-                "description": "根据书名和简介生成6个深刻的主题选项的系统提示词",
-                "parameters": ["initial_idea", "title", "description"],
-            },
-            "INSPIRATION_THEME_USER": {
-                "name": "灵感模式-主题生成(用户提示词)",
-                "category": "灵感模式",
-                "description": "根据书名和简介生成6个深刻的主题选项的用户提示词",
-                "parameters": ["initial_idea", "title", "description"],
-            },
-            "INSPIRATION_GENRE_SYSTEM": {
-                "name": "灵感模式-类型生成(系统提示词)",
-                "category": "灵感模式",
-                "description": "根据小说信息生成6个合适的类型标签的系统提示词",
-                "parameters": ["initial_idea", "title", "description", "theme"],
-            },
-            "INSPIRATION_GENRE_USER": {
-                "name": "灵感模式-类型生成(用户提示词)",
-                "category": "灵感模式",
-                "description": "根据小说信息生成6个合适的类型标签的用户提示词",
-                "parameters": ["initial_idea", "title", "description", "theme"],
-            },
-            "INSPIRATION_WORLD_SYSTEM": {
-                "name": "灵感模式-世界观生成(系统提示词)",
-                "category": "灵感模式",
-                "description": "根据小说信息生成6个世界观设定方案的系统提示词",
-                "parameters": ["initial_idea", "title", "description", "genre"],
-            },
-            "INSPIRATION_WORLD_USER": {
-                "name": "灵感模式-世界观生成(用户提示词)",
-                "category": "灵感模式",
-                "description": "根据书名和类型生成6个世界观设定方案的用户提示词",
-                "parameters": ["title", "genre"],
-            },
-            "INSPIRATION_CONFLICT_SYSTEM": {
-                "name": "灵感模式-核心冲突生成(系统提示词)",
-                "category": "灵感模式",
-                "description": "根据小说信息生成6个核心冲突选项的系统提示词",
-                "parameters": ["title", "genre", "world_setting"],
-            },
-            "INSPIRATION_CONFLICT_USER": {
-                "name": "灵感模式-核心冲突生成(用户提示词)",
-                "category": "灵感模式",
-                "description": "根据书名和世界观生成6个核心冲突选项的用户提示词",
-                "parameters": ["title", "world_setting"],
-            },
-            "INSPIRATION_PROTAGONIST_SYSTEM": {
-                "name": "灵感模式-主角人设生成(系统提示词)",
-                "category": "灵感模式",
-                "description": "根据小说信息生成6个主角人设原型的系统提示词",
-                "parameters": ["title", "genre", "core_conflict"],
-            },
-            "INSPIRATION_PROTAGONIST_USER": {
-                "name": "灵感模式-主角人设生成(用户提示词)",
-                "category": "灵感模式",
-                "description": "根据书名和核心冲突生成6个主角人设选项的用户提示词",
-                "parameters": ["title", "core_conflict"],
-            },
-            "INSPIRATION_GOLDEN_FINGER_SYSTEM": {
-                "name": "灵感模式-金手指生成(系统提示词)",
-                "category": "灵感模式",
-                "description": "根据小说信息生成6个主角特殊优势选项的系统提示词",
-                "parameters": ["title", "genre", "protagonist"],
-            },
-            "INSPIRATION_GOLDEN_FINGER_USER": {
-                "name": "灵感模式-金手指生成(用户提示词)",
-                "category": "灵感模式",
-                "description": "根据书名和主角生成6个金手指选项的用户提示词",
-                "parameters": ["title", "protagonist"],
-            },
-            "INSPIRATION_DYNAMIC_SYSTEM": {
-                "name": "灵感模式-动态引导(系统提示词)",
-                "category": "灵感模式",
-                "description": "根据当前上下文动态生成下一步引导问题和选项的系统提示词",
-                "parameters": ["context_json"],
-            },
-            "INSPIRATION_DYNAMIC_USER": {
-                "name": "灵感模式-动态引导(用户提示词)",
-                "category": "灵感模式",
-                "description": "请求动态引导代理分析当前进度并生成下一步问题和选项",
-                "parameters": [],
-            },
-            "INSPIRATION_DIRECTION_CARDS": {
-                "name": "灵感模式-方向卡片生成",
-                "category": "灵感模式",
-                "description": "将用户创意扩展为严格JSON结构的故事方向卡片候选",
-                "parameters": ["idea", "context_json", "card_count", "guidance"],
-            },
-            "INSPIRATION_MERGE_CARDS": {
-                "name": "灵感模式-方向卡片合并",
-                "category": "灵感模式",
-                "description": "将两张故事方向卡片合并为严格JSON结构的单张方向卡片",
-                "parameters": ["cards_json", "primary_card_id", "instructions"],
-            },
-            "INSPIRATION_STORY_BIBLE": {
-                "name": "灵感模式-故事圣经草稿",
-                "category": "灵感模式",
-                "description": "将方向卡片和用户确认字段整理为严格JSON结构的故事圣经草稿",
-                "parameters": [
-                    "idea",
-                    "direction_card_json",
-                    "confirmed_fields_json",
-                    "user_edits_json",
-                    "constraints_json",
-                ],
-            },
-            "INSPIRATION_QUALITY_CHECK": {
-                "name": "灵感模式-质量评估",
-                "category": "灵感模式",
-                "description": "对方向卡片或故事圣经草稿输出严格JSON结构的质量评分和问题列表",
-                "parameters": ["draft_json", "context_json"],
-            },
-            "INSPIRATION_REPAIR": {
-                "name": "灵感模式-单次修复",
-                "category": "灵感模式",
-                "description": "根据质量问题对方向卡片或故事圣经草稿进行一次严格JSON结构修复",
-                "parameters": ["draft_json", "issues_json", "instructions"],
-            },
-            "INSPIRATION_QUICK_COMPLETE": {
-                "name": "灵感模式-智能补全",
-                "category": "灵感模式",
-                "description": "根据用户提供的部分信息智能补全完整的小说方案",
-                "parameters": ["existing"],
-            },
-        }
+        # 系统模板部分在运行期不变，首次调用构建后复用；
+        # Skill 模板有独立缓存且支持管理端手动刷新，每次调用现取
+        if cls._system_templates_cache is None:
+            # 单次列表推导构建（海象绑定content，省去二次字典查找）
+            templates = [
+                {
+                    "template_key": key,
+                    "template_name": info["name"],
+                    "category": info["category"],
+                    "description": info["description"],
+                    "parameters": info["parameters"],
+                    "content": content,
+                }
+                for key, info in _SYSTEM_TEMPLATE_DEFINITIONS.items()
+                if (content := cls._SYSTEM_TEMPLATES.get(key))
+            ]
+            cls._system_templates_cache = templates
+            # 键驻留：与代码里的字面量键共享同一字符串对象，比较走指针快路径
+            cls._template_index = {
+                sys.intern(t["template_key"]): t for t in templates
+            }
 
-        for key, info in template_definitions.items():
-            template_content = getattr(cls, key, None)
-            if template_content:
-                templates.append(
-                    {
-                        "template_key": key,
-                        "template_name": info["name"],
-                        "category": info["category"],
-                        "description": info["description"],
-                        "parameters": info["parameters"],
-                        "content": template_content,
-                    }
-                )
+        # 浅拷贝供调用方自由增删，内部字典共享（调用方约定只读）
+        templates = list(cls._system_templates_cache)
 
         # 加载 Skill 提示词模板
         try:
@@ -5009,12 +4870,46 @@ narrative_perspective：{narrative_perspective}
         Returns:
             模板信息字典
         """
-        all_templates = cls.get_all_system_templates()
-        for template in all_templates:
-            if template["template_key"] == template_key:
-                return template
+        if cls._template_index is None:
+            cls.get_all_system_templates()
+
+        # 系统模板走索引O(1)命中；Skill模板可在运行期刷新，未命中时现查
+        info = cls._template_index.get(template_key)
+        if info is not None:
+            return info
+        try:
+            for template in get_all_skills_cached():
+                if template["template_key"] == template_key:
+                    return template
+        except Exception as e:
+            from app.logger import get_logger
+            get_logger(__name__).warning(f"加载 Skill 模板失败: {e}")
         return None
 
 
+# 导入期预编译全部内置模板常量，首次请求即可命中分段缓存
+for _template in vars(PromptService).values():
+    if isinstance(_template, str) and "{" in _template:
+        _compile_format_template(_template)
+del _template
+
+
+# 系统默认模板的键→内容映射：类体结束后构建一次，
+# 模板键查找走单次字典取值，也为枚举合法键提供O(1)入口
+PromptService._SYSTEM_TEMPLATES = {
+    _name: _value
+    for _name, _value in vars(PromptService).items()
+    if _name.isupper() and isinstance(_value, str)
+}
+
+
+# 模板内容指纹：模板文本一旦变更版本号随之变化，
+# 下游缓存/追踪可用 (模板版本, 上下文) 作组合键实现自动失效
+PromptService.VERSIONS = {
+    _name: hashlib.sha256(_value.encode("utf-8")).hexdigest()[:16]
+    for _name, _value in PromptService._SYSTEM_TEMPLATES.items()
+}
+
+
 # ========== 全局实例 ==========
 prompt_service = PromptService()
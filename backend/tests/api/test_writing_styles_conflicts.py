@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+# pyright: reportImplicitRelativeImport=false, reportMissingImports=false
+
+import sys
+import types
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+
+if "mcp" not in sys.modules:
+    _mcp_stub = types.ModuleType("mcp")
+    setattr(_mcp_stub, "ClientSession", type("ClientSession", (), {}))
+    setattr(_mcp_stub, "types", types.SimpleNamespace(TextContent=type("TextContent", (), {}), ImageContent=type("ImageContent", (), {})))
+    _client_stub = types.ModuleType("mcp.client")
+    _streamable_stub = types.ModuleType("mcp.client.streamable_http")
+    _sse_stub = types.ModuleType("mcp.client.sse")
+
+    class _StubContext:
+        async def __aenter__(self) -> tuple[None, None, None]:
+            return (None, None, None)
+
+        async def __aexit__(self, exc_type: object, exc: object, traceback: object) -> bool:
+            return False
+
+    def _streamablehttp_client(**kwargs: object) -> _StubContext:
+        _ = kwargs
+        return _StubContext()
+
+    def _sse_client(**kwargs: object) -> _StubContext:
+        _ = kwargs
+        return _StubContext()
+
+    setattr(_streamable_stub, "streamablehttp_client", _streamablehttp_client)
+    setattr(_sse_stub, "sse_client", _sse_client)
+    _ = sys.modules.setdefault("mcp", _mcp_stub)
+    _ = sys.modules.setdefault("mcp.client", _client_stub)
+    _ = sys.modules.setdefault("mcp.client.streamable_http", _streamable_stub)
+    _ = sys.modules.setdefault("mcp.client.sse", _sse_stub)
+
+_memory_service_stub = types.ModuleType("app.services.memory_service")
+setattr(_memory_service_stub, "memory_service", types.SimpleNamespace())
+_ = sys.modules.setdefault("app.services.memory_service", _memory_service_stub)
+
+
+class _StubEmailService:
+    async def send_mail(self, **_: object) -> None:
+        return None
+
+
+_email_service_stub = types.ModuleType("app.services.email_service")
+setattr(_email_service_stub, "email_service", _StubEmailService())
+_ = sys.modules.setdefault("app.services.email_service", _email_service_stub)
+
+from app.models.writing_style import WritingStyle
+
+
+pytestmark = pytest.mark.anyio
+
+
+async def _seed_preset(async_db_session: async_sessionmaker[AsyncSession]) -> None:
+    async with async_db_session() as session:
+        session.add(
+            WritingStyle(
+                user_id=None,
+                name="自然流畅",
+                style_type="preset",
+                preset_id="natural",
+                prompt_content="平实自然的叙述。",
+                order_index=1,
+            )
+        )
+        await session.commit()
+
+
+async def test_duplicate_custom_name_returns_409(test_client: AsyncClient) -> None:
+    payload = {"name": "我的风格", "prompt_content": "短句为主。"}
+    first = await test_client.post("/api/writing-styles", json=payload)
+    assert first.status_code == 201
+
+    second = await test_client.post("/api/writing-styles", json=payload)
+    assert second.status_code == 409
+    assert "我的风格" in second.json()["detail"]
+
+
+async def test_applying_same_preset_twice_returns_409(
+    test_client: AsyncClient,
+    async_db_session: async_sessionmaker[AsyncSession],
+) -> None:
+    await _seed_preset(async_db_session)
+
+    # 未改名时 name 默认取预设名，第二次应用同一预设不能再500
+    payload = {"preset_id": "natural", "name": "", "prompt_content": ""}
+    first = await test_client.post("/api/writing-styles", json=payload)
+    assert first.status_code == 201
+    assert first.json()["name"] == "自然流畅"
+
+    second = await test_client.post("/api/writing-styles", json=payload)
+    assert second.status_code == 409
+
+
+async def test_rename_to_existing_name_returns_409(test_client: AsyncClient) -> None:
+    first = await test_client.post(
+        "/api/writing-styles", json={"name": "风格甲", "prompt_content": "内容甲"}
+    )
+    second = await test_client.post(
+        "/api/writing-styles", json={"name": "风格乙", "prompt_content": "内容乙"}
+    )
+    assert first.status_code == 201
+    assert second.status_code == 201
+
+    response = await test_client.put(
+        f"/api/writing-styles/{second.json()['id']}", json={"name": "风格甲"}
+    )
+    assert response.status_code == 409
+
+    # 改回自身名称不受影响
+    response = await test_client.put(
+        f"/api/writing-styles/{second.json()['id']}",
+        json={"name": "风格乙", "description": "补充描述"},
+    )
+    assert response.status_code == 200
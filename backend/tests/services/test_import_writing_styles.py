@@ -0,0 +1,146 @@
+from __future__ import annotations
+
+# pyright: reportImplicitRelativeImport=false, reportMissingImports=false, reportPrivateUsage=false
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.models.writing_style import WritingStyle
+from app.services.import_export_service import _import_writing_styles
+
+
+pytestmark = pytest.mark.anyio
+
+
+USER_ID = "user-style-import"
+
+
+def _styles_payload() -> list[dict]:
+    return [
+        {"name": "自然流畅", "style_type": "custom", "prompt_content": "平实叙述", "order_index": 1},
+        {"name": "古典优雅", "style_type": "custom", "prompt_content": "文言韵味", "order_index": 2},
+    ]
+
+
+class _NoRowcountSession:
+    """包装会话：模拟rowcount报-1的驱动（如部分executemany路径）"""
+
+    def __init__(self, session: AsyncSession) -> None:
+        self._session = session
+
+    def __getattr__(self, name: str):
+        return getattr(self._session, name)
+
+    async def execute(self, *args, **kwargs):
+        result = await self._session.execute(*args, **kwargs)
+
+        class _Proxy:
+            rowcount = -1
+
+            def __getattr__(self, name: str):
+                return getattr(result, name)
+
+        return _Proxy()
+
+
+async def test_import_inserts_styles_and_returns_count(
+    async_db_session: async_sessionmaker[AsyncSession],
+) -> None:
+    async with async_db_session() as session:
+        count = await _import_writing_styles(USER_ID, _styles_payload(), session)
+        await session.commit()
+
+        assert count == 2
+        result = await session.execute(
+            select(WritingStyle).where(WritingStyle.user_id == USER_ID)
+        )
+        names = sorted(style.name for style in result.scalars().all())
+        assert names == ["古典优雅", "自然流畅"]
+
+
+async def test_reimport_is_idempotent_via_on_conflict(
+    async_db_session: async_sessionmaker[AsyncSession],
+) -> None:
+    async with async_db_session() as session:
+        _ = await _import_writing_styles(USER_ID, _styles_payload(), session)
+        await session.commit()
+
+    async with async_db_session() as session:
+        # 同名载荷再导一次：ON CONFLICT DO NOTHING 不报错、不覆盖已有内容
+        payload = _styles_payload()
+        payload[0]["prompt_content"] = "第二次导入的改动内容"
+        count = await _import_writing_styles(USER_ID, payload, session)
+        await session.commit()
+
+        assert count == 0
+        result = await session.execute(
+            select(WritingStyle.prompt_content).where(
+                WritingStyle.user_id == USER_ID,
+                WritingStyle.name == "自然流畅",
+            )
+        )
+        assert result.scalar_one() == "平实叙述"
+
+
+async def test_partial_overlap_only_inserts_new_names(
+    async_db_session: async_sessionmaker[AsyncSession],
+) -> None:
+    async with async_db_session() as session:
+        _ = await _import_writing_styles(USER_ID, _styles_payload()[:1], session)
+        await session.commit()
+
+    async with async_db_session() as session:
+        count = await _import_writing_styles(USER_ID, _styles_payload(), session)
+        await session.commit()
+
+        assert count == 1
+        result = await session.execute(
+            select(WritingStyle).where(WritingStyle.user_id == USER_ID)
+        )
+        assert len(result.scalars().all()) == 2
+
+
+async def test_duplicates_inside_payload_are_deduplicated(
+    async_db_session: async_sessionmaker[AsyncSession],
+) -> None:
+    payload = _styles_payload() + [
+        {"name": "自然流畅", "style_type": "custom", "prompt_content": "重复项", "order_index": 3},
+    ]
+    async with async_db_session() as session:
+        count = await _import_writing_styles(USER_ID, payload, session)
+        await session.commit()
+
+        assert count == 2
+        result = await session.execute(
+            select(WritingStyle.prompt_content).where(
+                WritingStyle.user_id == USER_ID,
+                WritingStyle.name == "自然流畅",
+            )
+        )
+        # 载荷内同名时第一条生效
+        assert result.scalar_one() == "平实叙述"
+
+
+async def test_rowcount_fallback_counts_page_size(
+    async_db_session: async_sessionmaker[AsyncSession],
+) -> None:
+    async with async_db_session() as session:
+        count = await _import_writing_styles(
+            USER_ID, _styles_payload(), _NoRowcountSession(session)
+        )
+        await session.commit()
+
+        # 驱动报rowcount=-1时退回按页大小计数
+        assert count == 2
+        result = await session.execute(
+            select(WritingStyle).where(WritingStyle.user_id == USER_ID)
+        )
+        assert len(result.scalars().all()) == 2
+
+
+async def test_empty_payload_returns_zero(
+    async_db_session: async_sessionmaker[AsyncSession],
+) -> None:
+    async with async_db_session() as session:
+        assert await _import_writing_styles(USER_ID, [], session) == 0
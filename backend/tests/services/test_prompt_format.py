@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+# pyright: reportImplicitRelativeImport=false, reportMissingImports=false, reportPrivateUsage=false
+
+import pytest
+
+from app.services.prompt_service import PromptService, _compile_format_template
+
+
+def test_compile_splits_literals_and_fields() -> None:
+    parts, fields, required = _compile_format_template("开头{a}中间{b}结尾")
+
+    assert parts == ("开头", "中间", "结尾")
+    assert fields == ("a", "b")
+    assert required == frozenset({"a", "b"})
+
+
+def test_compile_unescapes_doubled_braces() -> None:
+    parts, fields, _ = _compile_format_template('输出JSON：{{"name": "{name}"}}')
+
+    # {{ / }} 还原为字面量花括号，不会被当作字段
+    assert fields == ("name",)
+    assert parts == ('输出JSON：{"name": "', '"}')
+
+
+def test_compile_returns_none_for_advanced_syntax() -> None:
+    # 格式规约、转换、属性/下标访问与位置参数都退回str.format
+    assert _compile_format_template("{count:03d}") is None
+    assert _compile_format_template("{value!r}") is None
+    assert _compile_format_template("{obj.attr}") is None
+    assert _compile_format_template("{items[0]}") is None
+    assert _compile_format_template("{}") is None
+
+
+def test_compile_returns_none_for_malformed_template() -> None:
+    assert _compile_format_template("未闭合{field") is None
+
+
+def test_format_prompt_fast_path_matches_str_format() -> None:
+    template = "标题：{title}\n正文：{content}\n标题再现：{title}"
+    kwargs = {"title": "雨夜", "content": "山门只在暴雨夜打开。"}
+
+    assert PromptService.format_prompt(template, **kwargs) == template.format(**kwargs)
+
+
+def test_format_prompt_renders_escaped_braces() -> None:
+    template = '返回{{"summary": "{summary}"}}格式'
+
+    assert (
+        PromptService.format_prompt(template, summary="摘要")
+        == '返回{"summary": "摘要"}格式'
+    )
+
+
+def test_format_prompt_missing_params_raise_value_error() -> None:
+    with pytest.raises(ValueError, match="缺少必需的参数"):
+        PromptService.format_prompt("{title}与{content}", title="只有标题")
+
+
+def test_format_prompt_missing_params_reported_together() -> None:
+    with pytest.raises(ValueError) as exc_info:
+        PromptService.format_prompt("{a}{b}{c}", b="有值")
+
+    # 一次报全所有缺失项
+    assert "'a'" in str(exc_info.value)
+    assert "'c'" in str(exc_info.value)
+
+
+def test_format_prompt_falls_back_for_format_spec() -> None:
+    # 高级语法走str.format路径，行为与内置一致
+    assert PromptService.format_prompt("第{index:03d}章", index=7) == "第007章"
+
+
+def test_format_prompt_fallback_missing_param_raises_value_error() -> None:
+    with pytest.raises(ValueError, match="缺少必需的参数"):
+        PromptService.format_prompt("第{index:03d}章")
+
+
+def test_format_prompt_non_string_values_use_format_builtin() -> None:
+    assert PromptService.format_prompt("共{count}章", count=12) == "共12章"
@@ -0,0 +1,206 @@
+from __future__ import annotations
+
+# pyright: reportImplicitRelativeImport=false, reportMissingImports=false, reportPrivateUsage=false
+
+import time
+from collections.abc import Iterator
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy import update
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.models.prompt_template import PromptTemplate
+from app.services import prompt_service
+from app.services.prompt_service import PromptService, _TEMPLATE_CACHE
+
+
+pytestmark = pytest.mark.anyio
+
+
+USER_ID = "user-template-cache"
+# 任取一个真实系统模板键，保证降级路径有内容可回
+SYSTEM_KEY = next(iter(PromptService._SYSTEM_TEMPLATES))
+
+
+@pytest.fixture(autouse=True)
+def _clean_template_cache() -> Iterator[None]:
+    _TEMPLATE_CACHE.clear()
+    yield
+    _TEMPLATE_CACHE.clear()
+
+
+class _CountingSession:
+    """包装会话：统计execute次数，验证缓存命中时不再查库"""
+
+    def __init__(self, session: AsyncSession) -> None:
+        self._session = session
+        self.query_count = 0
+
+    def __getattr__(self, name: str):
+        return getattr(self._session, name)
+
+    async def execute(self, *args, **kwargs):
+        self.query_count += 1
+        return await self._session.execute(*args, **kwargs)
+
+
+async def _seed_custom_template(
+    async_db_session: async_sessionmaker[AsyncSession],
+    content: str = "自定义模板内容",
+    is_active: bool = True,
+) -> None:
+    async with async_db_session() as session:
+        session.add(
+            PromptTemplate(
+                user_id=USER_ID,
+                template_key=SYSTEM_KEY,
+                template_name="自定义模板",
+                template_content=content,
+                is_active=is_active,
+            )
+        )
+        await session.commit()
+
+
+def _expire_cache_entry(template_key: str) -> None:
+    """把缓存条目的过期时刻拨到过去，模拟TTL到期"""
+    key = (USER_ID, template_key)
+    _, content = _TEMPLATE_CACHE[key]
+    _TEMPLATE_CACHE[key] = (time.monotonic() - 1.0, content)
+
+
+async def test_custom_template_is_cached_after_first_resolve(
+    async_db_session: async_sessionmaker[AsyncSession],
+) -> None:
+    await _seed_custom_template(async_db_session)
+    async with async_db_session() as session:
+        counting = _CountingSession(session)
+
+        first = await PromptService.resolve_template(SYSTEM_KEY, USER_ID, counting)
+        second = await PromptService.resolve_template(SYSTEM_KEY, USER_ID, counting)
+
+        assert first == "自定义模板内容"
+        assert second == "自定义模板内容"
+        assert counting.query_count == 1
+
+
+async def test_missing_custom_template_is_negative_cached(
+    async_db_session: async_sessionmaker[AsyncSession],
+) -> None:
+    async with async_db_session() as session:
+        counting = _CountingSession(session)
+
+        first = await PromptService.resolve_template(SYSTEM_KEY, USER_ID, counting)
+        second = await PromptService.resolve_template(SYSTEM_KEY, USER_ID, counting)
+
+        # 无自定义时降级到系统默认，"未命中"本身也被缓存
+        assert first == PromptService._SYSTEM_TEMPLATES[SYSTEM_KEY]
+        assert second == first
+        assert counting.query_count == 1
+
+
+async def test_inactive_custom_template_falls_back_to_system(
+    async_db_session: async_sessionmaker[AsyncSession],
+) -> None:
+    await _seed_custom_template(async_db_session, is_active=False)
+    async with async_db_session() as session:
+        resolved = await PromptService.resolve_template(SYSTEM_KEY, USER_ID, session)
+
+        assert resolved == PromptService._SYSTEM_TEMPLATES[SYSTEM_KEY]
+
+
+async def test_expired_entry_is_refetched(
+    async_db_session: async_sessionmaker[AsyncSession],
+) -> None:
+    await _seed_custom_template(async_db_session)
+    async with async_db_session() as session:
+        counting = _CountingSession(session)
+
+        _ = await PromptService.resolve_template(SYSTEM_KEY, USER_ID, counting)
+        _expire_cache_entry(SYSTEM_KEY)
+        _ = await PromptService.resolve_template(SYSTEM_KEY, USER_ID, counting)
+
+        assert counting.query_count == 2
+
+
+async def test_stale_until_invalidated_then_fresh(
+    async_db_session: async_sessionmaker[AsyncSession],
+) -> None:
+    await _seed_custom_template(async_db_session, content="旧版内容")
+    async with async_db_session() as session:
+        assert await PromptService.resolve_template(SYSTEM_KEY, USER_ID, session) == "旧版内容"
+
+    # 绕过API直接改库：TTL内缓存仍返回旧内容，这正是写路径必须主动失效的原因
+    async with async_db_session() as session:
+        _ = await session.execute(
+            update(PromptTemplate)
+            .where(
+                PromptTemplate.user_id == USER_ID,
+                PromptTemplate.template_key == SYSTEM_KEY,
+            )
+            .values(template_content="新版内容")
+        )
+        await session.commit()
+
+    async with async_db_session() as session:
+        assert await PromptService.resolve_template(SYSTEM_KEY, USER_ID, session) == "旧版内容"
+
+        PromptService.invalidate_template_cache(USER_ID, SYSTEM_KEY)
+        assert await PromptService.resolve_template(SYSTEM_KEY, USER_ID, session) == "新版内容"
+
+
+async def test_user_wide_invalidation_clears_all_keys() -> None:
+    prompt_service._template_cache_put(USER_ID, "KEY_A", "内容A")
+    prompt_service._template_cache_put(USER_ID, "KEY_B", "内容B")
+    prompt_service._template_cache_put("user-other", "KEY_A", "他人内容")
+
+    PromptService.invalidate_template_cache(USER_ID)
+
+    assert (USER_ID, "KEY_A") not in _TEMPLATE_CACHE
+    assert (USER_ID, "KEY_B") not in _TEMPLATE_CACHE
+    assert ("user-other", "KEY_A") in _TEMPLATE_CACHE
+
+
+async def test_resolve_without_user_context_skips_cache_and_db(
+    async_db_session: async_sessionmaker[AsyncSession],
+) -> None:
+    async with async_db_session() as session:
+        counting = _CountingSession(session)
+
+        resolved = await PromptService.resolve_template(SYSTEM_KEY, None, counting)
+
+        assert resolved == PromptService._SYSTEM_TEMPLATES[SYSTEM_KEY]
+        assert counting.query_count == 0
+        assert not _TEMPLATE_CACHE
+
+
+async def test_save_endpoint_invalidates_cache(
+    async_db_session: async_sessionmaker[AsyncSession],
+) -> None:
+    """写端点落库后立即失效缓存，TTL内也不会读到保存前的旧模板"""
+    from app.api.prompt_templates import create_or_update_template
+    from app.schemas.prompt_template import PromptTemplateCreate
+
+    # 先解析一次，把系统默认以"无自定义"形式压进缓存
+    async with async_db_session() as session:
+        before = await PromptService.resolve_template(SYSTEM_KEY, USER_ID, session)
+        assert before == PromptService._SYSTEM_TEMPLATES[SYSTEM_KEY]
+
+    request = SimpleNamespace(state=SimpleNamespace(user_id=USER_ID))
+    async with async_db_session() as session:
+        _ = await create_or_update_template(
+            PromptTemplateCreate(
+                template_key=SYSTEM_KEY,
+                template_name="自定义模板",
+                template_content="端点保存的内容",
+            ),
+            request,
+            session,
+        )
+
+    async with async_db_session() as session:
+        assert (
+            await PromptService.resolve_template(SYSTEM_KEY, USER_ID, session)
+            == "端点保存的内容"
+        )